@@ -0,0 +1,371 @@
+# autodiff.py
+"""
+Mali simbolički sistem za automatsko računanje gradijenata funkcija cilja.
+
+Funkcija cilja se piše jednom, kao običan Python izraz nad x i y (uz `sin`,
+`cos`, `exp`, ... iz ovog modula). Izraz se prati (trace) u graf čvorova u
+kome su isti podizrazi isti čvor (hash-consing), gradijent se izvodi
+simbolički unazad (reverse mode), a zatim se generiše NumPy kod u kome se svaki
+zajednički podizraz računa samo jednom (eliminacija zajedničkih podizraza).
+Generisani gradijent upisuje rezultat u bafer koji prosledi pozivalac.
+"""
+import contextlib
+import itertools
+
+import numpy as np
+
+
+class Expr:
+    """Čvor simboličkog izraza. Čvorovi se ne prave direktno, već preko funkcija ovog modula."""
+    __slots__ = ('op', 'args', 'param', 'order')
+
+    # Sprečava NumPy da Expr tretira kao niz, pa np.float64 * Expr poziva Expr.__rmul__
+    __array_ufunc__ = None
+
+    def __init__(self, op, args, param, order):
+        self.op = op
+        self.args = args
+        self.param = param
+        self.order = order
+
+    def __add__(self, other): return add(self, other)
+    def __radd__(self, other): return add(other, self)
+    def __sub__(self, other): return sub(self, other)
+    def __rsub__(self, other): return sub(other, self)
+    def __mul__(self, other): return mul(self, other)
+    def __rmul__(self, other): return mul(other, self)
+    def __truediv__(self, other): return div(self, other)
+    def __rtruediv__(self, other): return div(other, self)
+    def __neg__(self): return neg(self)
+    def __pos__(self): return self
+
+    def __pow__(self, exponent):
+        if isinstance(exponent, Expr):
+            raise TypeError("Eksponent mora biti broj, a ne izraz.")
+        return power(self, exponent)
+
+    def __repr__(self):
+        if self.op == 'const':
+            return repr(self.param)
+        if self.op == 'var':
+            return self.param
+        return f"{self.op}({', '.join(map(repr, self.args))}{'' if self.param is None else f', {self.param}'})"
+
+
+# Tabela čvorova tekućeg prevođenja: isti (operacija, argumenti, parametar) uvek daje isti čvor
+_nodes = {}
+_counter = itertools.count()
+
+
+@contextlib.contextmanager
+def _compilation():
+    """Nova tabela čvorova za jedno prevođenje; posle njega se tabela oslobađa, pa ne raste."""
+    global _nodes
+    previous, _nodes = _nodes, {}
+    try:
+        yield
+    finally:
+        _nodes = previous
+
+
+def _node(op, args=(), param=None):
+    key = (op, args, param)
+    node = _nodes.get(key)
+    if node is None:
+        node = Expr(op, args, param, next(_counter))
+        _nodes[key] = node
+    return node
+
+
+def const(value):
+    return _node('const', (), float(value))
+
+
+def var(name):
+    return _node('var', (), name)
+
+
+def _wrap(value):
+    return value if isinstance(value, Expr) else const(value)
+
+
+def _is_const(node, value=None):
+    return node.op == 'const' and (value is None or node.param == value)
+
+
+def _sorted(a, b):
+    # Kanonski redosled argumenata komutativnih operacija (x*y i y*x su isti čvor)
+    return (a, b) if a.order <= b.order else (b, a)
+
+
+def add(a, b):
+    a, b = _wrap(a), _wrap(b)
+    if _is_const(a) and _is_const(b):
+        return const(a.param + b.param)
+    if _is_const(a, 0.0):
+        return b
+    if _is_const(b, 0.0):
+        return a
+    if b.op == 'neg':
+        return sub(a, b.args[0])
+    if a.op == 'neg':
+        return sub(b, a.args[0])
+    return _node('add', _sorted(a, b))
+
+
+def sub(a, b):
+    a, b = _wrap(a), _wrap(b)
+    if _is_const(a) and _is_const(b):
+        return const(a.param - b.param)
+    if a is b:
+        return const(0.0)
+    if _is_const(b, 0.0):
+        return a
+    if _is_const(a, 0.0):
+        return neg(b)
+    return _node('sub', (a, b))
+
+
+def mul(a, b):
+    a, b = _wrap(a), _wrap(b)
+    if _is_const(a) and _is_const(b):
+        return const(a.param * b.param)
+    for x, y in ((a, b), (b, a)):
+        if _is_const(x, 0.0):
+            return const(0.0)
+        if _is_const(x, 1.0):
+            return y
+        if _is_const(x, -1.0):
+            return neg(y)
+    return _node('mul', _sorted(a, b))
+
+
+def div(a, b):
+    a, b = _wrap(a), _wrap(b)
+    if _is_const(a) and _is_const(b):
+        return const(a.param / b.param)
+    if _is_const(a, 0.0):
+        return const(0.0)
+    if _is_const(b, 1.0):
+        return a
+    return _node('div', (a, b))
+
+
+def neg(a):
+    a = _wrap(a)
+    if _is_const(a):
+        return const(-a.param)
+    if a.op == 'neg':
+        return a.args[0]
+    return _node('neg', (a,))
+
+
+def power(a, exponent):
+    a, exponent = _wrap(a), float(exponent)
+    if exponent == 0.0:
+        return const(1.0)
+    if exponent == 1.0:
+        return a
+    if _is_const(a):
+        return const(a.param ** exponent)
+    return _node('pow', (a,), exponent)
+
+
+_UNARY = {
+    'sin': np.sin,
+    'cos': np.cos,
+    'exp': np.exp,
+    'log': np.log,
+    'sqrt': np.sqrt,
+    'tanh': np.tanh,
+}
+
+
+def _unary(op):
+    numpy_func = _UNARY[op]
+
+    def apply(a):
+        if not isinstance(a, Expr):
+            # Obična (NumPy) vrednost: funkcija cilja se može zvati i direktno
+            return numpy_func(a)
+        if _is_const(a):
+            return const(numpy_func(a.param))
+        return _node(op, (a,))
+
+    apply.__name__ = op
+    return apply
+
+
+sin = _unary('sin')
+cos = _unary('cos')
+exp = _unary('exp')
+log = _unary('log')
+sqrt = _unary('sqrt')
+tanh = _unary('tanh')
+
+
+def _partials(node):
+    """Parcijalni izvodi čvora po svakom argumentu, kao parovi (argument, izvod)."""
+    op, args = node.op, node.args
+    if op == 'add':
+        return ((args[0], const(1.0)), (args[1], const(1.0)))
+    if op == 'sub':
+        return ((args[0], const(1.0)), (args[1], const(-1.0)))
+    if op == 'mul':
+        return ((args[0], args[1]), (args[1], args[0]))
+    if op == 'div':
+        return ((args[0], div(1.0, args[1])), (args[1], neg(div(node, args[1]))))
+    if op == 'neg':
+        return ((args[0], const(-1.0)),)
+    if op == 'pow':
+        return ((args[0], mul(node.param, power(args[0], node.param - 1.0))),)
+    if op == 'sin':
+        return ((args[0], cos(args[0])),)
+    if op == 'cos':
+        return ((args[0], neg(sin(args[0]))),)
+    if op == 'exp':
+        return ((args[0], node),)
+    if op == 'log':
+        return ((args[0], div(1.0, args[0])),)
+    if op == 'sqrt':
+        return ((args[0], div(0.5, node)),)
+    if op == 'tanh':
+        return ((args[0], sub(1.0, mul(node, node))),)
+    return ()
+
+
+def _topological_order(outputs):
+    """Čvorovi dostižni iz izlaza, tako da je svaki čvor posle svojih argumenata."""
+    order, visited = [], set()
+    for output in outputs:
+        stack = [(output, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if expanded:
+                order.append(node)
+                continue
+            if id(node) in visited:
+                continue
+            visited.add(id(node))
+            stack.append((node, True))
+            stack.extend((arg, False) for arg in node.args if id(arg) not in visited)
+    return order
+
+
+def gradient(output, variables):
+    """Simbolički gradijent izraza `output` po listi promenljivih (reverse mode)."""
+    adjoints = {id(output): const(1.0)}
+    for node in reversed(_topological_order([output])):
+        adjoint = adjoints.get(id(node))
+        if adjoint is None:
+            continue
+        for arg, local in _partials(node):
+            contribution = mul(adjoint, local)
+            previous = adjoints.get(id(arg))
+            adjoints[id(arg)] = contribution if previous is None else add(previous, contribution)
+    return [adjoints.get(id(v), const(0.0)) for v in variables]
+
+
+_OPERATORS = {'add': '+', 'sub': '-', 'mul': '*', 'div': '/'}
+
+
+def generate_source(function_name, arg_names, outputs, out_name=None, return_first=True):
+    """
+    Generiše izvorni kod funkcije koja računa izlaze.
+
+    Svaki čvor koji se koristi više puta dobija svoju privremenu promenljivu
+    (računa se jednom); čvorovi korišćeni samo jednom se ugrađuju u izraz.
+    Ako je zadat `out_name`, izlazi posle prvog se upisuju u `out_name[i - 1]`,
+    a funkcija vraća prvi izlaz. Sa `return_first=False` svi izlazi se upisuju
+    u `out_name[i]` i funkcija vraća `out_name`.
+    """
+    order = _topological_order(outputs)
+    uses = {}
+    for node in order:
+        for arg in node.args:
+            uses[id(arg)] = uses.get(id(arg), 0) + 1
+    for output in outputs:
+        uses[id(output)] = uses.get(id(output), 0) + 2
+
+    params = list(arg_names) + ([out_name] if out_name else [])
+    lines = [f"def {function_name}({', '.join(params)}):"]
+    names = {}
+    temporaries = itertools.count()
+
+    def render(node):
+        if id(node) in names:
+            return names[id(node)]
+        if node.op == 'const':
+            return repr(node.param) if node.param >= 0 else f"({node.param!r})"
+        args = [render(arg) for arg in node.args]
+        if node.op in _OPERATORS:
+            return f"({args[0]} {_OPERATORS[node.op]} {args[1]})"
+        if node.op == 'neg':
+            return f"(-{args[0]})"
+        if node.op == 'pow':
+            exponent = int(node.param) if node.param.is_integer() else node.param
+            return f"({args[0]} ** {exponent})"
+        return f"np.{node.op}({args[0]})"
+
+    for node in order:
+        if node.op == 'var':
+            names[id(node)] = node.param
+        elif node.op != 'const' and uses.get(id(node), 0) > 1:
+            expression = render(node)
+            names[id(node)] = f"t{next(temporaries)}"
+            lines.append(f"    {names[id(node)]} = {expression}")
+
+    if out_name and not return_first:
+        for i, output in enumerate(outputs):
+            lines.append(f"    {out_name}[{i}] = {render(output)}")
+        lines.append(f"    return {out_name}")
+    else:
+        if out_name:
+            for i, output in enumerate(outputs[1:]):
+                lines.append(f"    {out_name}[{i}] = {render(output)}")
+        lines.append(f"    return {render(outputs[0])}")
+    return "\n".join(lines) + "\n"
+
+
+class CompiledObjective:
+    """
+    Generisane funkcije za vrednost i gradijent funkcije cilja.
+
+    Attributes:
+        func (callable): func(x, y) -> vrednost.
+        grad (callable): grad(x, y, out=None) -> niz oblika (2, ...); ako je zadat
+                         `out`, gradijent se upisuje u njega (bez alokacije rezultata).
+                         Vrednost funkcije se ovde ne računa.
+        value_and_grad (callable): value_and_grad(x, y, out=None) -> (vrednost, gradijent),
+                                   oba izračunata u jednom prolazu.
+        source (str): Generisani izvorni kod (za pregled i otklanjanje grešaka).
+    """
+    def __init__(self, expression, arg_names=('x', 'y'), name='objective'):
+        with _compilation():
+            variables = [var(n) for n in arg_names]
+            value = _wrap(expression(*variables))
+            grads = gradient(value, variables)
+            self.source = "\n".join([
+                generate_source('_value', arg_names, [value]),
+                generate_source('_value_and_grad', arg_names, [value] + grads, out_name='out'),
+                generate_source('_grad', arg_names, grads, out_name='out', return_first=False),
+            ])
+        namespace = {}
+        exec(compile(self.source, f"<autodiff:{name}>", 'exec'), {'np': np}, namespace)
+        self.func = namespace['_value']
+        kernel = namespace['_value_and_grad']
+        grad_kernel = namespace['_grad']
+        n_args = len(arg_names)
+
+        def value_and_grad(*args, out=None):
+            if out is None:
+                out = np.empty((n_args,) + np.broadcast(*args).shape)
+            return kernel(*args, out), out
+
+        def grad(*args, out=None):
+            if out is None:
+                out = np.empty((n_args,) + np.broadcast(*args).shape)
+            return grad_kernel(*args, out)
+
+        self.value_and_grad = value_and_grad
+        self.grad = grad
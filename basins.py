@@ -0,0 +1,142 @@
+# basins.py
+"""
+Mape oblasti privlačenja (basins of attraction): optimizator se pokreće iz
+svake ćelije guste mreže početnih tačaka i za svaku beleži kom minimumu je
+konvergirao, posle koliko iteracija, konačnu vrednost funkcije i da li je
+divergirao.
+
+Mreža se obrađuje u delovima od po `chunk_points` tačaka, kao paket (jedan
+NumPy izraz po koraku za ceo deo), uz čuvanje samo početne i krajnje tačke i
+rano zaustavljanje tačaka koje su konvergirale ili divergirale.
+"""
+import numpy as np
+
+from optimizers import get_optimizer_by_name
+from runner import optimize, make_initial_grid, StoppingCriteria, NON_FINITE, OUT_OF_BOUNDS, MAX_ITER
+
+# Oznake u mapi oblasti za tačke koje nisu završile ni u jednom poznatom minimumu
+OTHER, DIVERGED = -1, -2
+
+
+class BasinResult:
+    """
+    Rezultati za jednu kombinaciju optimizatora i hiperparametara, kao nizovi oblika (ny, nx).
+
+    Attributes:
+        basin (np.array): Indeks minimuma iz `objective.minima` u kome je tačka završila,
+                          OTHER (negde drugde) ili DIVERGED.
+        iterations (np.array): Broj iteracija do zaustavljanja (jednak `max_iterations` ako nije konvergirala).
+        converged (np.array): Da li je tačka zaustavljena nekim od kriterijuma konvergencije.
+        final_loss (np.array): Vrednost funkcije u krajnjoj tački (NaN za divergentne).
+        stop_codes (np.array): Kodovi razloga zaustavljanja (runner.STOP_REASONS).
+    """
+    def __init__(self, optimizer_name, hyperparams, bounds, max_iterations, basin, iterations, converged,
+                 final_loss, stop_codes):
+        self.optimizer_name = optimizer_name
+        self.hyperparams = hyperparams
+        self.bounds = bounds
+        self.max_iterations = max_iterations
+        self.basin = basin
+        self.iterations = iterations
+        self.converged = converged
+        self.final_loss = final_loss
+        self.stop_codes = stop_codes
+
+    @property
+    def diverged(self):
+        return self.basin == DIVERGED
+
+    def summary(self, minima=()):
+        """Kratak opis: udeo tačaka po minimumu, divergentnih i medijana iteracija do konvergencije."""
+        n = self.basin.size
+        parts = [f"minimum ({point[0]:.3g}, {point[1]:.3g}): {np.mean(self.basin == i):.1%}" for i, point in enumerate(minima)]
+        parts.append(f"ostalo: {np.mean(self.basin == OTHER):.1%}")
+        parts.append(f"divergiralo: {np.mean(self.basin == DIVERGED):.1%}")
+        converged = self.iterations[self.converged]
+        median = f"{np.median(converged):.0f}" if converged.size else "-"
+        return f"{n} tačaka, konvergiralo {self.converged.mean():.1%} (medijana {median} iteracija); " + ", ".join(parts)
+
+
+def assign_basins(points, minima, radius):
+    """Indeks najbližeg minimuma za svaku tačku, ili OTHER ako je najbliži dalje od `radius`."""
+    basin = np.full(len(points), OTHER, dtype=np.int8)
+    if len(minima) == 0:
+        return basin
+    distances = np.linalg.norm(points[:, None, :] - np.asarray(minima, dtype=float)[None], axis=-1)
+    nearest = np.argmin(distances, axis=1)
+    close = distances[np.arange(len(points)), nearest] <= radius
+    basin[close] = nearest[close]
+    return basin
+
+
+def run_basins(optimizer_name, objective, nx, ny, iterations, hyperparams, criteria=None, chunk_points=16384,
+               radius=None):
+    """
+    Pokreće optimizator iz svake tačke mreže nx x ny nad opsegom funkcije.
+
+    Args:
+        optimizer_name (str): Ime optimizatora.
+        objective (Objective): Funkcija cilja iz registra.
+        nx, ny (int): Dimenzije mreže početnih tačaka.
+        iterations (int): Najveći broj iteracija.
+        hyperparams (dict): Hiperparametri optimizatora (uključujući 'learning_rate').
+        criteria (StoppingCriteria): Kriterijumi konvergencije; podrazumevano grad_tol=1e-4.
+                                     Tačke koje napuste opseg se uvek smatraju divergentnim.
+        chunk_points (int): Broj početnih tačaka koje se optimizuju zajedno.
+        radius (float): Najveće rastojanje od minimuma da bi se tačka pripisala njemu
+                        (podrazumevano 2% manje stranice opsega).
+
+    Returns:
+        BasinResult: Rezultati oblika (ny, nx).
+    """
+    bounds = objective.bounds
+    if criteria is None:
+        criteria = StoppingCriteria(grad_tol=1e-4)
+    criteria = StoppingCriteria(grad_tol=criteria.grad_tol, step_tol=criteria.step_tol, f_tol=criteria.f_tol,
+                                f_min=criteria.f_min, bounds=bounds, check_every=criteria.check_every)
+    if radius is None:
+        radius = 0.02 * min(bounds[1] - bounds[0], bounds[3] - bounds[2])
+
+    hyperparams = dict(hyperparams)
+    learning_rate = hyperparams.pop('learning_rate')
+    starts = make_initial_grid(bounds, nx, ny)
+    n = len(starts)
+    basin = np.empty(n, dtype=np.int8)
+    stop_iterations = np.empty(n, dtype=np.int32)
+    stop_codes = np.empty(n, dtype=np.int8)
+    final_loss = np.empty(n, dtype=float)
+
+    for begin in range(0, n, chunk_points):
+        chunk = slice(begin, min(begin + chunk_points, n))
+        optimizer = get_optimizer_by_name(optimizer_name, learning_rate, **hyperparams)
+        result = optimize(optimizer, objective.grad, starts[chunk], iterations, record_every=None,
+                          criteria=criteria, func=objective.func)
+        final = result.history[-1]
+        diverged = np.isin(result.stop_codes, (NON_FINITE, OUT_OF_BOUNDS))
+        with np.errstate(all='ignore'):
+            loss = objective.value(final)
+        basin[chunk] = np.where(diverged, DIVERGED, assign_basins(final, objective.minima, radius))
+        stop_codes[chunk] = result.stop_codes
+        stop_iterations[chunk] = result.iterations
+        final_loss[chunk] = np.where(diverged, np.nan, loss)
+
+    shape = (ny, nx)
+    converged = (stop_codes != MAX_ITER) & (basin != DIVERGED)
+    return BasinResult(optimizer_name, {'learning_rate': learning_rate, **hyperparams}, bounds, iterations,
+                       basin.reshape(shape), stop_iterations.reshape(shape), converged.reshape(shape),
+                       final_loss.reshape(shape), stop_codes.reshape(shape))
+
+
+def save_basins(path, results):
+    """Čuva rezultate više kombinacija u jedan .npz fajl."""
+    np.savez_compressed(
+        path,
+        optimizer_names=np.array([r.optimizer_name for r in results]),
+        hyperparams=np.array([repr(r.hyperparams) for r in results]),
+        bounds=np.array(results[0].bounds, dtype=float),
+        basin=np.stack([r.basin for r in results]),
+        iterations=np.stack([r.iterations for r in results]),
+        converged=np.stack([r.converged for r in results]),
+        final_loss=np.stack([r.final_loss for r in results]),
+        stop_codes=np.stack([r.stop_codes for r in results]),
+    )
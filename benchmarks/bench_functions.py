@@ -0,0 +1,55 @@
+# benchmarks/bench_functions.py
+import numpy as np
+
+from functions import OBJECTIVES, evaluate_gradient
+from surface_cache import SurfaceCache
+from harness import measure, record
+
+RESOLUTIONS = [100, 200, 400, 800]
+QUICK_RESOLUTIONS = [100, 400]
+SURFACE_FUNCTIONS = ['beale', 'ackley']
+
+
+def bench_gradient(name, n_points, min_time):
+    """Broj izračunatih gradijenata u sekundi za paket od `n_points` tačaka."""
+    objective = OBJECTIVES[name]
+    xmin, xmax, ymin, ymax = objective.bounds
+    rng = np.random.default_rng(0)
+    points = np.column_stack([rng.uniform(xmin, xmax, n_points), rng.uniform(ymin, ymax, n_points)])
+    out = np.empty_like(points)
+    grad = objective.grad
+    grad(points[:1, 0], points[:1, 1])  # Generisanje koda gradijenta nije deo merenja
+
+    def run(number):
+        for _ in range(number):
+            evaluate_gradient(grad, points, out=out)
+
+    seconds, _ = measure(run, min_time=min_time)
+    return record(f"gradient/{name}/points={n_points}", n_points / seconds, 'tačaka/s',
+                  function=name, n_points=n_points)
+
+
+def bench_surface(name, resolution, min_time):
+    """Vreme računanja konturne mreže (bez keša) za datu rezoluciju."""
+    objective = OBJECTIVES[name]
+    func = objective.func
+    cache = SurfaceCache()
+
+    def run(number):
+        for _ in range(number):
+            cache.clear()
+            cache.get(func, objective.bounds, resolution, name=name)
+
+    seconds, _ = measure(run, min_time=min_time)
+    return record(f"surface/{name}/resolution={resolution}", seconds * 1e3, 'ms', higher_is_better=False,
+                  function=name, resolution=resolution)
+
+
+def run(quick=False):
+    min_time = 0.05 if quick else 0.2
+    n_points = 10000 if quick else 100000
+    results = [bench_gradient(name, n_points, min_time) for name in OBJECTIVES]
+    for name in SURFACE_FUNCTIONS:
+        for resolution in (QUICK_RESOLUTIONS if quick else RESOLUTIONS):
+            results.append(bench_surface(name, resolution, min_time))
+    return results
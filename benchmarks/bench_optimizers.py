@@ -0,0 +1,33 @@
+# benchmarks/bench_optimizers.py
+import numpy as np
+
+from optimizers import OPTIMIZERS, get_optimizer_by_name
+from harness import measure, record
+
+BATCH_SIZES = [1, 10, 100, 1000, 10000, 100000]
+QUICK_BATCH_SIZES = [1, 1000, 100000]
+
+
+def bench_optimizer_step(name, batch_size, min_time):
+    """Broj koraka u sekundi za jedan optimizator i paket od `batch_size` tačaka (gradijent je unapred zadat)."""
+    rng = np.random.default_rng(0)
+    shape = (2,) if batch_size == 1 else (batch_size, 2)
+    params = rng.uniform(-1, 1, shape)
+    gradient = 2 * params
+
+    def run(number):
+        optimizer = get_optimizer_by_name(name, 0.01)
+        optimizer.register_parameters(params, iterations=number)
+        for _ in range(number):
+            optimizer.step(gradient)
+
+    seconds, _ = measure(run, min_time=min_time)
+    return record(f"optimizer_step/{name}/batch={batch_size}", 1.0 / seconds, 'koraka/s',
+                  optimizer=name, batch_size=batch_size)
+
+
+def run(quick=False):
+    min_time = 0.05 if quick else 0.2
+    batch_sizes = QUICK_BATCH_SIZES if quick else BATCH_SIZES
+    return [bench_optimizer_step(name, batch_size, min_time)
+            for name in OPTIMIZERS for batch_size in batch_sizes]
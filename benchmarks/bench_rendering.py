@@ -0,0 +1,82 @@
+# benchmarks/bench_rendering.py
+import contextlib
+import io
+import os
+import tempfile
+
+import numpy as np
+
+from functions import get_objective
+from optimizers import get_optimizer_by_name
+from runner import optimize
+from visualizations import plot_optimization_path, create_animation
+from harness import measure, record
+
+FUNCTION_NAME = 'beale'
+INITIAL_POINT = [1.0, 1.0]
+ITERATIONS = 100
+
+
+def _paths(names, iterations):
+    objective = get_objective(FUNCTION_NAME)
+    paths = {}
+    for name in names:
+        optimizer = get_optimizer_by_name(name, 0.01)
+        paths[name] = optimize(optimizer, objective.grad, np.array(INITIAL_POINT), iterations).history
+    return paths
+
+
+def bench_optimize(iterations, min_time):
+    """Trajanje optimizacije jedne tačke (kao u tipičnom pokretanju main.py), radi poređenja sa crtanjem."""
+    objective = get_objective(FUNCTION_NAME)
+
+    def run(number):
+        for _ in range(number):
+            optimizer = get_optimizer_by_name('adam', 0.01)
+            optimize(optimizer, objective.grad, np.array(INITIAL_POINT), iterations)
+
+    seconds, _ = measure(run, min_time=min_time)
+    return record(f"pipeline/optimize/adam/iterations={iterations}", seconds * 1e3, 'ms', higher_is_better=False,
+                  iterations=iterations)
+
+
+def bench_png(output_dir, repeat):
+    """Broj PNG slika u sekundi (konturna mreža je već u kešu, meri se samo crtanje i čuvanje)."""
+    objective = get_objective(FUNCTION_NAME)
+    paths = _paths(['adam'], ITERATIONS)
+    output_file = os.path.join(output_dir, 'bench.png')
+
+    def run(number):
+        for _ in range(number):
+            plot_optimization_path(objective.func, paths, objective.bounds, 'benchmark', output_file,
+                                   levels=objective.levels, log_scale=objective.log_scale, minima=objective.minima)
+
+    seconds, _ = measure(run, number=1, repeat=repeat)
+    return record("render/png", 1.0 / seconds, 'frejmova/s')
+
+
+def bench_gif(output_dir, names, n_frames, repeat):
+    """Broj GIF frejmova u sekundi za animaciju `n_frames` frejmova (uključuje pripremu pozadine i kodiranje)."""
+    objective = get_objective(FUNCTION_NAME)
+    paths = _paths(names, n_frames - 1)
+    output_file = os.path.join(output_dir, 'bench.gif')
+
+    def run(number):
+        for _ in range(number):
+            create_animation(objective.func, paths, objective.bounds, 'benchmark', output_file, layout='grid',
+                             levels=objective.levels, log_scale=objective.log_scale, minima=objective.minima)
+
+    seconds, _ = measure(run, number=1, repeat=repeat)
+    return record(f"render/gif/optimizers={len(names)}", n_frames / seconds, 'frejmova/s',
+                  optimizers=len(names), n_frames=n_frames)
+
+
+def run(quick=False):
+    repeat = 1 if quick else 3
+    n_frames = 30 if quick else 100
+    results = [bench_optimize(ITERATIONS, 0.05 if quick else 0.2)]
+    with tempfile.TemporaryDirectory() as output_dir, contextlib.redirect_stdout(io.StringIO()):
+        results.append(bench_png(output_dir, repeat))
+        results.append(bench_gif(output_dir, ['adam'], n_frames, repeat))
+        results.append(bench_gif(output_dir, ['sgd', 'rmsprop', 'adam', 'nadam'], n_frames, repeat))
+    return results
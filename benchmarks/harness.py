@@ -0,0 +1,116 @@
+# benchmarks/harness.py
+import json
+import platform
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+
+
+def measure(run, number=None, min_time=0.2, repeat=3):
+    """
+    Meri trajanje jednog poziva `run(number)` koji izvršava `number` ponavljanja.
+
+    Ako `number` nije zadat, udvostručava se dok jedan poziv ne traje bar
+    `min_time` sekundi (kao `timeit`). Od `repeat` merenja uzima se najbrže,
+    jer su sporija merenja posledica smetnji (drugi procesi, GC), a ne koda.
+
+    Returns:
+        tuple: (najkraće trajanje jednog ponavljanja u sekundama, broj ponavljanja po merenju)
+    """
+    if number is None:
+        number = 1
+        while True:
+            start = time.perf_counter()
+            run(number)
+            if time.perf_counter() - start >= min_time or number >= 2**20:
+                break
+            number *= 2
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run(number)
+        best = min(best, time.perf_counter() - start)
+    return best / number, number
+
+
+def record(name, value, unit, higher_is_better=True, **params):
+    """Jedan rezultat merenja u obliku koji se čuva u JSON fajlu."""
+    return {'name': name, 'value': float(value), 'unit': unit,
+            'higher_is_better': higher_is_better, 'params': params}
+
+
+def environment():
+    """Podaci o okruženju u kome su merenja izvršena (radi poređenja sa baznim rezultatima)."""
+    import matplotlib
+    return {
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'matplotlib': matplotlib.__version__,
+        'machine': platform.machine(),
+        'processor': platform.processor() or platform.machine(),
+        'system': platform.system(),
+    }
+
+
+def save_results(path, results, quick=False):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'environment': environment(), 'quick': quick, 'results': results}, f, indent=2)
+
+
+def load_results(path):
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def compare_results(current, baseline, threshold=0.2):
+    """
+    Poredi rezultate sa baznim po imenu merenja.
+
+    Promena je regresija ako je protok manji (ili trajanje veće) za više od
+    `threshold` (relativno) u odnosu na bazne rezultate.
+
+    Returns:
+        list: Redovi (ime, bazna vrednost, trenutna vrednost, jedinica, relativna promena, status),
+              gde je relativna promena pozitivna kada je trenutni rezultat bolji.
+    """
+    baseline_by_name = {r['name']: r for r in baseline['results']}
+    rows = []
+    for result in current['results']:
+        base = baseline_by_name.pop(result['name'], None)
+        if base is None:
+            rows.append((result['name'], None, result['value'], result['unit'], None, 'novo'))
+            continue
+        if result['higher_is_better']:
+            change = result['value'] / base['value'] - 1.0
+        else:
+            change = base['value'] / result['value'] - 1.0
+        if change < -threshold:
+            status = 'REGRESIJA'
+        elif change > threshold:
+            status = 'poboljšanje'
+        else:
+            status = 'ok'
+        rows.append((result['name'], base['value'], result['value'], result['unit'], change, status))
+    for name, base in baseline_by_name.items():
+        rows.append((name, base['value'], None, base['unit'], None, 'nedostaje'))
+    return rows
+
+
+def format_value(value):
+    return '-' if value is None else f"{value:.4g}"
+
+
+def print_results(results):
+    width = max(len(r['name']) for r in results)
+    for r in results:
+        print(f"{r['name']:<{width}}  {format_value(r['value']):>12} {r['unit']}")
+
+
+def print_comparison(rows):
+    width = max(len(row[0]) for row in rows)
+    print(f"{'merenje':<{width}}  {'bazno':>12}  {'trenutno':>12}  {'promena':>9}  status")
+    for name, base, value, unit, change, status in rows:
+        change_text = '-' if change is None else f"{change:+.1%}"
+        print(f"{name:<{width}}  {format_value(base):>12}  {format_value(value):>12}  {change_text:>9}  {status}")
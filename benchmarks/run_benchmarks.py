@@ -0,0 +1,87 @@
+# benchmarks/run_benchmarks.py
+"""
+Merenje performansi: koraci optimizatora, računanje gradijenata, konturne
+mreže i renderovanje slika i animacija.
+
+Primeri:
+    python benchmarks/run_benchmarks.py run --output results/benchmarks.json
+    python benchmarks/run_benchmarks.py run --quick --suites optimizers --baseline bazni.json
+    python benchmarks/run_benchmarks.py compare results/benchmarks.json bazni.json
+"""
+import argparse
+import os
+import sys
+
+# Moduli projekta su u roditeljskom direktorijumu
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import matplotlib
+matplotlib.use('Agg')
+
+import bench_functions
+import bench_optimizers
+import bench_rendering
+from harness import save_results, load_results, compare_results, print_results, print_comparison
+
+SUITES = {
+    'optimizers': bench_optimizers,
+    'functions': bench_functions,
+    'rendering': bench_rendering,
+}
+
+
+def report_comparison(current, baseline_file, threshold):
+    """Ispisuje poređenje sa baznim rezultatima i vraća broj regresija."""
+    rows = compare_results(current, load_results(baseline_file), threshold)
+    print(f"\n--- Poređenje sa '{baseline_file}' (prag {threshold:.0%}) ---")
+    print_comparison(rows)
+    regressions = sum(1 for row in rows if row[5] == 'REGRESIJA')
+    print(f"Regresija: {regressions}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Merenje performansi optimizatora, funkcija i renderovanja.")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = subparsers.add_parser('run', help="Pokreće merenja i čuva rezultate u JSON fajl.")
+    run_parser.add_argument('--suites', nargs='+', choices=list(SUITES), default=list(SUITES),
+                            help="Grupe merenja koje se pokreću (podrazumevano sve).")
+    run_parser.add_argument('--quick', action='store_true', help="Manje veličina i kraća merenja (za brzu proveru).")
+    run_parser.add_argument('--output', default=os.path.join('results', 'benchmarks.json'),
+                            help="JSON fajl za rezultate.")
+    run_parser.add_argument('--baseline', default=None, help="Bazni JSON fajl sa kojim se porede novi rezultati.")
+    run_parser.add_argument('--threshold', type=float, default=0.2,
+                            help="Relativno pogoršanje iznad koga se promena smatra regresijom (podrazumevano 0.2).")
+
+    compare_parser = subparsers.add_parser('compare', help="Poredi dva sačuvana JSON fajla sa rezultatima.")
+    compare_parser.add_argument('current', help="JSON fajl sa novim rezultatima.")
+    compare_parser.add_argument('baseline', help="Bazni JSON fajl.")
+    compare_parser.add_argument('--threshold', type=float, default=0.2)
+
+    args = parser.parse_args()
+
+    if args.command == 'compare':
+        regressions = report_comparison(load_results(args.current), args.baseline, args.threshold)
+        sys.exit(1 if regressions else 0)
+
+    results = []
+    for name in args.suites:
+        print(f"--- Merenje: {name} ---")
+        suite_results = SUITES[name].run(quick=args.quick)
+        print_results(suite_results)
+        results.extend(suite_results)
+
+    output_dir = os.path.dirname(args.output)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    save_results(args.output, results, quick=args.quick)
+    print(f"Rezultati sačuvani u '{args.output}'")
+
+    if args.baseline:
+        regressions = report_comparison(load_results(args.output), args.baseline, args.threshold)
+        sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,373 @@
+# experiments.py
+"""
+Paketno izvršavanje eksperimenata opisanih u fajlu (TOML, JSON ili YAML).
+
+Fajl ima opcioni odeljak `defaults` i listu `experiments`; svaki eksperiment
+je jedna slika ili animacija (jedna funkcija, više optimizatora). Svi
+eksperimenti se izvršavaju u jednom procesu (ili u grupi procesa), pa se
+moduli uvoze jednom, konturne površine se računaju jednom po funkciji, a
+putanja koju traži više eksperimenata (isti optimizator, funkcija,
+hiperparametri i početna tačka) se računa samo jednom. Eksperiment čiji je
+izlazni fajl napravljen sa istom konfiguracijom (otisak u `.experiments.json`
+u izlaznom direktorijumu) i od tada nije menjan se preskače.
+
+Primer (TOML):
+
+    [defaults]
+    function = "beale"
+    initial_point = [1.0, 1.0]
+    iterations = 600
+
+    [[experiments]]
+    optimizers = ["sgd", "nadam"]
+    learning_rate = 0.002
+    output_file = "sgd_vs_nadam.gif"
+"""
+import hashlib
+import json
+import os
+
+import numpy as np
+
+from functions import get_objective
+from optimizers import get_optimizer_by_name
+from runner import optimize, StoppingCriteria
+from schedulers import make_schedule
+from result_store import ResultStore, run_config, config_key, recorded_steps, trajectory_traces
+
+DEFAULT_OUTPUT_DIR = "results"
+STATE_NAME = ".experiments.json"
+OUTPUT_EXTENSIONS = ('.png', '.gif', '.mp4')
+
+# Polja eksperimenta i njihove podrazumevane vrednosti (REQUIRED = polje je obavezno)
+REQUIRED = object()
+EXPERIMENT_FIELDS = {
+    'name': None,
+    'optimizers': REQUIRED,
+    'function': REQUIRED,
+    'initial_point': REQUIRED,
+    'output_file': REQUIRED,
+    'learning_rate': 0.01,
+    'iterations': 100,
+    'record_every': 1,
+    'beta1': 0.9,
+    'beta2': 0.999,
+    'hyperparams': {},
+    'lr_schedule': None,
+    'grad_tol': None,
+    'step_tol': None,
+    'f_tol': None,
+    'stop_out_of_bounds': False,
+    'stop_divergence': True,
+    'title': None,
+    'layout': 'grid',
+    'max_frames': None,
+    'fps': 15,
+}
+
+
+def _parse(path):
+    """Učitava fajl eksperimenata u rečnik; format se bira po ekstenziji."""
+    extension = os.path.splitext(path)[1].lower()
+    if extension == '.json':
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    if extension == '.toml':
+        import tomllib
+        with open(path, 'rb') as f:
+            return tomllib.load(f)
+    if extension in ('.yaml', '.yml'):
+        try:
+            import yaml
+        except ImportError:
+            raise ValueError("Za YAML fajlove eksperimenata potreban je paket PyYAML (pip install pyyaml).") from None
+        with open(path, encoding='utf-8') as f:
+            return yaml.safe_load(f) or {}
+    raise ValueError(f"Nepodržan format fajla '{path}' (podržano: .toml, .json, .yaml).")
+
+
+class Experiment:
+    """
+    Jedan eksperiment: putanje više optimizatora na jednoj funkciji, nacrtane u jedan fajl.
+
+    Args:
+        settings (dict): Vrednosti polja iz EXPERIMENT_FIELDS (nedostajuća dobijaju podrazumevane vrednosti).
+        output_dir (str): Direktorijum u koji se upisuje izlazni fajl.
+    """
+    def __init__(self, settings, output_dir=DEFAULT_OUTPUT_DIR):
+        unknown = sorted(set(settings) - set(EXPERIMENT_FIELDS))
+        if unknown:
+            raise ValueError(f"Nepoznata polja eksperimenta: {', '.join(unknown)}.")
+        for field, default in EXPERIMENT_FIELDS.items():
+            value = settings.get(field, default)
+            if value is REQUIRED:
+                raise ValueError(f"Eksperimentu '{settings.get('name') or settings.get('output_file')}' "
+                                 f"nedostaje polje '{field}'.")
+            setattr(self, field, value)
+        if isinstance(self.optimizers, str):
+            self.optimizers = [self.optimizers]
+        if not self.output_file.lower().endswith(OUTPUT_EXTENSIONS):
+            raise ValueError(f"Podržane ekstenzije za izlazni fajl su {', '.join(OUTPUT_EXTENSIONS)} "
+                             f"('{self.output_file}').")
+        self.name = self.name or os.path.splitext(os.path.basename(self.output_file))[0]
+        self.output_path = os.path.join(output_dir, self.output_file)
+        self.objective = get_objective(self.function)
+        self.initial_point = np.asarray(self.initial_point, dtype=float)
+        self.criteria = StoppingCriteria(grad_tol=self.grad_tol, step_tol=self.step_tol, f_tol=self.f_tol,
+                                         f_min=self.objective.f_min,
+                                         bounds=self.objective.bounds if self.stop_out_of_bounds else None,
+                                         detect_divergence=self.stop_divergence)
+        if not self.criteria.active:
+            self.criteria = None
+
+    @property
+    def optimizer_kwargs(self):
+        return {'learning_rate': self.learning_rate, 'beta1': self.beta1, 'beta2': self.beta2, **self.hyperparams}
+
+    def run_configs(self):
+        """Konfiguracija pokretanja (result_store.run_config) za svaki optimizator eksperimenta."""
+        return {name: run_config(name, self.objective, self.optimizer_kwargs, self.initial_point, self.iterations,
+                                 self.record_every or None, self.criteria, self.lr_schedule)
+                for name in self.optimizers}
+
+    def fingerprint(self):
+        """Heš svega što određuje izlazni fajl: pokretanja i podešavanja crtanja."""
+        description = {
+            'runs': {name: config_key(config) for name, config in self.run_configs().items()},
+            'render': [self.title, self.layout, self.max_frames, self.fps],
+        }
+        return hashlib.sha1(json.dumps(description, sort_keys=True).encode()).hexdigest()[:16]
+
+    def default_title(self):
+        title = f"Optimizatori na funkciji '{self.function}'\nLR={self.learning_rate}, Iteracije={self.iterations}"
+        if self.lr_schedule:
+            title += f", raspored {self.lr_schedule}"
+        return title
+
+
+def load_experiments(path, output_dir=None):
+    """
+    Učitava eksperimente iz fajla.
+
+    Args:
+        path (str): Fajl sa odeljkom `experiments` (lista) i opcionim `defaults` i `output_dir`.
+        output_dir (str): Izlazni direktorijum (None = `output_dir` iz fajla ili 'results').
+
+    Returns:
+        list: Lista Experiment objekata, u redosledu iz fajla.
+    """
+    document = _parse(path)
+    entries = document.get('experiments')
+    if not entries:
+        raise ValueError(f"Fajl '{path}' ne sadrži nijedan eksperiment (lista 'experiments').")
+    defaults = document.get('defaults', {})
+    output_dir = output_dir or document.get('output_dir', DEFAULT_OUTPUT_DIR)
+    experiments = [Experiment({**defaults, **entry}, output_dir) for entry in entries]
+
+    outputs = [experiment.output_path for experiment in experiments]
+    duplicates = sorted({output for output in outputs if outputs.count(output) > 1})
+    if duplicates:
+        raise ValueError(f"Više eksperimenata upisuje u isti fajl: {', '.join(duplicates)}.")
+    return experiments
+
+
+def _run_job(job):
+    """Računa jednu putanju (u tekućem ili radnom procesu)."""
+    optimizer_name, function_name, optimizer_kwargs, initial_point, iterations, record_every, criteria, schedule = job
+    objective = get_objective(function_name)
+    optimizer_kwargs = dict(optimizer_kwargs)
+    optimizer = get_optimizer_by_name(optimizer_name, optimizer_kwargs.pop('learning_rate'), **optimizer_kwargs)
+    if schedule:
+        optimizer.set_schedule(make_schedule(schedule, iterations))
+    result = optimize(optimizer, objective.grad, initial_point, iterations, record_every=record_every,
+                      criteria=criteria, func=objective.func)
+    return result.history, optimizer.history.steps, result.summary()
+
+
+def _file_state(path):
+    """Stanje fajla (vreme izmene, veličina, inode) ili None ako fajl ne postoji."""
+    if not os.path.exists(path):
+        return None
+    info = os.stat(path)
+    return info.st_mtime_ns, info.st_size, info.st_ino
+
+
+def _render_group(group):
+    """
+    Crta grupu izlaza iste funkcije, pa se njena konturna površina računa jednom po procesu.
+
+    Returns:
+        list: Za svaki izlaz opis greške ili None ako je fajl napravljen. Crtanje animacije
+              greške samo ispisuje, pa se uspeh proverava i po tome da li je fajl upisan.
+    """
+    # matplotlib se uvozi samo u procesima koji crtaju, ne i u onima koji računaju putanje
+    from visualizations import plot_optimization_path, create_animation
+    errors = []
+    for function_name, output_path, title, layout, max_frames, fps, paths, steps in group:
+        objective = get_objective(function_name)
+        os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
+        before = _file_state(output_path)
+        try:
+            if output_path.lower().endswith('.png'):
+                plot_optimization_path(objective.func, paths, objective.bounds, title, output_path,
+                                       levels=objective.levels, log_scale=objective.log_scale, minima=objective.minima)
+            else:
+                create_animation(objective.func, paths, objective.bounds, title, output_path, layout=layout,
+                                 max_frames=max_frames, fps=fps, levels=objective.levels,
+                                 log_scale=objective.log_scale, minima=objective.minima, steps=steps)
+        except Exception as error:
+            errors.append(f"{type(error).__name__}: {error}")
+            continue
+        after = _file_state(output_path)
+        errors.append("izlazni fajl nije upisan" if after is None or after == before else None)
+    return errors
+
+
+def _map(function, items, workers):
+    """Primenjuje funkciju na elemente u tekućem procesu ili u grupi procesa (redosled se čuva)."""
+    if workers <= 1 or len(items) <= 1:
+        return [function(item) for item in items]
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=min(workers, len(items))) as executor:
+        return list(executor.map(function, items))
+
+
+class ExperimentRunner:
+    """
+    Izvršava listu eksperimenata, deleći izračunate putanje između njih.
+
+    Putanje se pamte po ključu konfiguracije pokretanja (result_store.config_key),
+    pa dva eksperimenta sa istim pokretanjem koriste isti niz. Ako je zadato
+    skladište rezultata, putanje se prvo traže u njemu, a nove se u njega upisuju.
+
+    Args:
+        store (ResultStore): Skladište rezultata (None = putanje se pamte samo u memoriji).
+        workers (int): Broj procesa za računanje putanja i crtanje (1 = sve u tekućem procesu).
+        force (bool): Izvršava i eksperimente čiji su izlazi ažurni.
+    """
+    def __init__(self, store=None, workers=1, force=False):
+        self.store = store
+        self.workers = workers or os.cpu_count() or 1
+        self.force = force
+        self.trajectories = {}
+        self.steps = {}  # Ključ pokretanja -> redni brojevi zabeleženih koraka
+
+    def _state_path(self, experiment):
+        return os.path.join(os.path.dirname(experiment.output_path) or '.', STATE_NAME)
+
+    def _load_state(self, path):
+        if not os.path.exists(path):
+            return {}
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+
+    def is_up_to_date(self, experiment):
+        """Izlaz je ažuran ako postoji, napravljen je sa istim otiskom i od tada nije menjan."""
+        if self.force or not os.path.exists(experiment.output_path):
+            return False
+        entry = self._load_state(self._state_path(experiment)).get(os.path.basename(experiment.output_path))
+        return (entry is not None and entry['fingerprint'] == experiment.fingerprint()
+                and entry['mtime'] == os.path.getmtime(experiment.output_path))
+
+    def _mark_done(self, experiments):
+        by_state = {}
+        for experiment in experiments:
+            by_state.setdefault(self._state_path(experiment), []).append(experiment)
+        for path, group in by_state.items():
+            state = self._load_state(path)
+            for experiment in group:
+                state[os.path.basename(experiment.output_path)] = {
+                    'name': experiment.name,
+                    'fingerprint': experiment.fingerprint(),
+                    'mtime': os.path.getmtime(experiment.output_path),
+                }
+            temporary = path + '.tmp'
+            with open(temporary, 'w', encoding='utf-8') as f:
+                json.dump(state, f, indent=1)
+            os.replace(temporary, path)
+
+    def compute_trajectories(self, experiments):
+        """Računa (ili učitava iz skladišta) sve različite putanje potrebne eksperimentima."""
+        jobs = {}
+        for experiment in experiments:
+            for name, config in experiment.run_configs().items():
+                key = config_key(config)
+                if key in self.trajectories or key in jobs:
+                    continue
+                stored = self.store.get(key) if self.store is not None else None
+                if stored is not None:
+                    self.trajectories[key] = stored.path
+                    self.steps[key] = stored.steps
+                    continue
+                jobs[key] = (experiment, name, config)
+
+        # Poslovi sadrže samo imena i nizove, jer se šalju radnim procesima
+        job_args = [(name, experiment.function, experiment.optimizer_kwargs, experiment.initial_point,
+                     experiment.iterations, experiment.record_every or None, experiment.criteria, experiment.lr_schedule)
+                    for experiment, name, _ in jobs.values()]
+        results = _map(_run_job, job_args, self.workers)
+
+        for (key, (experiment, name, config)), (history, total_steps, summary) in zip(jobs.items(), results):
+            print(f"  {name.upper()} na '{experiment.function}' ({key}): {summary}")
+            steps = recorded_steps(len(history), experiment.record_every or None, total_steps)
+            self.trajectories[key] = history
+            self.steps[key] = steps
+            if self.store is not None:
+                loss, grad_norm = trajectory_traces(experiment.objective, history)
+                self.store.put(key, config, {'path': history, 'steps': steps, 'loss': loss, 'grad_norm': grad_norm},
+                               summary=summary)
+        return len(jobs)
+
+    def run(self, experiments):
+        """
+        Izvršava eksperimente čiji izlazi nisu ažurni.
+
+        Returns:
+            tuple: (izvršeni, preskočeni i neuspešni eksperimenti)
+        """
+        pending = [experiment for experiment in experiments if not self.is_up_to_date(experiment)]
+        skipped = [experiment for experiment in experiments if experiment not in pending]
+        for experiment in skipped:
+            print(f"Preskačem '{experiment.name}': {experiment.output_path} je ažuran.")
+        if not pending:
+            return [], skipped, []
+
+        print(f"--- Računam putanje za {len(pending)} eksperimenata ---")
+        computed = self.compute_trajectories(pending)
+        requested = sum(len(experiment.optimizers) for experiment in pending)
+        print(f"Izračunato {computed} putanja (od {requested} traženih, ostale su deljene ili učitane).")
+
+        # Eksperimenti iste funkcije se crtaju zajedno, da bi delili konturnu površinu
+        groups = {}
+        for experiment in pending:
+            keys = {name: config_key(config) for name, config in experiment.run_configs().items()}
+            groups.setdefault(experiment.function, []).append(
+                (experiment.function, experiment.output_path, experiment.title or experiment.default_title(),
+                 experiment.layout, experiment.max_frames, experiment.fps,
+                 {name: self.trajectories[key] for name, key in keys.items()},
+                 {name: self.steps[key] for name, key in keys.items()}))
+
+        print(f"--- Crtam {len(pending)} izlaza ---")
+        groups = list(groups.values())
+        errors = {output_path: error for group, group_errors in zip(groups, _map(_render_group, groups, self.workers))
+                  for (_, output_path, *_), error in zip(group, group_errors)}
+        done, failed = [], []
+        for experiment in pending:
+            error = errors[experiment.output_path]
+            if error is None:
+                print(f"Sačuvano: {experiment.output_path}")
+                done.append(experiment)
+            else:
+                print(f"Neuspešno: '{experiment.name}' ({experiment.output_path}): {error}")
+                failed.append(experiment)
+
+        if done:
+            self._mark_done(done)
+        return done, skipped, failed
+
+
+def run_experiments(path, output_dir=None, store_dir=None, workers=1, force=False):
+    """Učitava eksperimente iz fajla i izvršava one čiji izlazi nisu ažurni."""
+    experiments = load_experiments(path, output_dir)
+    store = ResultStore(store_dir) if store_dir else None
+    return ExperimentRunner(store, workers, force).run(experiments)
@@ -1,31 +1,185 @@
 import numpy as np
 
-# Definišemo rečnik koji će mapirati imena funkcija sa samim funkcijama i njihovim gradijentima
+import autodiff as ad
+from autodiff import CompiledObjective
+
+# Podrazumevani nivoi kontura (log skala), pogodni za nenegativne funkcije sa velikim opsegom
+DEFAULT_LEVELS = np.logspace(0, 5, 35)
+
+
+def shifted_levels(f_min, f_max, n=35):
+    """Nivoi zgusnuti oko minimuma: f_min + geometrijski niz do f_max (radi i za negativne vrednosti)."""
+    return f_min + np.geomspace(1e-2, f_max - f_min, n)
+
+
+class Objective:
+    """
+    Funkcija cilja iz registra: izraz se zadaje jednom, a vrednost i gradijent
+    se generišu automatski (modul `autodiff`) pri prvom korišćenju.
+
+    Attributes:
+        bounds (list): Preporučeni opseg [xmin, xmax, ymin, ymax].
+        f_min (float): Vrednost globalnog minimuma (None ako funkcija nije ograničena odozdo).
+        minima (list): Tačke globalnih minimuma.
+        levels (np.array): Nivoi kontura za crtanje.
+        log_scale (bool): Da li se konture boje na log skali (samo za pozitivne nivoe).
+    """
+    def __init__(self, name, expression, bounds, f_min=None, minima=(), levels=None, log_scale=True):
+        self.name = name
+        self.expression = expression
+        self.bounds = bounds # [xmin, xmax, ymin, ymax]
+        self.f_min = f_min
+        self.minima = [tuple(point) for point in minima]
+        self.levels = DEFAULT_LEVELS if levels is None else np.asarray(levels, dtype=float)
+        self.log_scale = log_scale
+        self._compiled = None
+
+    @property
+    def compiled(self):
+        if self._compiled is None:
+            self._compiled = CompiledObjective(self.expression, name=self.name)
+        return self._compiled
+
+    @property
+    def func(self):
+        """func(x, y) -> vrednost funkcije."""
+        return self.compiled.func
+
+    @property
+    def grad(self):
+        """grad(x, y, out=None) -> gradijent oblika (2, ...)."""
+        return self.compiled.grad
+
+    def value(self, points):
+        """Vrednost funkcije za tačke oblika (..., 2)."""
+        return self.compiled.func(points[..., 0], points[..., 1])
+
+    def value_and_grad(self, points, out=None):
+        """
+        Vrednost i gradijent za tačke oblika (..., 2) u jednom prolazu.
+
+        Ako je zadat `out` (istog oblika kao `points`), gradijent se upisuje u njega.
+        """
+        if out is None:
+            out = np.empty(np.shape(points))
+        value, _ = self.compiled.value_and_grad(points[..., 0], points[..., 1], out=np.moveaxis(out, -1, 0))
+        return value, out
+
+
+# Registar funkcija cilja: ime -> Objective
+OBJECTIVES = {}
+
+
+def objective(name, bounds, f_min=None, minima=(), levels=None, log_scale=True):
+    """Dekorator koji dodaje funkciju cilja (izraz nad x i y) u registar."""
+    def register(expression):
+        OBJECTIVES[name] = Objective(name, expression, bounds, f_min, minima, levels, log_scale)
+        return expression
+    return register
+
+
+@objective('quadratic', bounds=[-10, 10, -10, 10], f_min=0.0, minima=[(0, 0)])
+def quadratic(x, y):
+    return x**2 + y**2
+
+
+@objective('booth', bounds=[-10, 10, -10, 10], f_min=0.0, minima=[(1, 3)])
+def booth(x, y):
+    # Booth funkcija, minimum u (1,3)
+    return (x + 2*y - 7)**2 + (2*x + y - 5)**2
+
+
+@objective('beale', bounds=[-4.5, 4.5, -4.5, 4.5], f_min=0.0, minima=[(3, 0.5)])
+def beale(x, y):
+    # Beale funkcija, kompleksnija, minimum u (3, 0.5)
+    return (1.5 - x + x*y)**2 + (2.25 - x + x*y**2)**2 + (2.625 - x + x*y**3)**2
+
+
+@objective('rosenbrock', bounds=[-2, 2, -1, 3], f_min=0.0, minima=[(1, 1)],
+           levels=np.logspace(-2, 3.5, 35))
+def rosenbrock(x, y):
+    # Rosenbrock funkcija: uska zakrivljena dolina, minimum u (1, 1)
+    return (1 - x)**2 + 100*(y - x**2)**2
+
+
+@objective('himmelblau', bounds=[-5, 5, -5, 5], f_min=0.0,
+           minima=[(3.0, 2.0), (-2.805118, 3.131312), (-3.779310, -3.283186), (3.584428, -1.848126)],
+           levels=np.logspace(-1, 3, 35))
+def himmelblau(x, y):
+    # Himmelblau funkcija: četiri jednaka globalna minimuma
+    return (x**2 + y - 11)**2 + (x + y**2 - 7)**2
+
+
+@objective('rastrigin', bounds=[-5.12, 5.12, -5.12, 5.12], f_min=0.0, minima=[(0, 0)],
+           levels=shifted_levels(0.0, 80.0), log_scale=False)
+def rastrigin(x, y):
+    # Rastrigin funkcija: mnoštvo pravilno raspoređenih lokalnih minimuma, globalni u (0, 0)
+    return 20 + x**2 - 10*ad.cos(2*np.pi*x) + y**2 - 10*ad.cos(2*np.pi*y)
+
+
+@objective('ackley', bounds=[-5, 5, -5, 5], f_min=0.0, minima=[(0, 0)],
+           levels=shifted_levels(0.0, 15.0), log_scale=False)
+def ackley(x, y):
+    # Ackley funkcija: skoro ravna spoljašnjost i uzak levak oko (0, 0);
+    # gradijent nije definisan tačno u minimumu
+    return (-20*ad.exp(-0.2*ad.sqrt(0.5*(x**2 + y**2)))
+            - ad.exp(0.5*(ad.cos(2*np.pi*x) + ad.cos(2*np.pi*y))) + np.e + 20)
+
+
+@objective('styblinski_tang', bounds=[-5, 5, -5, 5], f_min=-78.33233140754282,
+           minima=[(-2.903534, -2.903534)], levels=shifted_levels(-78.33233140754282, 250.0), log_scale=False)
+def styblinski_tang(x, y):
+    # Styblinski-Tang funkcija: negativne vrednosti, četiri lokalna minimuma, globalni u (-2.9035, -2.9035)
+    return 0.5*(x**4 - 16*x**2 + 5*x + y**4 - 16*y**2 + 5*y)
+
+
+@objective('six_hump_camel', bounds=[-3, 3, -2, 2], f_min=-1.0316284534898774,
+           minima=[(0.08984201, -0.71265640), (-0.08984201, 0.71265640)],
+           levels=shifted_levels(-1.0316284534898774, 160.0), log_scale=False)
+def six_hump_camel(x, y):
+    # Six-Hump Camel funkcija: šest lokalnih minimuma, dva globalna
+    return (4 - 2.1*x**2 + x**4/3)*x**2 + x*y + (-4 + 4*y**2)*y**2
+
+
+@objective('goldstein_price', bounds=[-2, 2, -2, 2], f_min=3.0, minima=[(0, -1)],
+           levels=np.logspace(np.log10(3), 6, 35))
+def goldstein_price(x, y):
+    # Goldstein-Price funkcija: vrednosti u rasponu od nekoliko redova veličine, minimum 3 u (0, -1)
+    return ((1 + (x + y + 1)**2*(19 - 14*x + 3*x**2 - 14*y + 6*x*y + 3*y**2))
+            * (30 + (2*x - 3*y)**2*(18 - 32*x + 12*x**2 + 48*y - 36*x*y + 27*y**2)))
+
+
+@objective('saddle', bounds=[-2, 2, -2, 2], levels=np.linspace(-4, 4, 35), log_scale=False)
+def saddle(x, y):
+    # Sedlasta tačka u (0, 0); funkcija nije ograničena odozdo (nema minimuma)
+    return x**2 - y**2
+
+
+def get_objective(name):
+    """Vraća funkciju cilja iz registra."""
+    if name not in OBJECTIVES:
+        raise ValueError(f"Funkcija '{name}' nije definisana.")
+    return OBJECTIVES[name]
+
+
 def get_function_by_name(name):
     """Vraća funkciju, njen gradijent i preporučeni opseg za crtanje."""
-    if name == 'quadratic':
-        func = lambda x, y: x**2 + y**2
-        grad = lambda x, y: np.array([2*x, 2*y])
-        bounds = [-10, 10, -10, 10] # [xmin, xmax, ymin, ymax]
-        return func, grad, bounds
-    
-    elif name == 'booth':
-        # Booth funkcija, minimum u (1,3)
-        func = lambda x, y: (x + 2*y - 7)**2 + (2*x + y - 5)**2
-        grad = lambda x, y: np.array([2*(x + 2*y - 7) + 2*(2*x + y - 5)*2, 
-                                      2*(x + 2*y - 7)*2 + 2*(2*x + y - 5)])
-        bounds = [-10, 10, -10, 10]
-        return func, grad, bounds
-        
-    elif name == 'beale':
-        # Beale funkcija, kompleksnija, minimum u (3, 0.5)
-        func = lambda x, y: (1.5 - x + x*y)**2 + (2.25 - x + x*y**2)**2 + (2.625 - x + x*y**3)**2
-        grad = lambda x, y: np.array([
-            2*(1.5 - x + x*y)*(-1 + y) + 2*(2.25 - x + x*y**2)*(-1 + y**2) + 2*(2.625 - x + x*y**3)*(-1 + y**3),
-            2*(1.5 - x + x*y)*x + 2*(2.25 - x + x*y**2)*(2*x*y) + 2*(2.625 - x + x*y**3)*(3*x*y**2)
-        ])
-        bounds = [-4.5, 4.5, -4.5, 4.5]
-        return func, grad, bounds
-        
-    else:
-        raise ValueError(f"Funkcija '{name}' nije definisana.")
\ No newline at end of file
+    obj = get_objective(name)
+    return obj.func, obj.grad, obj.bounds
+
+
+def evaluate_gradient(grad, params, out=None):
+    """
+    Računa gradijent za jednu tačku oblika (2,) ili paket tačaka oblika (N, 2).
+
+    Funkcije iznad su vektorizovane, pa se ceo paket računa jednim pozivom;
+    rezultat se vraća u istom obliku kao i `params`. Ako je zadat `out`
+    (istog oblika kao `params`), gradijent se upisuje u njega.
+    """
+    if params.ndim == 1:
+        # Jedna tačka: koordinate kao skalari, jer su operacije nad nizovima oblika () višestruko sporije
+        return grad(params[0], params[1], out=np.empty(2) if out is None else out)
+    if out is None:
+        return np.moveaxis(grad(params[..., 0], params[..., 1]), 0, -1)
+    grad(params[..., 0], params[..., 1], out=np.moveaxis(out, -1, 0))
+    return out
@@ -0,0 +1,374 @@
+# highdim.py
+"""
+Optimizacija u više dimenzija (n do 1e4-1e6) i prikaz putanje u 2D.
+
+Funkcije cilja ovde primaju ravan vektor parametara oblika (n,), a gradijent
+upisuju u bafer pozivaoca uz unapred alocirane pomoćne nizove, pa jedan poziv
+ne pravi privremene nizove dužine n. Putanja se ne čuva: svaka zabeležena
+tačka se odmah projektuje u 2D (`RandomSliceProjection`, `SketchPCAProjection`),
+pa memorija ne zavisi od broja iteracija.
+"""
+import numpy as np
+
+from runner import STOP_REASONS, MAX_ITER, GRAD_TOL, NON_FINITE
+
+# Najveći broj elemenata (tačke x dimenzija) koji se odjednom računa pri crtanju preseka;
+# deo od 8 MB ostaje u kešu, pa je računanje višestruko brže nego u velikim delovima
+SURFACE_CHUNK_ELEMENTS = 2**20
+
+
+class RosenbrockND:
+    """
+    Rosenbrock funkcija u n dimenzija: sum 100 (x[i+1] - x[i]^2)^2 + (1 - x[i])^2.
+
+    Minimum je 0 u tački (1, ..., 1); klasična početna tačka je (-1.2, 1, -1.2, 1, ...).
+    """
+    name = 'rosenbrock_nd'
+    options = ()
+
+    def __init__(self, dim):
+        if dim < 2:
+            raise ValueError("Rosenbrock funkcija zahteva najmanje 2 dimenzije.")
+        self.dim = dim
+        self.f_min = 0.0
+        self.minimizer = np.ones(dim)
+        self._d = np.empty(dim - 1)
+        self._t = np.empty(dim - 1)
+
+    def initial_point(self):
+        point = np.ones(self.dim)
+        point[::2] = -1.2
+        return point
+
+    def value(self, points):
+        """Vrednost funkcije za tačke oblika (..., n)."""
+        head = points[..., :-1]
+        return np.sum(100 * (points[..., 1:] - head**2)**2 + (1 - head)**2, axis=-1)
+
+    def value_and_grad(self, x, out):
+        """Vrednost i gradijent u tački oblika (n,); gradijent se upisuje u `out`."""
+        d, t = self._d, self._t
+        np.square(x[:-1], out=t)
+        np.subtract(x[1:], t, out=d)           # d = x[i+1] - x[i]^2
+        np.subtract(1, x[:-1], out=t)          # t = 1 - x[i]
+        value = 100 * np.dot(d, d) + np.dot(t, t)
+        np.multiply(x[:-1], d, out=out[:-1])
+        out[:-1] *= -400
+        t *= 2
+        out[:-1] -= t
+        out[-1] = 0
+        d *= 200
+        out[1:] += d
+        return value, out
+
+
+class IllConditionedQuadratic:
+    """
+    Loše uslovljena kvadratna funkcija 0.5 (x - x*)^T A (x - x*) sa zadatim spektrom.
+
+    A = Q diag(lambda) Q, gde je Q Householder-ova refleksija I - 2 v v^T za
+    slučajan jedinični vektor v, pa osa funkcije nije poravnata sa koordinatama,
+    a primena A košta O(n). Minimum je 0 u tački x* = (1, ..., 1).
+
+    Args:
+        dim (int): Broj dimenzija.
+        condition (float): Uslovljenost (odnos najveće i najmanje sopstvene vrednosti).
+        spectrum (str): Raspored sopstvenih vrednosti od 1 do `condition`: 'geometric',
+                        'linear' ili 'clustered' (polovina 1, polovina `condition`).
+        seed (int): Seme za vektor refleksije.
+    """
+    name = 'quadratic_nd'
+    options = ('condition', 'spectrum', 'seed')
+    spectra = ('geometric', 'linear', 'clustered')
+
+    def __init__(self, dim, condition=1e3, spectrum='geometric', seed=0):
+        if spectrum == 'geometric':
+            self.eigenvalues = np.geomspace(1, condition, dim)
+        elif spectrum == 'linear':
+            self.eigenvalues = np.linspace(1, condition, dim)
+        elif spectrum == 'clustered':
+            self.eigenvalues = np.where(np.arange(dim) < dim // 2, 1.0, float(condition))
+        else:
+            raise ValueError(f"Nepoznat spektar '{spectrum}' (podržano: {', '.join(self.spectra)}).")
+        self.dim = dim
+        self.f_min = 0.0
+        self.minimizer = np.ones(dim)
+        v = np.random.default_rng(seed).standard_normal(dim)
+        self.v = v / np.linalg.norm(v)
+        self._y = np.empty(dim)
+        self._s = np.empty(dim)
+
+    def initial_point(self):
+        return np.zeros(self.dim)
+
+    def value(self, points):
+        y = points - self.minimizer
+        y = y - 2 * (y @ self.v)[..., None] * self.v
+        return 0.5 * np.sum(self.eigenvalues * y * y, axis=-1)
+
+    def value_and_grad(self, x, out):
+        y, s = self._y, self._s
+        np.subtract(x, self.minimizer, out=y)
+        np.multiply(self.v, 2 * np.dot(y, self.v), out=s)
+        y -= s                                   # y = Q (x - x*)
+        np.multiply(self.eigenvalues, y, out=out)
+        value = 0.5 * np.dot(out, y)
+        np.multiply(self.v, 2 * np.dot(out, self.v), out=s)
+        out -= s                                 # gradijent = Q diag(lambda) Q (x - x*)
+        return value, out
+
+
+class LogisticRegression:
+    """
+    Prosečna logistička greška sa L2 regularizacijom na sintetičkim podacima.
+
+    Podaci (`samples` x n, normalna raspodela) i oznake iz slučajnog "pravog"
+    vektora težina se generišu jednom, iz semena; matrica zauzima
+    samples * n * 8 bajtova. Minimum nije poznat unapred.
+
+    Args:
+        dim (int): Broj težina (dimenzija).
+        samples (int): Broj primera.
+        l2 (float): Koeficijent L2 regularizacije.
+        seed (int): Seme za podatke.
+    """
+    name = 'logistic'
+    options = ('samples', 'l2', 'seed')
+
+    def __init__(self, dim, samples=500, l2=1e-3, seed=0):
+        rng = np.random.default_rng(seed)
+        self.dim = dim
+        self.f_min = None
+        self.minimizer = None
+        self.l2 = l2
+        self.features = rng.standard_normal((samples, dim))
+        true_weights = rng.standard_normal(dim) / np.sqrt(dim)
+        noise = 0.5 * rng.standard_normal(samples)
+        # Znak oznake (+1/-1) za svaki primer
+        self.signs = np.where(self.features @ true_weights + noise > 0, 1.0, -1.0)
+        self._margins = np.empty(samples)
+        self._s = np.empty(dim)
+
+    def initial_point(self):
+        return np.zeros(self.dim)
+
+    def value(self, points):
+        margins = self.signs * (points @ self.features.T)
+        return np.mean(np.logaddexp(0, -margins), axis=-1) + 0.5 * self.l2 * np.sum(points * points, axis=-1)
+
+    def value_and_grad(self, x, out):
+        margins = self._margins
+        np.dot(self.features, x, out=margins)
+        margins *= self.signs
+        losses = np.logaddexp(0, -margins)
+        value = np.mean(losses) + 0.5 * self.l2 * np.dot(x, x)
+        # d/dz log(1 + e^-sz) = -s * sigmoid(-sz) = -s * exp(-log(1 + e^sz))
+        weights = -self.signs * np.exp(-np.logaddexp(0, margins)) / len(margins)
+        np.dot(weights, self.features, out=out)
+        np.multiply(x, self.l2, out=self._s)
+        out += self._s
+        return value, out
+
+
+# Registar funkcija cilja u više dimenzija: ime -> klasa
+HIGHDIM_OBJECTIVES = {cls.name: cls for cls in (RosenbrockND, IllConditionedQuadratic, LogisticRegression)}
+
+
+def make_highdim_objective(name, dim, **options):
+    """Pravi funkciju cilja iz registra; opcije koje klasa ne prima se zanemaruju."""
+    if name not in HIGHDIM_OBJECTIVES:
+        raise ValueError(f"Funkcija '{name}' nije definisana (podržano: {', '.join(HIGHDIM_OBJECTIVES)}).")
+    cls = HIGHDIM_OBJECTIVES[name]
+    return cls(dim, **{k: v for k, v in options.items() if k in cls.options and v is not None})
+
+
+class FlatRunResult:
+    """Rezultat jednog pokretanja u više dimenzija (bez putanje)."""
+    def __init__(self, losses, grad_norms, stop_code, iterations, final_point):
+        self.losses = losses           # (T + 1,) vrednost funkcije u tačkama x_0 ... x_T
+        self.grad_norms = grad_norms   # (T,) norma gradijenta pre svakog koraka
+        self.stop_code = stop_code
+        self.iterations = iterations
+        self.final_point = final_point
+
+    @property
+    def stop_reason(self):
+        return STOP_REASONS[self.stop_code]
+
+    def summary(self):
+        return (f"zaustavljen posle {self.iterations} iteracija ({self.stop_reason}), "
+                f"f={self.losses[-1]:.4g}")
+
+
+def run_flat(optimizer, objective, initial_point, iterations, grad_tol=None, record_every=1, observe=None):
+    """
+    Pokreće optimizator nad ravnim vektorom parametara.
+
+    Args:
+        optimizer (BaseOptimizer): Instanca optimizatora.
+        objective: Funkcija cilja iz HIGHDIM_OBJECTIVES.
+        initial_point (np.array): Početna tačka oblika (n,).
+        iterations (int): Najveći broj iteracija.
+        grad_tol (float): Zaustavlja optimizaciju kada je norma gradijenta manja od praga.
+        record_every (int): `observe` se poziva za svaki k-ti korak (i uvek za početnu i poslednju tačku).
+        observe (callable): Prima praćenu tačku (npr. `projection.observe`); tačka je pogled
+                            koji važi samo do sledećeg koraka.
+
+    Returns:
+        FlatRunResult: Vrednosti funkcije, norme gradijenta i razlog zaustavljanja.
+    """
+    optimizer.register_parameters(initial_point, iterations=iterations, record_every=None)
+    gradient = np.empty_like(optimizer.params)
+    losses = np.empty(iterations + 1)
+    grad_norms = np.empty(iterations)
+    if observe is not None:
+        observe(optimizer.history.latest())
+
+    stop_code, t, last_observed = MAX_ITER, 0, 0
+    for t in range(iterations):
+        losses[t], _ = objective.value_and_grad(optimizer.params, gradient)
+        grad_norms[t] = np.sqrt(np.dot(gradient, gradient))
+        if not (np.isfinite(losses[t]) and np.isfinite(grad_norms[t])):
+            stop_code = NON_FINITE
+            break
+        if grad_tol is not None and grad_norms[t] < grad_tol:
+            stop_code = GRAD_TOL
+            break
+        optimizer.step(gradient)
+        if observe is not None and (t + 1) % record_every == 0:
+            observe(optimizer.history.latest())
+            last_observed = t + 1
+    else:
+        t = iterations
+        losses[t], _ = objective.value_and_grad(optimizer.params, gradient)
+
+    if observe is not None and last_observed != t:
+        observe(optimizer.history.latest())
+    return FlatRunResult(losses[:t + 1], grad_norms[:t], stop_code, t, optimizer.history.latest().copy())
+
+
+class RandomSliceProjection:
+    """
+    Projekcija na ravan kroz rešenje: prva osa ide od rešenja ka početnoj tački,
+    a druga je slučajan pravac normalan na nju. Ako rešenje nije poznato, ravan
+    prolazi kroz početnu tačku, a prva osa je pravac najbržeg spusta u njoj.
+
+    Koordinate tačke su skalarni proizvodi sa osama (dva prolaza kroz vektor
+    dužine n, bez privremenih nizova), a presek funkcije na ravni se računa
+    tek pri crtanju, nad opsegom zabeleženih koordinata.
+    """
+    axis_labels = ('Pravac ka početnoj tački', 'Slučajan pravac')
+
+    def __init__(self, objective, initial_point, seed=0):
+        self.objective = objective
+        initial_point = np.asarray(initial_point, dtype=float)
+        if objective.minimizer is not None and not np.allclose(objective.minimizer, initial_point):
+            self.center = np.asarray(objective.minimizer, dtype=float)
+            first = initial_point - self.center
+        else:
+            self.center = initial_point.copy()
+            _, first = objective.value_and_grad(initial_point, np.empty_like(initial_point))
+            first = -first
+            self.axis_labels = ('Pravac najbržeg spusta', 'Slučajan pravac')
+        first = first / np.linalg.norm(first)
+        second = np.random.default_rng(seed).standard_normal(len(first))
+        second -= np.dot(second, first) * first
+        self.axes = (first, second / np.linalg.norm(second))
+        self._offsets = tuple(np.dot(self.center, axis) for axis in self.axes)
+        self._points = []
+        self.paths = {}
+
+    def start(self, name):
+        """Započinje novu putanju; naredne tačke iz `observe` pripadaju njoj."""
+        self._points = self.paths.setdefault(name, [])
+
+    def observe(self, point):
+        self._points.append((np.dot(point, self.axes[0]) - self._offsets[0],
+                             np.dot(point, self.axes[1]) - self._offsets[1]))
+
+    def coordinates(self):
+        """Rečnik ime -> koordinate putanje oblika (T, 2)."""
+        return {name: np.array(points, dtype=float).reshape(-1, 2) for name, points in self.paths.items()}
+
+    def surface(self, resolution=60, margin=0.15):
+        """
+        Vrednosti funkcije na mreži resolution x resolution u ravni preseka, nad
+        opsegom svih zabeleženih koordinata (uključujući centar).
+
+        Returns:
+            tuple: (A, B, Z) kao za `contourf`.
+        """
+        coordinates = np.concatenate([np.zeros((1, 2))] + list(self.coordinates().values()))
+        coordinates = coordinates[np.isfinite(coordinates).all(axis=1)]
+        low, high = coordinates.min(axis=0), coordinates.max(axis=0)
+        span = np.maximum(high - low, 1e-12)
+        low, high = low - margin * span, high + margin * span
+        a, b = np.linspace(low[0], high[0], resolution), np.linspace(low[1], high[1], resolution)
+        A, B = np.meshgrid(a, b)
+        grid = np.column_stack([A.ravel(), B.ravel()])
+        values = np.empty(len(grid))
+        chunk = max(1, SURFACE_CHUNK_ELEMENTS // len(self.center))
+        for begin in range(0, len(grid), chunk):
+            part = grid[begin:begin + chunk]
+            points = self.center + part[:, :1] * self.axes[0] + part[:, 1:] * self.axes[1]
+            values[begin:begin + chunk] = self.objective.value(points)
+        return A, B, values.reshape(A.shape)
+
+
+class SketchPCAProjection:
+    """
+    Projekcija putanja na prve dve glavne komponente (PCA), računata iz skice.
+
+    Svaka zabeležena tačka se odmah sažima u `sketch_size` brojeva (CountSketch:
+    svaka koordinata se sa slučajnim znakom dodaje u jednu od `sketch_size`
+    korpi), što u očekivanju čuva skalarne proizvode i rastojanja. PCA se na
+    kraju računa nad skicama svih putanja zajedno, pa sve dele iste ose. Za
+    n <= sketch_size tačke se čuvaju cele i PCA je tačna.
+    """
+    def __init__(self, dim, sketch_size=256, seed=0):
+        self.dim = dim
+        self.sketch_size = sketch_size
+        self.exact = dim <= sketch_size
+        self.width = dim if self.exact else sketch_size
+        if not self.exact:
+            rng = np.random.default_rng(seed)
+            self.buckets = rng.integers(0, sketch_size, dim)
+            self.signs = rng.choice([-1.0, 1.0], dim)
+            self._buffer = np.empty(dim)
+        self._sketches = []
+        self.paths = {}
+        self.explained_variance_ratio = None
+
+    def start(self, name):
+        self._sketches = self.paths.setdefault(name, [])
+
+    def observe(self, point):
+        if self.exact:
+            self._sketches.append(np.array(point, dtype=float))
+            return
+        np.multiply(self.signs, point, out=self._buffer)
+        self._sketches.append(np.bincount(self.buckets, weights=self._buffer, minlength=self.sketch_size))
+
+    def coordinates(self):
+        """Rečnik ime -> koordinate putanje na prve dve glavne komponente, oblika (T, 2)."""
+        names = list(self.paths)
+        sketches = [np.array(self.paths[name], dtype=float).reshape(-1, self.width) for name in names]
+        stacked = np.concatenate(sketches)
+        finite = np.isfinite(stacked).all(axis=1)
+        mean = stacked[finite].mean(axis=0)
+        _, singular_values, components = np.linalg.svd(stacked[finite] - mean, full_matrices=False)
+        variance = singular_values**2
+        self.explained_variance_ratio = variance[:2] / max(variance.sum(), 1e-300)
+        components = components[:2]
+        if len(components) < 2:
+            components = np.vstack([components, np.zeros((2 - len(components), stacked.shape[1]))])
+        coordinates = {}
+        for name, sketch in zip(names, sketches):
+            coordinates[name] = (sketch - mean) @ components.T
+        return coordinates
+
+    @property
+    def axis_labels(self):
+        if self.explained_variance_ratio is None:
+            return ('PC1', 'PC2')
+        return tuple(f"PC{i + 1} ({ratio:.1%} varijanse)" for i, ratio in enumerate(self.explained_variance_ratio))
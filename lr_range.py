@@ -0,0 +1,120 @@
+# lr_range.py
+"""
+Test opsega stope učenja (LR range test): jedan optimizator se iz iste početne
+tačke pokreće sa mnogo stopa učenja odjednom, kao paket u kome svaka tačka ima
+svoju stopu (niz oblika (N, 1)). Za svaku stopu beleži se broj iteracija do
+konvergencije, konačna vrednost funkcije i da li je divergirala, a kao
+preporuka se bira stabilna stopa koja najbrže konvergira.
+"""
+import numpy as np
+
+from optimizers import get_optimizer_by_name
+from runner import optimize, StoppingCriteria, NON_FINITE, OUT_OF_BOUNDS, MAX_ITER
+from schedulers import make_schedule
+
+
+class LRRangeResult:
+    """
+    Rezultati testa opsega stope učenja, po jedan element za svaku stopu.
+
+    Attributes:
+        learning_rates (np.array): Ispitane stope učenja (rastuće).
+        iterations (np.array): Broj iteracija do zaustavljanja.
+        converged (np.array): Da li je optimizacija zaustavljena nekim od kriterijuma konvergencije.
+        diverged (np.array): Da li je optimizacija divergirala (NaN/inf ili izlazak iz opsega).
+        final_loss (np.array): Vrednost funkcije u krajnjoj tački (NaN za divergentne).
+        stop_codes (np.array): Kodovi razloga zaustavljanja (runner.STOP_REASONS).
+        best (int): Indeks preporučene stope ili None ako su sve divergirale.
+    """
+    def __init__(self, optimizer_name, hyperparams, max_iterations, learning_rates, iterations, final_loss, stop_codes,
+                 schedule=None):
+        self.optimizer_name = optimizer_name
+        self.hyperparams = hyperparams
+        self.max_iterations = max_iterations
+        self.schedule = schedule
+        self.learning_rates = learning_rates
+        self.iterations = iterations
+        self.final_loss = final_loss
+        self.stop_codes = stop_codes
+        self.diverged = np.isin(stop_codes, (NON_FINITE, OUT_OF_BOUNDS))
+        self.converged = (stop_codes != MAX_ITER) & ~self.diverged
+        self.best = self._select_best()
+
+    def _select_best(self):
+        """Najbrže konvergentna stopa (kod jednakog broja iteracija manja vrednost funkcije),
+        a ako nijedna nije konvergirala, stabilna stopa sa najmanjom konačnom vrednošću."""
+        if self.converged.any():
+            candidates = np.flatnonzero(self.converged)
+            order = np.lexsort((self.final_loss[candidates], self.iterations[candidates]))
+            return int(candidates[order[0]])
+        stable = np.flatnonzero(~self.diverged)
+        if stable.size == 0:
+            return None
+        return int(stable[np.nanargmin(self.final_loss[stable])])
+
+    @property
+    def best_learning_rate(self):
+        return None if self.best is None else float(self.learning_rates[self.best])
+
+    def table(self):
+        """Tabela rezultata po stopi učenja (preporučena stopa je označena sa '*')."""
+        lines = [f"{'LR':>12}  {'iteracije':>9}  {'f(x)':>12}  status"]
+        for i, lr in enumerate(self.learning_rates):
+            status = 'divergiralo' if self.diverged[i] else 'konvergiralo' if self.converged[i] else 'nije konvergiralo'
+            marker = ' *' if i == self.best else ''
+            lines.append(f"{lr:>12.4g}  {self.iterations[i]:>9d}  {self.final_loss[i]:>12.4g}  {status}{marker}")
+        return "\n".join(lines)
+
+    def summary(self):
+        n = len(self.learning_rates)
+        if self.best is None:
+            return f"{n} stopa učenja, sve su divergirale"
+        stable = self.learning_rates[~self.diverged]
+        if self.converged[self.best]:
+            outcome = f"konvergira za {self.iterations[self.best]} iteracija"
+        else:
+            outcome = f"nijedna nije konvergirala, najmanja vrednost f={self.final_loss[self.best]:.4g}"
+        return (f"{n} stopa učenja, stabilne od {stable.min():.4g} do {stable.max():.4g}, "
+                f"konvergiralo {self.converged.mean():.0%}; preporučena LR={self.best_learning_rate:.4g} ({outcome})")
+
+
+def run_lr_range(optimizer_name, objective, initial_point, learning_rates, iterations, hyperparams=None,
+                 criteria=None, schedule=None):
+    """
+    Pokreće optimizator iz jedne početne tačke sa svim zadatim stopama učenja u jednom paketu.
+
+    Args:
+        optimizer_name (str): Ime optimizatora.
+        objective (Objective): Funkcija cilja iz registra.
+        initial_point (array-like): Početna tačka oblika (2,).
+        learning_rates (array-like): Stope učenja koje se ispituju.
+        iterations (int): Najveći broj iteracija.
+        hyperparams (dict): Ostali hiperparametri optimizatora (bez 'learning_rate').
+        criteria (StoppingCriteria): Kriterijumi konvergencije; podrazumevano grad_tol=1e-4.
+                                     Tačke koje napuste opseg se uvek smatraju divergentnim.
+        schedule (str): Specifikacija rasporeda stope učenja (schedulers.make_schedule) koji
+                        se primenjuje na svaku ispitanu stopu.
+
+    Returns:
+        LRRangeResult: Rezultati po stopi učenja.
+    """
+    if criteria is None:
+        criteria = StoppingCriteria(grad_tol=1e-4)
+    criteria = StoppingCriteria(grad_tol=criteria.grad_tol, step_tol=criteria.step_tol, f_tol=criteria.f_tol,
+                                f_min=criteria.f_min, bounds=objective.bounds, check_every=criteria.check_every)
+
+    learning_rates = np.sort(np.asarray(learning_rates, dtype=float))
+    starts = np.repeat(np.asarray(initial_point, dtype=float)[None], len(learning_rates), axis=0)
+    hyperparams = dict(hyperparams or {})
+    # Svaka tačka paketa dobija svoju stopu učenja
+    optimizer = get_optimizer_by_name(optimizer_name, learning_rates[:, None], **hyperparams)
+    if schedule:
+        optimizer.set_schedule(make_schedule(schedule, iterations))
+    result = optimize(optimizer, objective.grad, starts, iterations, record_every=None, criteria=criteria,
+                      func=objective.func)
+
+    with np.errstate(all='ignore'):
+        final_loss = objective.value(result.history[-1])
+    final_loss = np.where(np.isin(result.stop_codes, (NON_FINITE, OUT_OF_BOUNDS)), np.nan, final_loss)
+    return LRRangeResult(optimizer_name, hyperparams, iterations, learning_rates, result.iterations.astype(int),
+                         final_loss, result.stop_codes, schedule)
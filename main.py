@@ -1,77 +1,621 @@
 import argparse
 import numpy as np
 import os  
+import sys
 
-from functions import get_function_by_name
+from functions import get_function_by_name, get_objective, OBJECTIVES
 from optimizers import get_optimizer_by_name
-from visualizations import plot_optimization_path, create_animation
+from runner import optimize, make_initial_grid, load_initial_points, StoppingCriteria
+from sweep import parse_sweep_spec, expand_grid, optimizer_grid, check_grid, run_sweep
+from surface_cache import configure_surface_cache, DEFAULT_DISK_DIR
+from profiling import enable_profiling, get_profiler
+from result_store import ResultStore, DEFAULT_STORE_DIR, run_config, config_key, recorded_steps, trajectory_traces
+from result_store import export_trajectories
+from streaming import stream, ChunkWriter, RunningMetrics, LivePlot
+from basins import run_basins, save_basins
+from schedulers import make_schedule, SCHEDULERS
+from lr_range import run_lr_range
+from highdim import HIGHDIM_OBJECTIVES, IllConditionedQuadratic, make_highdim_objective, run_flat
+from highdim import RandomSliceProjection, SketchPCAProjection
+from noise import NOISE_MODELS, make_noise, replicate, trajectory_bands
+from experiments import run_experiments
+
+RESULTS_DIR = "results"
+
+
+def render_output(objective, paths, title, output_path, layout='grid', max_frames=None, fps=15, steps=None):
+    """Crta putanje u PNG sliku ili GIF/MP4 animaciju, u zavisnosti od ekstenzije izlaznog fajla."""
+    # matplotlib se uvozi tek kada se crta, pa ga pokretanja bez crtanja (--no-plot) ne plaćaju
+    from visualizations import plot_optimization_path, create_animation
+    profiler = get_profiler()
+    if output_path.lower().endswith('.png'):
+        print(f"Generišem statičnu sliku: {output_path}")
+        with profiler.phase('render', output_file=output_path):
+            plot_optimization_path(objective.func, paths, objective.bounds, title, output_path,
+                                   levels=objective.levels, log_scale=objective.log_scale, minima=objective.minima)
+        
+    elif output_path.lower().endswith(('.gif', '.mp4')):
+        print(f"Generišem animaciju: {output_path}")
+        with profiler.phase('render', output_file=output_path):
+            create_animation(objective.func, paths, objective.bounds, title, output_path, layout=layout,
+                             max_frames=max_frames, fps=fps, levels=objective.levels,
+                             log_scale=objective.log_scale, minima=objective.minima, steps=steps)
+        
+    else:
+        print("Greška: Podržane ekstenzije za izlazni fajl su .png, .gif, .mp4")
+
+
+def render_main(argv):
+    """Podkomanda `render`: crta sačuvana pokretanja iz skladišta, bez ponovne optimizacije."""
+    parser = argparse.ArgumentParser(
+        prog="main.py render",
+        description="Crtanje sačuvanih rezultata (--store) bez ponovne optimizacije."
+    )
+    parser.add_argument('--store', type=str, default=DEFAULT_STORE_DIR, help="Direktorijum skladišta rezultata.")
+    parser.add_argument('--list', action='store_true', help="Ispisuje sačuvana pokretanja i izlazi.")
+    parser.add_argument('--function', type=str, choices=list(OBJECTIVES), help="Funkcija cilja čija se pokretanja crtaju.")
+    parser.add_argument('--optimizers', nargs='+', default=None, help="Optimizatori koji se crtaju (podrazumevano svi sačuvani).")
+    parser.add_argument('--keys', nargs='+', default=None, help="Ključevi konkretnih pokretanja (iz --list).")
+    parser.add_argument('--output_file', type=str, default='output.png', help="Ime izlaznog fajla (.png, .gif, .mp4).")
+    parser.add_argument('--title', type=str, default=None, help="Naslov grafika.")
+    parser.add_argument('--layout', choices=['grid', 'overlay'], default='grid')
+    parser.add_argument('--max_frames', type=int, default=None)
+    parser.add_argument('--fps', type=int, default=15)
+    parser.add_argument('--traces', action='store_true', help="Crta i vrednost funkcije i normu gradijenta po iteracijama (<ime>_traces.png).")
+    args = parser.parse_args(argv)
+
+    store = ResultStore(args.store)
+    if args.list:
+        for run in store.runs(args.function, args.optimizers):
+            print(run.describe())
+        return
+
+    if args.keys:
+        runs = [store.get(key) for key in args.keys]
+        missing = [key for key, run in zip(args.keys, runs) if run is None]
+        if missing:
+            parser.error(f"Pokretanja {', '.join(missing)} nisu pronađena u '{args.store}'.")
+    else:
+        if args.function is None:
+            parser.error("Potrebno je zadati --function ili --keys.")
+        # Za svaki optimizator uzima se najnovije pokretanje
+        runs = {}
+        for run in store.runs(args.function, args.optimizers):
+            runs.setdefault(run.optimizer, run)
+        runs = list(runs.values())
+        if not runs:
+            parser.error(f"Nema sačuvanih pokretanja za funkciju '{args.function}' u '{args.store}'.")
+
+    functions = {run.function for run in runs}
+    if len(functions) > 1:
+        parser.error(f"Pokretanja pripadaju različitim funkcijama ({', '.join(sorted(functions))}).")
+    objective = get_objective(functions.pop())
+    labels = [run.optimizer for run in runs]
+    if len(set(labels)) < len(labels):
+        labels = [f"{run.optimizer} ({run.key[:6]})" for run in runs]
+
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    output_path = os.path.join(RESULTS_DIR, os.path.basename(args.output_file))
+    title = args.title or f"Optimizatori na funkciji '{objective.name}' (sačuvani rezultati)"
+    render_output(objective, {label: run.path for label, run in zip(labels, runs)}, title, output_path,
+                  layout=args.layout, max_frames=args.max_frames, fps=args.fps,
+                  steps={label: run.steps for label, run in zip(labels, runs)})
+    if args.traces:
+        from visualizations import plot_traces
+        traces_path = os.path.splitext(output_path)[0] + '_traces.png'
+        plot_traces({label: (run.steps, run.loss, run.grad_norm) for label, run in zip(labels, runs)},
+                    title, traces_path, f_min=objective.f_min)
+
+
+def highdim_main(argv):
+    """Podkomanda `highdim`: optimizacija u n dimenzija i prikaz putanja projektovanih u 2D."""
+    parser = argparse.ArgumentParser(
+        prog="main.py highdim",
+        description="Optimizacija funkcija u više dimenzija i prikaz putanja u 2D\n"
+                    "(PCA projekcija putanja ili presek funkcije kroz rešenje).",
+        formatter_class=argparse.RawTextHelpFormatter
+    )
+    parser.add_argument('--optimizers', nargs='+', required=True, help="Lista imena optimizatora za poređenje.")
+    parser.add_argument('--function', type=str, required=True, choices=list(HIGHDIM_OBJECTIVES),
+                        help="Funkcija cilja u više dimenzija.")
+    parser.add_argument('--dim', type=int, required=True, help="Broj dimenzija (npr. 10000).")
+    parser.add_argument('--learning_rate', type=float, default=0.01)
+    parser.add_argument('--iterations', type=int, default=1000)
+    parser.add_argument('--beta1', type=float, default=0.9)
+    parser.add_argument('--beta2', type=float, default=0.999)
+    parser.add_argument('--lr_schedule', type=str, default=None, metavar='RASPORED', help="Raspored stope učenja (kao u glavnoj komandi).")
+    parser.add_argument('--grad_tol', type=float, default=None, help="Zaustavlja optimizaciju kada je norma gradijenta manja od praga.")
+    parser.add_argument('--projection', choices=['pca', 'slice'], default='pca',
+                        help="pca: prve dve glavne komponente putanja (iz skice); slice: presek funkcije u ravni\n"
+                             "kroz rešenje (pravac ka početnoj tački i slučajan pravac).")
+    parser.add_argument('--record_every', type=int, default=1, help="Projektuje se svaki k-ti korak.")
+    parser.add_argument('--sketch_size', type=int, default=256, help="Veličina skice za PCA projekciju.")
+    parser.add_argument('--resolution', type=int, default=60, help="Rezolucija mreže preseka za --projection slice.")
+    parser.add_argument('--condition', type=float, default=None, help="Uslovljenost za quadratic_nd (podrazumevano 1e3).")
+    parser.add_argument('--spectrum', choices=IllConditionedQuadratic.spectra, default=None,
+                        help="Raspored sopstvenih vrednosti za quadratic_nd.")
+    parser.add_argument('--samples', type=int, default=None, help="Broj primera za logistic (podrazumevano 500).")
+    parser.add_argument('--seed', type=int, default=0, help="Seme za podatke, projekciju i Householder-ovu refleksiju.")
+    parser.add_argument('--output_file', type=str, default='highdim.png', help="Ime izlazne PNG slike.")
+    args = parser.parse_args(argv)
+
+    if args.lr_schedule:
+        try:
+            make_schedule(args.lr_schedule, 1)
+        except ValueError as error:
+            parser.error(str(error))
+    objective = make_highdim_objective(args.function, args.dim, condition=args.condition, spectrum=args.spectrum,
+                                       samples=args.samples, seed=args.seed)
+    initial_point = objective.initial_point()
+    if args.projection == 'slice':
+        projection = RandomSliceProjection(objective, initial_point, seed=args.seed)
+    else:
+        projection = SketchPCAProjection(args.dim, sketch_size=args.sketch_size, seed=args.seed)
+
+    losses = {}
+    for optimizer_name in args.optimizers:
+        print(f"Izvršavam {optimizer_name.upper()}...")
+        optimizer = get_optimizer_by_name(optimizer_name, args.learning_rate, beta1=args.beta1, beta2=args.beta2)
+        if args.lr_schedule:
+            optimizer.set_schedule(make_schedule(args.lr_schedule, args.iterations))
+        projection.start(optimizer_name)
+        with get_profiler().phase(f'highdim/{optimizer_name}', dim=args.dim, iterations=args.iterations):
+            result = run_flat(optimizer, objective, initial_point, args.iterations, grad_tol=args.grad_tol,
+                              record_every=args.record_every, observe=projection.observe)
+        print(f"  {result.summary()}")
+        losses[optimizer_name] = result.losses
+
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    output_path = os.path.join(RESULTS_DIR, os.path.basename(args.output_file))
+    paths = projection.coordinates()
+    surface = projection.surface(args.resolution) if args.projection == 'slice' else None
+    title = (f"Optimizatori na funkciji '{args.function}' (n={args.dim}), projekcija: {args.projection}\n"
+             f"LR={args.learning_rate}, Iteracije={args.iterations}")
+    from visualizations import plot_projection
+    plot_projection(paths, losses, title, output_path, surface=surface, axis_labels=projection.axis_labels,
+                    f_min=objective.f_min)
+
+
+def experiments_main(argv):
+    """Podkomanda `experiments`: izvršava sve eksperimente iz fajla u jednom procesu."""
+    parser = argparse.ArgumentParser(
+        prog="main.py experiments",
+        description="Izvršava eksperimente iz TOML/JSON/YAML fajla, deleći putanje i konturne površine "
+                    "između njih; eksperimenti sa ažurnim izlazima se preskaču."
+    )
+    parser.add_argument('file', type=str, help="Fajl sa eksperimentima (.toml, .json, .yaml).")
+    parser.add_argument('--output_dir', type=str, default=None, help="Izlazni direktorijum (podrazumevano iz fajla ili 'results').")
+    parser.add_argument('--workers', type=int, default=1, help="Broj procesa za računanje putanja i crtanje (0 = broj jezgara).")
+    parser.add_argument('--store', nargs='?', const=DEFAULT_STORE_DIR, default=None, metavar='DIR',
+                        help=f"Putanje se traže i čuvaju u skladištu rezultata (podrazumevano {DEFAULT_STORE_DIR}).")
+    parser.add_argument('--surface_cache', action='store_true', help=f"Čuva izračunate konturne površine na disku ({DEFAULT_DISK_DIR}).")
+    parser.add_argument('--force', action='store_true', help="Izvršava i eksperimente čiji su izlazi ažurni.")
+    args = parser.parse_args(argv)
+
+    if args.surface_cache:
+        configure_surface_cache(disk_dir=DEFAULT_DISK_DIR)
+    try:
+        done, skipped, failed = run_experiments(args.file, args.output_dir, args.store, args.workers, args.force)
+    except (OSError, ValueError) as error:
+        parser.error(str(error))
+    print(f"--- Završeno: {len(done)} izvršeno, {len(skipped)} preskočeno, {len(failed)} neuspešno ---")
+    if failed:
+        sys.exit(f"Neuspešni eksperimenti: {', '.join(experiment.name for experiment in failed)}")
+
+
+def create_noise(args, objective):
+    """Model šuma iz argumenata komandne linije (None bez --noise)."""
+    if not args.noise:
+        return None
+    return make_noise(args.noise, args.noise_scale, seed=args.seed, objective=objective, df=args.noise_df,
+                      batch_size=args.batch_size)
+
+
+def run_streaming(args, objective, initial_points, criteria, optimizer_kwargs, output_path):
+    """
+    Pokreće sve optimizatore naizmenično, deo po deo: svaki deo se dopisuje u
+    .npy fajl, ažurira tekuće metrike i (uz --live) grafik. Redni brojevi
+    koraka se dopisuju u poseban `<ime>_steps.npy` fajl pored putanje. Vraća
+    putanje i redne brojeve njihovih koraka, učitane iz fajlova memorijskim mapiranjem.
+    """
+    stem = os.path.splitext(output_path)[0]
+    streams, writers, step_writers, metrics = {}, {}, {}, {}
+    for optimizer_name in args.optimizers:
+        optimizer = get_optimizer_by_name(optimizer_name, args.learning_rate, **optimizer_kwargs)
+        if args.lr_schedule:
+            optimizer.set_schedule(make_schedule(args.lr_schedule, args.iterations))
+        streams[optimizer_name] = stream(optimizer, objective.grad, initial_points, args.iterations,
+                                         chunk_size=args.stream, record_every=args.record_every or args.iterations,
+                                         criteria=criteria, func=objective.func, noise=create_noise(args, objective))
+        writers[optimizer_name] = ChunkWriter(f"{stem}_{optimizer_name}.npy")
+        step_writers[optimizer_name] = ChunkWriter(f"{stem}_{optimizer_name}_steps.npy", dtype=np.int64)
+        metrics[optimizer_name] = RunningMetrics(objective)
+
+    live = None
+    if args.live:
+        import matplotlib
+        interactive = matplotlib.get_backend().lower() not in ('agg', 'pdf', 'svg', 'ps', 'cairo', 'pgf', 'template')
+        live_file = None if interactive else f"{stem}_live.png"
+        live = LivePlot(objective, args.optimizers, f"Optimizatori na funkciji '{objective.name}'", live_file)
+        if live_file:
+            print(f"Grafik uživo se prepisuje u '{live_file}'")
+
+    while streams:
+        for optimizer_name, steps in list(streams.items()):
+            chunk = next(steps)
+            writers[optimizer_name].write(chunk.points)
+            step_writers[optimizer_name].write(chunk.steps)
+            metrics[optimizer_name].update(chunk)
+            if live is not None:
+                live.update(optimizer_name, chunk)
+            if chunk.done:
+                writers[optimizer_name].close()
+                step_writers[optimizer_name].close()
+                del streams[optimizer_name]
+                print(f"{optimizer_name.upper()}: {chunk.result.summary()}, {metrics[optimizer_name].describe()}")
+        if streams:
+            print("  " + " | ".join(f"{name}: {metrics[name].describe()}" for name in streams))
+        if live is not None:
+            live.refresh(", ".join(f"{name}: f={metrics[name].value:.3g}" for name in args.optimizers))
+    if live is not None:
+        live.close()
+
+    for optimizer_name, writer in writers.items():
+        print(f"Putanja {optimizer_name.upper()} sačuvana u '{writer.path}' ({writer.length} tačaka)")
+    paths = {name: np.load(writer.path, mmap_mode='r') for name, writer in writers.items()}
+    steps = {name: np.load(writer.path, mmap_mode='r') for name, writer in step_writers.items()}
+    return paths, steps
+
+
+def report_profile(profiler, trace_json=None):
+    """Ispisuje tabelu merenja po fazama i opciono čuva trace (ako je merenje uključeno)."""
+    if not profiler.enabled:
+        return
+    print("--- Merenje po fazama ---")
+    print(profiler.summary())
+    if trace_json:
+        profiler.write_trace(trace_json)
+        print(f"Trace sačuvan u '{trace_json}' (otvoriti u chrome://tracing ili Perfetto)")
+
+
+def run_basin_mode(args, objective, criteria, output_path):
+    """Računa i crta mape oblasti privlačenja za svaki optimizator i kombinaciju hiperparametara."""
+    nx, ny = args.basins
+    grid = parse_sweep_spec(args.sweep) if args.sweep else {}
+    # Svaki optimizator prolazi samo kroz hiperparametre koje prima
+    cells = {name: expand_grid(optimizer_grid(grid, name)) for name in args.optimizers}
+    if not any(value is not None for value in (args.grad_tol, args.step_tol, args.f_tol)):
+        criteria = None  # Podrazumevani kriterijum konvergencije iz run_basins
+    print(f"Mapa oblasti privlačenja: {nx} x {ny} = {nx * ny} početnih tačaka, "
+          f"{sum(len(c) for c in cells.values())} kombinacija (optimizator, hiperparametri)")
+
+    stem, extension = os.path.splitext(output_path)
+    if extension.lower() != '.png':
+        print("Napomena: mape oblasti se čuvaju kao PNG slike.")
+    results = []
+    for optimizer_name in args.optimizers:
+        for cell in cells[optimizer_name]:
+            hyperparams = {'learning_rate': args.learning_rate, 'beta1': args.beta1, 'beta2': args.beta2, **cell}
+            label = ', '.join(f"{k}={v:.4g}" for k, v in cell.items())
+            print(f"Izvršavam {optimizer_name.upper()}{f' ({label})' if label else ''}...")
+            with get_profiler().phase(f'basins/{optimizer_name}', points=nx * ny):
+                result = run_basins(optimizer_name, objective, nx, ny, args.iterations, hyperparams, criteria,
+                                    chunk_points=args.points_per_job or 16384)
+            print(f"  {result.summary(objective.minima)}")
+            results.append(result)
+
+            suffix = ''.join(f"_{k}={v:.4g}" for k, v in cell.items())
+            title = (f"{optimizer_name.upper()} na funkciji '{objective.name}', {nx}x{ny} početnih tačaka\n"
+                     f"{label or f'LR={args.learning_rate:.4g}'}, najviše {args.iterations} iteracija")
+            if not args.no_plot:
+                from visualizations import plot_basins
+                plot_basins(objective.func, result, title, f"{stem}_{optimizer_name}{suffix}.png",
+                            levels=objective.levels, minima=objective.minima)
+
+    save_basins(f"{stem}_basins.npz", results)
+    print(f"Rezultati sačuvani u '{stem}_basins.npz'")
+
+
+def run_lr_range_mode(args, objective, criteria, output_path):
+    """Test opsega stope učenja za svaki optimizator iz jedne početne tačke."""
+    lr_min, lr_max, n = args.lr_range
+    learning_rates = np.geomspace(lr_min, lr_max, int(n))
+    if not any(value is not None for value in (args.grad_tol, args.step_tol, args.f_tol)):
+        criteria = None  # Podrazumevani kriterijum konvergencije iz run_lr_range
+    print(f"Test opsega stope učenja: {int(n)} stopa od {lr_min:g} do {lr_max:g}, najviše {args.iterations} iteracija")
+
+    stem = os.path.splitext(output_path)[0]
+    for optimizer_name in args.optimizers:
+        print(f"Izvršavam {optimizer_name.upper()}...")
+        with get_profiler().phase(f'lr_range/{optimizer_name}', learning_rates=int(n)):
+            result = run_lr_range(optimizer_name, objective, args.initial_point, learning_rates, args.iterations,
+                                  {'beta1': args.beta1, 'beta2': args.beta2}, criteria, schedule=args.lr_schedule)
+        print(result.table())
+        print(f"  {result.summary()}")
+        schedule = f", raspored {args.lr_schedule}" if args.lr_schedule else ''
+        title = (f"{optimizer_name.upper()} na funkciji '{objective.name}', start {tuple(args.initial_point)}\n"
+                 f"najviše {args.iterations} iteracija{schedule}")
+        if not args.no_plot:
+            from visualizations import plot_lr_range
+            plot_lr_range(result, title, f"{stem}_{optimizer_name}_lr_range.png", f_min=objective.f_min)
+
 
 def main():
     """Glavna funkcija koja pokreće ceo proces."""
+    if len(sys.argv) > 1 and sys.argv[1] == 'render':
+        render_main(sys.argv[2:])
+        return
+    if len(sys.argv) > 1 and sys.argv[1] == 'highdim':
+        highdim_main(sys.argv[2:])
+        return
+    if len(sys.argv) > 1 and sys.argv[1] == 'experiments':
+        experiments_main(sys.argv[2:])
+        return
     
     parser = argparse.ArgumentParser(
-        description="Vizuelizacija metoda optimizacije za 2D funkcije.",
+        description="Vizuelizacija metoda optimizacije za 2D funkcije.\n"
+                    "Crtanje sačuvanih rezultata bez optimizacije: python main.py render --help\n"
+                    "Optimizacija u više dimenzija: python main.py highdim --help\n"
+                    "Više eksperimenata iz fajla: python main.py experiments --help",
         formatter_class=argparse.RawTextHelpFormatter
     )
     
     parser.add_argument('--optimizers', nargs='+', required=True, help="Lista imena optimizatora za poređenje (npr. sgd adam rmsprop).")
-    parser.add_argument('--function', type=str, required=True, choices=['quadratic', 'booth', 'beale'], help="Ime funkcije cilja koju treba optimizovati.")
-    parser.add_argument('--initial_point', type=float, nargs=2, required=True, metavar=('X', 'Y'), help="Početna tačka za optimizaciju (npr. 8 8).")
+    parser.add_argument('--function', type=str, required=True, choices=list(OBJECTIVES), help="Ime funkcije cilja koju treba optimizovati.")
+    start_group = parser.add_mutually_exclusive_group(required=True)
+    start_group.add_argument('--initial_point', type=float, nargs=2, metavar=('X', 'Y'), help="Početna tačka za optimizaciju (npr. 8 8).")
+    start_group.add_argument('--initial_grid', type=int, nargs=2, metavar=('NX', 'NY'), help="Mreža od NX x NY početnih tačaka unutar opsega funkcije (paketna optimizacija).")
+    start_group.add_argument('--initial_points_file', type=str, help="Fajl (.npy, .csv ili .txt) sa početnim tačkama oblika (N, 2).")
+    start_group.add_argument('--basins', type=int, nargs=2, metavar=('NX', 'NY'),
+                             help="Mapa oblasti privlačenja: optimizacija iz svake ćelije mreže NX x NY nad opsegom funkcije\n"
+                                  "(uz --sweep za više kombinacija hiperparametara).")
     parser.add_argument('--learning_rate', type=float, default=0.01, help="Stopa učenja (learning rate) za optimizatore.")
+    parser.add_argument('--lr_schedule', type=str, default=None, metavar='RASPORED',
+                        help=f"Raspored stope učenja: {', '.join(SCHEDULERS)}, sa parametrima posle ':' i spajanjem '+',\n"
+                             "npr. step:200:0.5, exp:0.995, cosine, warmup:50+cosine, onecycle:0.3.")
+    parser.add_argument('--lr_range', type=float, nargs=3, metavar=('MIN', 'MAX', 'N'),
+                        help="Test opsega stope učenja: N stopa od MIN do MAX (log skala) iz --initial_point u jednom\n"
+                             "paketnom pokretanju; ispisuje tabelu i preporučuje stabilnu stopu koja najbrže konvergira.")
     parser.add_argument('--iterations', type=int, default=100, help="Broj iteracija za optimizaciju.")
+    parser.add_argument('--record_every', type=int, default=1, help="Beleži svaki k-ti korak u istoriju (0 = samo početna i krajnja tačka).")
     parser.add_argument('--output_file', type=str, default='output.png', help="Ime izlaznog fajla (bez putanje). Ekstenzija (.png, .gif) određuje tip izlaza.")
+    parser.add_argument('--max_frames', type=int, default=None, help="Najveći broj frejmova animacije; istorija se ravnomerno proređuje.")
+    parser.add_argument('--layout', choices=['grid', 'overlay'], default='grid', help="Raspored animacije više optimizatora: svaki u svom panelu (grid) ili svi na istom grafiku (overlay).")
+    parser.add_argument('--fps', type=int, default=15, help="Broj frejmova u sekundi za animaciju.")
     parser.add_argument('--beta1', type=float, default=0.9)
     parser.add_argument('--beta2', type=float, default=0.999)
+    parser.add_argument('--noise', choices=NOISE_MODELS, default=None,
+                        help="Stohastički gradijent: dodaje šum tačnom gradijentu: gaussian, student_t (teški repovi)\n"
+                             "ili minibatch (standardna devijacija raste sa f(x) - f_min).")
+    parser.add_argument('--noise_scale', type=float, default=1.0, help="Standardna devijacija (skala) šuma.")
+    parser.add_argument('--noise_df', type=float, default=3.0, help="Broj stepeni slobode za --noise student_t.")
+    parser.add_argument('--batch_size', type=int, default=1, help="Veličina mini-paketa za --noise minibatch.")
+    parser.add_argument('--replicas', type=int, default=1,
+                        help="Broj replika sa nezavisnim šumom iz --initial_point, optimizovanih kao jedan paket;\n"
+                             "crta se i raspon vrednosti funkcije po replikama (<ime>_bands.png).")
+    parser.add_argument('--seed', type=int, default=0, help="Seme iz kog se izvode tokovi šuma svih replika.")
+    parser.add_argument('--grad_tol', type=float, default=None, help="Zaustavlja optimizaciju kada je norma gradijenta manja od praga.")
+    parser.add_argument('--step_tol', type=float, default=None, help="Zaustavlja optimizaciju kada je dužina koraka manja od praga.")
+    parser.add_argument('--f_tol', type=float, default=None, help="Zaustavlja optimizaciju kada je f(x) - f_min manje od praga (f_min je poznati minimum funkcije).")
+    parser.add_argument('--stop_out_of_bounds', action='store_true', help="Tačke koje napuste opseg funkcije smatraju se divergentnim i zaustavljaju se.")
+    parser.add_argument('--no_stop_divergence', action='store_true', help="Ne zaustavlja tačke sa NaN/inf vrednostima (izvršavaju se sve iteracije).")
+    parser.add_argument('--sweep', nargs='+', metavar='PARAM=VREDNOSTI',
+                        help="Pretraga hiperparametara, npr. lr=1e-4:1e-1:log:20 beta1=0.8,0.9,0.99.\n"
+                             "Opseg: start:stop[:lin|log]:n, lista: v1,v2,...")
+    parser.add_argument('--workers', type=int, default=None, help="Broj procesa za --sweep (podrazumevano: broj jezgara).")
+    parser.add_argument('--chunksize', type=int, default=1, help="Broj poslova koji se odjednom šalju jednom procesu.")
+    parser.add_argument('--surface_cache', action='store_true', help=f"Čuva izračunate konturne površine na disku ({DEFAULT_DISK_DIR}) za naredna pokretanja.")
+    parser.add_argument('--points_per_job', type=int, default=None, help="Najveći broj početnih tačaka po poslu u --sweep režimu.")
+    parser.add_argument('--profile', action='store_true', help="Meri vreme po fazama (gradijent, korak, konture, čuvanje) i ispisuje tabelu na kraju.")
+    parser.add_argument('--trace_json', '--trace-json', type=str, default=None,
+                        help="Čuva merenja u Chrome trace JSON fajl (uključuje --profile).")
+    parser.add_argument('--profile_sample_every', type=int, default=0,
+                        help="Uz --profile beleži trajanje svakog k-tog koraka optimizacije (0 = bez uzoraka).")
+    parser.add_argument('--stream', type=int, default=None, metavar='CHUNK',
+                        help="Postepena optimizacija: putanje se u delovima od CHUNK tačaka upisuju u results/<ime>_<optimizator>.npy,\n"
+                             "pa memorija ne raste sa brojem iteracija.")
+    parser.add_argument('--live', action='store_true',
+                        help="Uz --stream osvežava grafik posle svakog dela: u prozoru ako je dostupan,\n"
+                             "inače prepisivanjem results/<ime>_live.png.")
+    parser.add_argument('--store', nargs='?', const=DEFAULT_STORE_DIR, default=None, metavar='DIR',
+                        help=f"Čuva putanje, vrednosti funkcije i norme gradijenta u skladište (podrazumevano {DEFAULT_STORE_DIR}).\n"
+                             "Ponovljena konfiguracija se učitava iz skladišta bez optimizacije.")
+    parser.add_argument('--no_plot', '--no-plot', action='store_true',
+                        help="Ne crta ništa (ni ne uvozi matplotlib); korisno uz --export, --store i --sweep.")
+    parser.add_argument('--export', type=str, default=None, metavar='FAJL',
+                        help="Čuva zabeležene putanje (i redne brojeve koraka) svih optimizatora u .npz fajl u 'results'.")
     
     args = parser.parse_args()
 
-    RESULTS_DIR = "results"
+    if args.stream is not None and args.stream < 1:
+        parser.error("--stream zahteva pozitivnu veličinu dela.")
+    if args.stream is not None and (args.sweep or args.store):
+        parser.error("--stream se ne može kombinovati sa --sweep ni --store.")
+    if args.live and args.stream is None:
+        parser.error("--live zahteva --stream.")
+    if args.live and args.no_plot:
+        parser.error("--live se ne može kombinovati sa --no_plot.")
+    if args.export and (args.basins or args.lr_range is not None):
+        parser.error("--export se ne može kombinovati sa --basins ni --lr_range.")
+    if args.lr_schedule and (args.sweep or args.basins):
+        parser.error("--lr_schedule se ne može kombinovati sa --sweep ni --basins.")
+    if args.lr_range is not None:
+        if args.initial_point is None:
+            parser.error("--lr_range zahteva --initial_point.")
+        if args.sweep or args.stream is not None or args.store:
+            parser.error("--lr_range se ne može kombinovati sa --sweep, --stream ni --store.")
+    if args.lr_schedule:
+        try:
+            make_schedule(args.lr_schedule, 1)
+        except ValueError as error:
+            parser.error(str(error))
+    if args.noise and (args.sweep or args.basins or args.lr_range is not None):
+        parser.error("--noise se ne može kombinovati sa --sweep, --basins ni --lr_range.")
+    if args.sweep:
+        try:
+            check_grid(parse_sweep_spec(args.sweep), args.optimizers)
+        except ValueError as error:
+            parser.error(str(error))
+        # Pretraga ne koristi kriterijume zaustavljanja (mape oblasti ih koriste)
+        given = [flag for flag, value in (('--grad_tol', args.grad_tol), ('--step_tol', args.step_tol),
+                                          ('--f_tol', args.f_tol)) if value is not None]
+        if args.stop_out_of_bounds:
+            given.append('--stop_out_of_bounds')
+        if given and args.basins is None:
+            parser.error(f"--sweep se ne može kombinovati sa {', '.join(given)}.")
+    if args.replicas > 1:
+        if not args.noise or args.initial_point is None:
+            parser.error("--replicas zahteva --noise i --initial_point.")
+        if args.stream is not None:
+            parser.error("--replicas se ne može kombinovati sa --stream.")
+
     os.makedirs(RESULTS_DIR, exist_ok=True) # Kreira folder 'results' ako ne postoji
 
     final_output_path = os.path.join(RESULTS_DIR, os.path.basename(args.output_file))
 
+    if args.surface_cache:
+        configure_surface_cache(disk_dir=DEFAULT_DISK_DIR)
+
+    if args.profile or args.trace_json:
+        enable_profiling(sample_every=args.profile_sample_every)
+    profiler = get_profiler()
+
     func, grad, bounds = get_function_by_name(args.function)
-    
+    objective = get_objective(args.function)
+    if args.f_tol is not None and objective.f_min is None:
+        parser.error(f"Funkcija '{args.function}' nema poznat minimum, pa --f_tol nije moguć.")
+
+    if args.basins is not None:
+        initial_points = None
+    elif args.initial_grid is not None:
+        initial_points = make_initial_grid(bounds, *args.initial_grid)
+    elif args.initial_points_file is not None:
+        try:
+            initial_points = load_initial_points(args.initial_points_file)
+        except (OSError, ValueError) as error:
+            parser.error(f"--initial_points_file: {error}")
+    elif args.replicas > 1:
+        initial_points = replicate(args.initial_point, args.replicas)
+    else:
+        initial_points = np.array(args.initial_point, dtype=float)
+
+    criteria = StoppingCriteria(grad_tol=args.grad_tol, step_tol=args.step_tol, f_tol=args.f_tol,
+                                f_min=objective.f_min,
+                                bounds=bounds if args.stop_out_of_bounds else None,
+                                detect_divergence=not args.no_stop_divergence)
+    if not criteria.active:
+        criteria = None
+
+    if args.basins is not None:
+        run_basin_mode(args, objective, criteria, final_output_path)
+        report_profile(profiler, args.trace_json)
+        return
+    if args.lr_range is not None:
+        run_lr_range_mode(args, objective, criteria, final_output_path)
+        report_profile(profiler, args.trace_json)
+        return
+
+    if args.replicas > 1:
+        print(f"Stohastička optimizacija: {args.replicas} replika sa nezavisnim šumom (seme {args.seed})")
+    elif initial_points.ndim == 2:
+        print(f"Paketna optimizacija: {len(initial_points)} početnih tačaka")
+
     paths = {}
+    traces = {}  # Ime -> (koraci, vrednost funkcije po replici), za raspon replika
+    recorded = {}  # Ime -> redni brojevi zabeleženih koraka, za --export i oznaku iteracije u animaciji
 
     print("--- Pokretanje optimizacije ---")
     optimizer_kwargs = {'beta1': args.beta1, 'beta2': args.beta2}
 
-    for optimizer_name in args.optimizers:
-        print(f"Izvršavam {optimizer_name.upper()}...")
-        optimizer = get_optimizer_by_name(optimizer_name, args.learning_rate, **optimizer_kwargs)
-        optimizer.register_parameters(args.initial_point)
-        
-        for i in range(args.iterations):
-            current_params = optimizer.params
-            gradient = grad(current_params[0], current_params[1])
-            optimizer.step(gradient)
-            
-        paths[optimizer_name] = optimizer.get_history()
+    if args.sweep:
+        grid = parse_sweep_spec(args.sweep)
+        with profiler.phase('sweep'):
+            sweep_result = run_sweep(args.optimizers, args.function, initial_points, args.iterations, grid,
+                                     base_params={'learning_rate': args.learning_rate, **optimizer_kwargs},
+                                     workers=args.workers, chunksize=args.chunksize,
+                                     points_per_job=args.points_per_job, record_every=args.record_every or None)
+        sweep_output_path = os.path.splitext(final_output_path)[0] + '_sweep.npz'
+        sweep_result.save(sweep_output_path)
+        print(f"Rezultati pretrage ({sweep_result.n_cells} kombinacija) sačuvani u '{sweep_output_path}'")
+
+        # Za crtanje uzimamo najbolju kombinaciju hiperparametara za svaki optimizator
+        for optimizer_name in args.optimizers:
+            best = sweep_result.best_cell(optimizer_name)
+            best_params = ', '.join(f"{k}={v:.4g}" for k, v in sweep_result.cells[optimizer_name][best].items())
+            print(f"{optimizer_name.upper()}: najbolja kombinacija {best_params or '(bez hiperparametara iz pretrage)'}")
+            paths[optimizer_name] = sweep_result.histories[optimizer_name][best]
+            recorded[optimizer_name] = recorded_steps(len(paths[optimizer_name]), args.record_every or None,
+                                                      args.iterations)
+    elif args.stream is not None:
+        paths, recorded = run_streaming(args, objective, initial_points, criteria, optimizer_kwargs, final_output_path)
+    else:
+        store = ResultStore(args.store) if args.store else None
+        for optimizer_name in args.optimizers:
+            noise = create_noise(args, objective)
+            if store is not None:
+                config = run_config(optimizer_name, objective, {'learning_rate': args.learning_rate, **optimizer_kwargs},
+                                    initial_points, args.iterations, args.record_every or None, criteria,
+                                    args.lr_schedule, noise.config() if noise else None)
+                key = config_key(config)
+                stored = store.get(key)
+                if stored is not None:
+                    print(f"{optimizer_name.upper()}: učitano iz skladišta ({key})")
+                    print(f"  {stored.entry['summary']}")
+                    paths[optimizer_name] = stored.path
+                    recorded[optimizer_name] = stored.steps
+                    traces[optimizer_name] = (stored.steps, stored.loss)
+                    continue
+
+            print(f"Izvršavam {optimizer_name.upper()}...")
+            optimizer = get_optimizer_by_name(optimizer_name, args.learning_rate, **optimizer_kwargs)
+            if args.lr_schedule:
+                optimizer.set_schedule(make_schedule(args.lr_schedule, args.iterations))
+            with profiler.phase(f'optimize/{optimizer_name}', iterations=args.iterations):
+                result = optimize(optimizer, grad, initial_points, args.iterations,
+                                  record_every=args.record_every or None, criteria=criteria, func=func, noise=noise)
+            print(f"  {result.summary()}")
+            paths[optimizer_name] = result.history
+            steps = recorded_steps(len(result.history), args.record_every or None, optimizer.history.steps)
+            recorded[optimizer_name] = steps
+            if args.replicas > 1 and store is None:
+                with np.errstate(all='ignore'):
+                    loss = objective.value(result.history)
+                traces[optimizer_name] = (steps, loss)
+
+            if store is not None:
+                loss, grad_norm = trajectory_traces(objective, result.history)
+                store.put(key, config, {'path': result.history, 'steps': steps, 'loss': loss, 'grad_norm': grad_norm},
+                          summary=result.summary())
+                traces[optimizer_name] = (steps, loss)
+                print(f"  sačuvano u skladište ({key})")
 
     print("--- Optimizacija završena ---")
     
     title = f"Optimizatori na funkciji '{args.function}'\nLR={args.learning_rate}, Iteracije={args.iterations}"
+    if args.lr_schedule:
+        title += f", raspored {args.lr_schedule}"
+    if args.noise:
+        title += f", {create_noise(args, objective).describe()}"
+    if args.sweep:
+        title = f"Optimizatori na funkciji '{args.function}' (najbolje kombinacije iz pretrage)\nIteracije={args.iterations}"
     
-    if final_output_path.lower().endswith('.png'):
-        print(f"Generišem statičnu sliku: {final_output_path}")
-        plot_optimization_path(func, paths, bounds, title, final_output_path)
-        
-    elif final_output_path.lower().endswith(('.gif', '.mp4')):
-        if len(args.optimizers) > 1:
-            print("Upozorenje: Animacija se može generisati samo za jednog optimizatora.")
-            print(f"Koristim prvi navedeni: {args.optimizers[0].upper()}")
-        
-        first_optimizer_name = args.optimizers[0]
-        path_to_animate = paths[first_optimizer_name]
-        
-        anim_title = f"{first_optimizer_name.upper()} na funkciji '{args.function}'\nLR={args.learning_rate}, Iteracije={args.iterations}"
-        
-        print(f"Generišem animaciju: {final_output_path}")
-        create_animation(func, path_to_animate, bounds, anim_title, final_output_path)
-        
-    else:
-        print("Greška: Podržane ekstenzije za izlazni fajl su .png, .gif, .mp4")
+    if args.export:
+        export_path = os.path.join(RESULTS_DIR, os.path.basename(args.export))
+        export_trajectories(export_path, args.function, paths, recorded)
+        print(f"Putanje sačuvane u '{export_path}'")
+    if args.no_plot:
+        report_profile(profiler, args.trace_json)
+        return
+
+    render_output(objective, paths, title, final_output_path, layout=args.layout,
+                  max_frames=args.max_frames, fps=args.fps, steps=recorded)
+    if args.replicas > 1:
+        from visualizations import plot_bands
+        bands = {name: (steps, trajectory_bands(loss)) for name, (steps, loss) in traces.items()}
+        plot_bands(bands, f"{title}\nraspon po {args.replicas} replika", os.path.splitext(final_output_path)[0] + '_bands.png',
+                   f_min=objective.f_min)
+
+    report_profile(profiler, args.trace_json)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,49 +1,187 @@
 # optimizers.py
 import numpy as np
 
+from trajectory import TrajectoryBuffer
+
 class BaseOptimizer:
     """Osnovna klasa za sve optimizatore."""
+    # Imena nizova stanja (istog oblika kao parametri) koje podklase održavaju
+    state_names = ()
+    # Imena pomoćnih bafera (istog oblika kao parametri) u koje korak upisuje međurezultate
+    scratch_names = ()
+
     def __init__(self, learning_rate=0.01):
+        self.learning_rate = learning_rate
         self.lr = learning_rate
-        self.params_history = []
+        self.history = TrajectoryBuffer()
         self.params = None
-
-    def register_parameters(self, params):
-        """Prima početne parametre i čuva ih u istoriji."""
+        self.active_indices = None # Indeksi aktivnih tačaka paketa (None = sve su aktivne)
+        self._frozen = None
+        self.base_lr = learning_rate
+        self.lr_factors = None # Unapred izračunati množioci stope učenja (None = konstantna stopa)
+        self.iteration = 0
+
+    def register_parameters(self, params, iterations=None, record_every=1):
+        """
+        Prima početne parametre i čuva ih u istoriji.
+
+        Parametri mogu biti jedna tačka oblika (2,) ili paket tačaka oblika (N, 2);
+        sva stanja optimizatora (momenti, akumulatori) dobijaju isti oblik, pa se
+        jedan korak izvršava kao jedan NumPy izraz nad svim početnim tačkama.
+
+        Ako je poznat broj iteracija, bafer istorije se alocira unapred;
+        `record_every` određuje svaki koliki korak se beleži (None = samo
+        početna i krajnja tačka).
+        """
         self.params = np.array(params, dtype=float)
-        self.params_history.append(self.params.copy())
+        self.history = TrajectoryBuffer(iterations, record_every)
+        self.history.reset(self.params)
+        self.active_indices = None
+        self._frozen = None
+        self.iteration = 0
+        # Stopa zadata po tački je možda sažeta u prethodnom pokretanju
+        self.lr = self.base_lr = self.learning_rate
+        self._allocate_scratch()
+        self._precompute(iterations or 64)
+
+    def _allocate_scratch(self):
+        for name in self.scratch_names:
+            setattr(self, name, np.empty_like(self.params))
+
+    def _precompute(self, steps):
+        """
+        Računa unapred skalare koji zavise samo od rednog broja koraka (npr. korekcije
+        pristrasnosti) za korake 1..steps. Podklase ga proširuju kada im korak pređe `steps`.
+        """
+
+    def set_schedule(self, factors):
+        """
+        Zadaje raspored stope učenja kao niz množilaca (npr. iz `schedulers.make_schedule`).
+
+        U koraku t stopa učenja je `base_lr * factors[t]` (poslednji množilac važi i
+        posle kraja niza). Stopa može biti i niz oblika (N, 1), po jedna za svaku
+        tačku paketa.
+        """
+        self.base_lr = self.lr = self.learning_rate
+        self.lr_factors = np.asarray(factors, dtype=float)
 
     def step(self, gradient):
-        """Izvršava jedan korak optimizacije. Mora biti implementirano u podklasama."""
+        """
+        Izvršava jedan korak optimizacije i beleži ga u istoriju.
+
+        Posle `deactivate` gradijent se zadaje samo za aktivne tačke paketa.
+        """
+        self.update(gradient)
+        self.record()
+
+    def update(self, gradient):
+        """Izvršava jedan korak bez beleženja u istoriju (`step` = `update` + `record`)."""
+        if self.lr_factors is not None:
+            self.lr = self.base_lr * self.lr_factors[min(self.iteration, len(self.lr_factors) - 1)]
+        self.iteration += 1
+        self._update(gradient)
+
+    def record(self):
+        """Beleži trenutne parametre u istoriju."""
+        tracked = self._tracked_params()
+        if self.active_indices is not None:
+            # Zaustavljene tačke zadržavaju poslednju vrednost u istoriji
+            self._frozen[self.active_indices] = tracked
+            tracked = self._frozen
+        self.history.append(tracked)
+
+    def deactivate(self, finished):
+        """
+        Isključuje tačke paketa koje su završile (konvergirale ili divergirale).
+
+        Parametri i sva stanja se sažimaju na preostale aktivne tačke, pa
+        zaustavljene tačke više ne troše računanje; u istoriji ostaju zamrznute.
+
+        Args:
+            finished (np.array): Bool maska dužine broja trenutno aktivnih tačaka.
+        """
+        if self.params.ndim < 2:
+            raise ValueError("Isključivanje tačaka je moguće samo za paket tačaka oblika (N, 2).")
+        if self.active_indices is None:
+            self._frozen = self._tracked_params().copy()
+            self.active_indices = np.arange(len(self.params))
+        # np.take sa indeksima je za nizove oblika (N, 2) višestruko brži od indeksiranja bool maskom
+        keep = np.flatnonzero(~np.asarray(finished, dtype=bool))
+        self.active_indices = self.active_indices[keep]
+        self.params = np.take(self.params, keep, axis=0)
+        for name in self.state_names:
+            setattr(self, name, np.take(getattr(self, name), keep, axis=0))
+        self._allocate_scratch()
+        # Stopa učenja zadata po tački (oblika (N, 1)) se sažima kao i stanja
+        for name in ('lr', 'base_lr'):
+            if np.ndim(getattr(self, name)) == 2:
+                setattr(self, name, np.take(getattr(self, name), keep, axis=0))
+
+    def _update(self, gradient):
+        """Ažurira parametre na osnovu gradijenta. Mora biti implementirano u podklasama."""
         raise NotImplementedError
 
+    def _tracked_params(self):
+        """Parametri koji se beleže u istoriju (podklase mogu beležiti npr. prosek)."""
+        return self.params
+
     def get_history(self):
-        """Vraća istoriju kretanja parametara."""
-        return np.array(self.params_history)
+        """
+        Vraća istoriju kretanja parametara, oblika (T, 2) ili (T, N, 2) za paket tačaka.
+
+        Rezultat je pogled na bafer istorije, a ne nova kopija.
+        """
+        return self.history.view()
 
 # --- Implementacije konkretnih optimizatora ---
+#
+# Koraci se izvršavaju u mestu: stanja i parametri se menjaju ufunc-ovima sa `out=`,
+# a međurezultati se upisuju u unapred alocirane bafere (`scratch_names`). Redosled
+# operacija je isti kao u matematičkom zapisu u komentarima, pa su rezultati bit po
+# bit jednaki izračunavanju sa privremenim nizovima.
+
+def _bias_corrections(beta, steps):
+    """1 - beta^t za t = 1..steps (isti izraz kao u pojedinačnom koraku)."""
+    return np.array([1 - beta**t for t in range(1, steps + 1)])
+
 
 class SGD(BaseOptimizer):
-    def step(self, gradient):
-        self.params -= self.lr * gradient
-        self.params_history.append(self.params.copy())
+    scratch_names = ('_a',)
+
+    def _update(self, gradient):
+        # params -= lr * g
+        np.multiply(gradient, self.lr, out=self._a)
+        self.params -= self._a
 
 class Adagrad(BaseOptimizer):
+    state_names = ('g_squared',)
+    scratch_names = ('_a', '_b')
+
     def __init__(self, learning_rate=0.01, epsilon=1e-8):
         super().__init__(learning_rate)
         self.epsilon = epsilon
         self.g_squared = None
 
-    def register_parameters(self, params):
-        super().register_parameters(params)
+    def register_parameters(self, params, **history_options):
+        super().register_parameters(params, **history_options)
         self.g_squared = np.zeros_like(self.params)
 
-    def step(self, gradient):
-        self.g_squared += gradient**2
-        self.params -= self.lr * gradient / (np.sqrt(self.g_squared) + self.epsilon)
-        self.params_history.append(self.params.copy())
+    def _update(self, gradient):
+        a, b = self._a, self._b
+        # g_squared += g^2
+        np.square(gradient, out=a)
+        self.g_squared += a
+        # params -= lr * g / (sqrt(g_squared) + eps)
+        np.multiply(gradient, self.lr, out=a)
+        np.sqrt(self.g_squared, out=b)
+        b += self.epsilon
+        a /= b
+        self.params -= a
 
 class Adadelta(BaseOptimizer):
+    state_names = ('avg_sq_grad', 'avg_sq_update')
+    scratch_names = ('_a', '_b')
+
     def __init__(self, learning_rate=1.0, rho=0.9, epsilon=1e-6):
         super().__init__(learning_rate) # Note: Adadelta nema eksplicitni learning rate, ali ga zadržavamo radi konzistentnosti
         self.rho = rho
@@ -51,169 +189,276 @@ class Adadelta(BaseOptimizer):
         self.avg_sq_grad = None
         self.avg_sq_update = None
 
-    def register_parameters(self, params):
-        super().register_parameters(params)
+    def register_parameters(self, params, **history_options):
+        super().register_parameters(params, **history_options)
         self.avg_sq_grad = np.zeros_like(self.params)
         self.avg_sq_update = np.zeros_like(self.params)
 
-    def step(self, gradient):
-        self.avg_sq_grad = self.rho * self.avg_sq_grad + (1 - self.rho) * gradient**2
-        
-        update = - (np.sqrt(self.avg_sq_update + self.epsilon) / np.sqrt(self.avg_sq_grad + self.epsilon)) * gradient
-        
-        self.avg_sq_update = self.rho * self.avg_sq_update + (1 - self.rho) * update**2
-        
-        self.params += self.lr * update # lr je ovde obično 1.0
-        self.params_history.append(self.params.copy())
+    def _update(self, gradient):
+        update, b = self._a, self._b
+        # avg_sq_grad = rho * avg_sq_grad + (1 - rho) * g^2
+        self.avg_sq_grad *= self.rho
+        np.square(gradient, out=b)
+        b *= 1 - self.rho
+        self.avg_sq_grad += b
+
+        # update = -(sqrt(avg_sq_update + eps) / sqrt(avg_sq_grad + eps)) * g
+        np.add(self.avg_sq_update, self.epsilon, out=update)
+        np.sqrt(update, out=update)
+        np.add(self.avg_sq_grad, self.epsilon, out=b)
+        np.sqrt(b, out=b)
+        update /= b
+        np.negative(update, out=update)
+        update *= gradient
+
+        # avg_sq_update = rho * avg_sq_update + (1 - rho) * update^2
+        self.avg_sq_update *= self.rho
+        np.square(update, out=b)
+        b *= 1 - self.rho
+        self.avg_sq_update += b
+
+        # params += lr * update (lr je ovde obično 1.0)
+        update *= self.lr
+        self.params += update
 
 class RMSprop(BaseOptimizer):
+    state_names = ('avg_sq_grad',)
+    scratch_names = ('_a', '_b')
+
     def __init__(self, learning_rate=0.01, alpha=0.99, epsilon=1e-8):
         super().__init__(learning_rate)
         self.alpha = alpha
         self.epsilon = epsilon
         self.avg_sq_grad = None
 
-    def register_parameters(self, params):
-        super().register_parameters(params)
+    def register_parameters(self, params, **history_options):
+        super().register_parameters(params, **history_options)
         self.avg_sq_grad = np.zeros_like(self.params)
 
-    def step(self, gradient):
-        self.avg_sq_grad = self.alpha * self.avg_sq_grad + (1 - self.alpha) * gradient**2
-        self.params -= self.lr * gradient / (np.sqrt(self.avg_sq_grad) + self.epsilon)
-        self.params_history.append(self.params.copy())
+    def _update(self, gradient):
+        a, b = self._a, self._b
+        # avg_sq_grad = alpha * avg_sq_grad + (1 - alpha) * g^2
+        self.avg_sq_grad *= self.alpha
+        np.square(gradient, out=a)
+        a *= 1 - self.alpha
+        self.avg_sq_grad += a
+        # params -= lr * g / (sqrt(avg_sq_grad) + eps)
+        np.multiply(gradient, self.lr, out=a)
+        np.sqrt(self.avg_sq_grad, out=b)
+        b += self.epsilon
+        a /= b
+        self.params -= a
 
 class Adam(BaseOptimizer):
+    state_names = ('m', 'v')
+    scratch_names = ('_a', '_b')
+
     def __init__(self, learning_rate=0.001, beta1=0.9, beta2=0.999, epsilon=1e-8):
         super().__init__(learning_rate)
         self.beta1, self.beta2, self.epsilon = beta1, beta2, epsilon
         self.m, self.v, self.t = None, None, 0
 
-    def register_parameters(self, params):
-        super().register_parameters(params)
+    def register_parameters(self, params, **history_options):
+        super().register_parameters(params, **history_options)
         self.m = np.zeros_like(self.params)
         self.v = np.zeros_like(self.params)
 
-    def step(self, gradient):
+    def _precompute(self, steps):
+        # Brojač koraka se ne vraća na nulu pri ponovnoj registraciji, pa tabela pokriva i ranije korake
+        steps = max(steps, self.t + 1)
+        self._bias1 = _bias_corrections(self.beta1, steps)
+        self._bias2 = _bias_corrections(self.beta2, steps)
+
+    def _moments(self, gradient):
+        """Povećava brojač koraka i ažurira prvi i drugi moment u mestu."""
         self.t += 1
-        self.m = self.beta1 * self.m + (1 - self.beta1) * gradient
-        self.v = self.beta2 * self.v + (1 - self.beta2) * (gradient**2)
-        
-        m_hat = self.m / (1 - self.beta1**self.t)
-        v_hat = self.v / (1 - self.beta2**self.t)
-        
-        self.params -= self.lr * m_hat / (np.sqrt(v_hat) + self.epsilon)
-        self.params_history.append(self.params.copy())
+        if self.t > len(self._bias1):
+            self._precompute(2 * self.t)
+        b = self._b
+        # m = beta1 * m + (1 - beta1) * g
+        self.m *= self.beta1
+        np.multiply(gradient, 1 - self.beta1, out=b)
+        self.m += b
+        # v = beta2 * v + (1 - beta2) * g^2
+        self.v *= self.beta2
+        np.square(gradient, out=b)
+        b *= 1 - self.beta2
+        self.v += b
+
+    def _denominator(self, out):
+        """sqrt(v_hat) + eps, gde je v_hat = v / (1 - beta2^t)."""
+        np.divide(self.v, self._bias2[self.t - 1], out=out)
+        np.sqrt(out, out=out)
+        out += self.epsilon
+        return out
+
+    def _update(self, gradient):
+        self._moments(gradient)
+        # params -= lr * m_hat / (sqrt(v_hat) + eps), m_hat = m / (1 - beta1^t)
+        step = np.divide(self.m, self._bias1[self.t - 1], out=self._a)
+        step *= self.lr
+        step /= self._denominator(self._b)
+        self.params -= step
 
 class AdamW(Adam):
     def __init__(self, learning_rate=0.001, beta1=0.9, beta2=0.999, epsilon=1e-8, weight_decay=0.01):
         super().__init__(learning_rate, beta1, beta2, epsilon)
         self.weight_decay = weight_decay
 
-    def step(self, gradient):
+    def _update(self, gradient):
         # Prvo primenjuje regularni Adam korak
-        super().step(gradient)
-        # Zatim primenjuje weight decay direktno na parametre
-        self.params -= self.lr * self.weight_decay * self.params
-        # Ažuriramo poslednji unos u istoriji da reflektuje decay
-        self.params_history[-1] = self.params.copy()
+        super()._update(gradient)
+        # Zatim primenjuje weight decay direktno na parametre (istorija se beleži tek posle toga)
+        np.multiply(self.params, self.lr * self.weight_decay, out=self._a)
+        self.params -= self._a
 
 class Adamax(BaseOptimizer):
+    state_names = ('m', 'u')
+    scratch_names = ('_a', '_b')
+
     def __init__(self, learning_rate=0.002, beta1=0.9, beta2=0.999, epsilon=1e-8):
         super().__init__(learning_rate)
         self.beta1, self.beta2, self.epsilon = beta1, beta2, epsilon
         self.m, self.u, self.t = None, None, 0
 
-    def register_parameters(self, params):
-        super().register_parameters(params)
+    def register_parameters(self, params, **history_options):
+        super().register_parameters(params, **history_options)
         self.m = np.zeros_like(self.params)
         self.u = np.zeros_like(self.params)
 
-    def step(self, gradient):
+    def _precompute(self, steps):
+        self._bias1 = _bias_corrections(self.beta1, max(steps, self.t + 1))
+
+    def _update(self, gradient):
         self.t += 1
-        self.m = self.beta1 * self.m + (1 - self.beta1) * gradient
-        self.u = np.maximum(self.beta2 * self.u, np.abs(gradient))
-        
-        alpha = self.lr / (1 - self.beta1**self.t)
-        self.params -= alpha * self.m / (self.u + self.epsilon)
-        self.params_history.append(self.params.copy())
+        if self.t > len(self._bias1):
+            self._precompute(2 * self.t)
+        a, b = self._a, self._b
+        # m = beta1 * m + (1 - beta1) * g
+        self.m *= self.beta1
+        np.multiply(gradient, 1 - self.beta1, out=a)
+        self.m += a
+        # u = max(beta2 * u, |g|)
+        self.u *= self.beta2
+        np.abs(gradient, out=a)
+        np.maximum(self.u, a, out=self.u)
+
+        # params -= alpha * m / (u + eps), alpha = lr / (1 - beta1^t)
+        alpha = self.lr / self._bias1[self.t - 1]
+        np.multiply(self.m, alpha, out=a)
+        np.add(self.u, self.epsilon, out=b)
+        a /= b
+        self.params -= a
 
 class Nadam(Adam):
-    def step(self, gradient):
-        self.t += 1
-        self.m = self.beta1 * self.m + (1 - self.beta1) * gradient
-        self.v = self.beta2 * self.v + (1 - self.beta2) * (gradient**2)
-        
-        m_hat = self.m / (1 - self.beta1**self.t)
-        v_hat = self.v / (1 - self.beta2**self.t)
-        
-        # Nesterov momentum deo
-        m_nesterov = (self.beta1 * m_hat + (1 - self.beta1) * gradient / (1 - self.beta1**self.t))
-        
-        self.params -= self.lr * m_nesterov / (np.sqrt(v_hat) + self.epsilon)
-        self.params_history.append(self.params.copy())
+    def _update(self, gradient):
+        self._moments(gradient)
+        bias1 = self._bias1[self.t - 1]
+        a, b = self._a, self._b
+
+        # Nesterov momentum deo: m_nesterov = beta1 * m_hat + (1 - beta1) * g / (1 - beta1^t)
+        np.divide(self.m, bias1, out=a)
+        a *= self.beta1
+        np.multiply(gradient, 1 - self.beta1, out=b)
+        b /= bias1
+        a += b
+
+        # params -= lr * m_nesterov / (sqrt(v_hat) + eps)
+        a *= self.lr
+        a /= self._denominator(b)
+        self.params -= a
 
 class RAdam(Adam):
-    def step(self, gradient):
-        self.t += 1
-        self.m = self.beta1 * self.m + (1 - self.beta1) * gradient
-        self.v = self.beta2 * self.v + (1 - self.beta2) * (gradient**2)
-
-        m_hat = self.m / (1 - self.beta1**self.t)
-        
+    def _precompute(self, steps):
+        super()._precompute(steps)
+        steps = len(self._bias1)
+        # rho_t i faktor rektifikacije r_t (0 za korake bez rektifikacije, rho_t <= 5); stepeni
+        # beta2^t se računaju kao u pojedinačnom koraku, a ostatak izraza nad celim nizom
         rho_inf = 2 / (1 - self.beta2) - 1
-        rho_t = rho_inf - 2 * self.t * (self.beta2**self.t) / (1 - self.beta2**self.t)
-
-        if rho_t > 5.0: # Prag za rektifikaciju
-            v_hat = self.v / (1 - self.beta2**self.t)
-            r_t = np.sqrt((rho_t - 4) * (rho_t - 2) * rho_inf / ((rho_inf - 4) * (rho_inf - 2) * rho_t))
-            self.params -= self.lr * r_t * m_hat / (np.sqrt(v_hat) + self.epsilon)
+        t = np.arange(1, steps + 1)
+        power = np.array([self.beta2**k for k in range(1, steps + 1)])
+        rho_t = rho_inf - 2 * t * power / (1 - power)
+        rectified = rho_t > 5.0 # Prag za rektifikaciju
+        rho_t = rho_t[rectified]
+        rectify = np.zeros(steps)
+        rectify[rectified] = np.sqrt((rho_t - 4) * (rho_t - 2) * rho_inf / ((rho_inf - 4) * (rho_inf - 2) * rho_t))
+        # Lista Python brojeva: čitanje jednog elementa je jeftinije nego iz NumPy niza
+        self._rectify = rectify.tolist()
+
+    def _update(self, gradient):
+        self._moments(gradient)
+        r_t = self._rectify[self.t - 1]
+        # m_hat = m / (1 - beta1^t)
+        step = np.divide(self.m, self._bias1[self.t - 1], out=self._a)
+
+        if r_t:
+            # params -= lr * r_t * m_hat / (sqrt(v_hat) + eps)
+            step *= self.lr * r_t
+            step /= self._denominator(self._b)
         else:
-            self.params -= self.lr * m_hat
-        
-        self.params_history.append(self.params.copy())
+            # params -= lr * m_hat
+            step *= self.lr
+        self.params -= step
 
 class ASGD(BaseOptimizer):
+    state_names = ('ax',)
+    scratch_names = ('_a',)
+
     def __init__(self, learning_rate=0.01):
         super().__init__(learning_rate)
         self.ax = None # Averaged parameters
         self.t = 0
 
-    def register_parameters(self, params):
-        super().register_parameters(params)
+    def register_parameters(self, params, **history_options):
+        super().register_parameters(params, **history_options)
         self.ax = self.params.copy()
-        # Za ASGD, istorija prati prosečne parametre
-        self.params_history = [self.ax.copy()] 
 
-    def step(self, gradient):
+    def _update(self, gradient):
         # Klasičan SGD korak na originalnim parametrima
-        self.params -= self.lr * gradient
+        np.multiply(gradient, self.lr, out=self._a)
+        self.params -= self._a
         self.t += 1
-        # Ažuriranje proseka (running average)
-        self.ax = (self.ax * (self.t - 1) + self.params) / self.t
-        # U istoriju beležimo putanju prosečnih parametara
-        self.params_history.append(self.ax.copy())
+        # Ažuriranje proseka (running average): ax = (ax * (t - 1) + params) / t
+        self.ax *= self.t - 1
+        self.ax += self.params
+        self.ax /= self.t
+
+    def _tracked_params(self):
+        # Za ASGD, istorija prati putanju prosečnih parametara
+        return self.ax
+
+
+OPTIMIZERS = {
+    'sgd': SGD,
+    'asgd': ASGD,
+    'adagrad': Adagrad,
+    'adadelta': Adadelta,
+    'rmsprop': RMSprop,
+    'adam': Adam,
+    'adamw': AdamW,
+    'adamax': Adamax,
+    'nadam': Nadam,
+    'radam': RAdam
+}
+
+
+def _constructor_parameters(optimizer_class):
+    """Imena parametara konstruktora (bez self), pročitana iz koda funkcije."""
+    code = optimizer_class.__init__.__code__
+    return frozenset(code.co_varnames[1:code.co_argcount + code.co_kwonlyargcount])
+
+
+# Parametri koje prihvata svaki optimizator, određeni jednom pri uvozu modula
+OPTIMIZER_PARAMETERS = {name: _constructor_parameters(cls) for name, cls in OPTIMIZERS.items()}
 
 
 def get_optimizer_by_name(name, learning_rate, **kwargs):
     """Fabrika funkcija za kreiranje optimizatora na osnovu imena."""
-    optimizers = {
-        'sgd': SGD,
-        'asgd': ASGD,
-        'adagrad': Adagrad,
-        'adadelta': Adadelta,
-        'rmsprop': RMSprop,
-        'adam': Adam,
-        'adamw': AdamW,
-        'adamax': Adamax,
-        'nadam': Nadam,
-        'radam': RAdam
-    }
-    optimizer_class = optimizers.get(name.lower())
-    if optimizer_class:
-        # Prosleđuje samo relevantne kwargs za dati optimizator
-        import inspect
-        sig = inspect.signature(optimizer_class.__init__)
-        valid_kwargs = {k: v for k, v in kwargs.items() if k in sig.parameters}
-        return optimizer_class(learning_rate=learning_rate, **valid_kwargs)
-    else:
-        raise ValueError(f"Optimizator '{name}' nije definisan.")
\ No newline at end of file
+    key = name.lower()
+    optimizer_class = OPTIMIZERS.get(key)
+    if optimizer_class is None:
+        raise ValueError(f"Optimizator '{name}' nije definisan.")
+    # Prosleđuje samo relevantne kwargs za dati optimizator
+    parameters = OPTIMIZER_PARAMETERS[key]
+    valid_kwargs = {k: v for k, v in kwargs.items() if k in parameters}
+    return optimizer_class(learning_rate=learning_rate, **valid_kwargs)
@@ -0,0 +1,133 @@
+# profiling.py
+"""
+Merenje vremena po fazama izvršavanja (gradijent, korak optimizatora, beleženje
+istorije, kriterijumi zaustavljanja, konturna mreža, crtanje i čuvanje slika).
+
+Podrazumevani profajler je `NullProfiler` koji ništa ne beleži. Vruće petlje
+(npr. `runner.optimize`) vreme sabiraju u lokalnim promenljivama i profajleru
+ga predaju jednom po pokretanju, pa je cena uključenog profajlera zanemarljiva
+u odnosu na sam korak optimizacije; sa `NullProfiler`-om se vreme i ne meri.
+"""
+import contextlib
+import json
+import os
+import time
+from collections import defaultdict
+
+clock = time.perf_counter
+
+
+class Profiler:
+    """
+    Sakuplja ukupna vremena faza, brojače i (opciono) uzorke trajanja koraka.
+
+    Args:
+        sample_every (int): Beleži trajanje svakog k-tog koraka optimizacije (0 = bez uzoraka).
+    """
+    enabled = True
+
+    def __init__(self, sample_every=0):
+        self.sample_every = sample_every
+        self.start = clock()
+        self.phases = defaultdict(lambda: [0, 0.0])  # ime -> [broj poziva, ukupno sekundi]
+        self.counters = defaultdict(lambda: defaultdict(int))  # oblast -> brojač -> vrednost
+        self.events = []
+
+    def _timestamp(self, t):
+        return (t - self.start) * 1e6
+
+    @contextlib.contextmanager
+    def phase(self, name, **args):
+        """Meri blok koda kao jednu fazu i beleži ga u trace kao događaj."""
+        begin = clock()
+        try:
+            yield
+        finally:
+            end = clock()
+            self.add(name, end - begin)
+            self.events.append({'name': name, 'ph': 'X', 'ts': self._timestamp(begin),
+                                'dur': (end - begin) * 1e6, 'pid': os.getpid(), 'tid': 0, 'args': args})
+
+    def add(self, name, seconds, calls=1):
+        """Dodaje vreme fazi koja je merena van profajlera (npr. zbir po iteracijama)."""
+        entry = self.phases[name]
+        entry[0] += calls
+        entry[1] += seconds
+
+    def count(self, scope, **values):
+        """Uvećava brojače date oblasti, npr. count('adam', steps=100, gradient_calls=100)."""
+        counters = self.counters[scope]
+        for counter, value in values.items():
+            counters[counter] += value
+
+    def samples(self, name, times, durations):
+        """Beleži uzorke trajanja (u sekundama) kao brojač u trace-u."""
+        for t, duration in zip(times, durations):
+            self.events.append({'name': name, 'ph': 'C', 'ts': self._timestamp(t), 'pid': os.getpid(),
+                                'tid': 0, 'args': {'us': duration * 1e6}})
+
+    def summary(self):
+        """Tabela faza i brojača za ispis."""
+        wall = clock() - self.start
+        width = max([len(name) for name in self.phases] + [len('faza')])
+        lines = [f"{'faza':<{width}}  {'poziva':>8}  {'ukupno [ms]':>12}  {'prosečno [us]':>14}  {'udeo':>6}"]
+        for name, (calls, seconds) in sorted(self.phases.items(), key=lambda item: -item[1][1]):
+            per_call = f"{seconds / calls * 1e6:>14.1f}" if calls else f"{'-':>14}"
+            lines.append(f"{name:<{width}}  {calls:>8}  {seconds * 1e3:>12.2f}  "
+                         f"{per_call}  {seconds / wall:>6.1%}")
+        lines.append(f"{'ukupno (zid)':<{width}}  {'':>8}  {wall * 1e3:>12.2f}")
+        for scope, counters in self.counters.items():
+            values = ', '.join(f"{counter}={value}" for counter, value in counters.items())
+            lines.append(f"[{scope}] {values}")
+        return "\n".join(lines)
+
+    def write_trace(self, path):
+        """Čuva događaje u Chrome trace formatu (chrome://tracing, Perfetto) uz zbirne podatke."""
+        data = {
+            'traceEvents': self.events,
+            'displayTimeUnit': 'ms',
+            'otherData': {
+                'phases': {name: {'calls': calls, 'seconds': seconds} for name, (calls, seconds) in self.phases.items()},
+                'counters': {scope: dict(counters) for scope, counters in self.counters.items()},
+            },
+        }
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+
+
+class NullProfiler:
+    """Profajler koji ništa ne beleži (podrazumevan)."""
+    enabled = False
+    sample_every = 0
+
+    def phase(self, name, **args):
+        return contextlib.nullcontext()
+
+    def add(self, name, seconds, calls=1):
+        pass
+
+    def count(self, scope, **values):
+        pass
+
+    def samples(self, name, times, durations):
+        pass
+
+
+_profiler = NullProfiler()
+
+
+def get_profiler():
+    """Vraća trenutno aktivan profajler."""
+    return _profiler
+
+
+def enable_profiling(sample_every=0):
+    """Uključuje merenje i vraća novi profajler."""
+    global _profiler
+    _profiler = Profiler(sample_every)
+    return _profiler
+
+
+def disable_profiling():
+    global _profiler
+    _profiler = NullProfiler()
@@ -0,0 +1,198 @@
+# renderer.py
+import shutil
+import subprocess
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from PIL import Image, GifImagePlugin
+
+from profiling import get_profiler, clock
+
+
+def frame_indices(n_points, max_frames=None):
+    """Indeksi tačaka istorije koje postaju frejmovi (ravnomerno proređeni ako je zadat max_frames)."""
+    if not max_frames or max_frames >= n_points:
+        return np.arange(n_points)
+    return np.unique(np.linspace(0, n_points - 1, max_frames).round().astype(int))
+
+
+class PillowGifWriter:
+    """
+    Piše GIF preko biblioteke Pillow, frejm po frejm direktno u fajl.
+
+    Paleta se određuje jednom (iz frejma sa celom putanjom) i upisuje kao
+    globalna, pa se svaki frejm samo mapira na nju. Od svakog frejma upisuje se
+    samo pravougaonik koji se promenio u odnosu na prethodni, a frejm bez
+    promena samo produžava trajanje prethodnog. U memoriji se drže samo
+    prethodni frejm i frejm koji čeka upis, pa memorija ne raste sa brojem frejmova.
+    (Pillow-ov `save(append_images=...)` čuva sve frejmove do kraja pisanja.)
+    """
+    def __init__(self, output_file, fps):
+        self.output_file = output_file
+        self.duration = int(round(1000 / fps))
+        self._palette = None
+        self._file = None
+        self._previous = None
+        self._pending = None  # [slika, pomeraj, trajanje] frejma koji čeka upis
+
+    def set_palette_frame(self, frame):
+        self._palette = Image.fromarray(frame[..., :3]).quantize(colors=256, method=Image.Quantize.MEDIANCUT)
+
+    def _flush(self):
+        image, offset, duration = self._pending
+        for chunk in GifImagePlugin.getdata(image, offset, duration=duration):
+            self._file.write(chunk)
+
+    def write(self, frame):
+        image = Image.fromarray(frame[..., :3])
+        if self._palette is None:
+            self._palette = image.quantize(colors=256, method=Image.Quantize.MEDIANCUT)
+        image = image.quantize(palette=self._palette, dither=Image.Dither.NONE)
+        pixels = np.asarray(image)
+
+        if self._file is None:
+            header, _ = GifImagePlugin.getheader(image, info={'loop': 0, 'duration': self.duration})
+            self._file = open(self.output_file, 'wb')
+            for chunk in header:
+                self._file.write(chunk)
+            self._pending = [image, (0, 0), self.duration]
+        else:
+            changed = pixels != self._previous
+            rows = np.flatnonzero(changed.any(axis=1))
+            if rows.size == 0:
+                self._pending[2] += self.duration
+            else:
+                cols = np.flatnonzero(changed.any(axis=0))
+                box = (int(cols[0]), int(rows[0]), int(cols[-1]) + 1, int(rows[-1]) + 1)
+                self._flush()
+                self._pending = [image.crop(box), box[:2], self.duration]
+        self._previous = pixels
+
+    def close(self):
+        if self._file is None:
+            return
+        self._flush()
+        self._file.write(b';')  # Kraj GIF fajla
+        self._file.close()
+        self._file = None
+        self._pending = self._previous = None
+
+
+class FFmpegPipeWriter:
+    """Šalje sirove RGBA frejmove direktno u ffmpeg proces (bez privremenih fajlova)."""
+    def __init__(self, output_file, fps, size):
+        ffmpeg = shutil.which('ffmpeg')
+        if ffmpeg is None:
+            raise RuntimeError("ffmpeg nije pronađen u PATH-u.")
+        width, height = size
+        command = [ffmpeg, '-y', '-loglevel', 'error',
+                   '-f', 'rawvideo', '-pix_fmt', 'rgba', '-s', f'{width}x{height}', '-r', str(fps), '-i', '-',
+                   '-vf', 'pad=ceil(iw/2)*2:ceil(ih/2)*2']
+        if output_file.lower().endswith('.mp4'):
+            command += ['-vcodec', 'libx264', '-pix_fmt', 'yuv420p']
+        self._process = subprocess.Popen(command + [output_file], stdin=subprocess.PIPE)
+
+    def set_palette_frame(self, frame):
+        pass
+
+    def write(self, frame):
+        self._process.stdin.write(frame.tobytes())
+
+    def close(self):
+        self._process.stdin.close()
+        if self._process.wait() != 0:
+            raise RuntimeError("ffmpeg je prijavio grešku pri pisanju animacije.")
+
+
+def open_frame_writer(output_file, fps, size):
+    """Bira pisač frejmova na osnovu ekstenzije: .gif preko Pillow-a, ostalo preko ffmpeg-a."""
+    if output_file.lower().endswith('.gif'):
+        return PillowGifWriter(output_file, fps)
+    return FFmpegPipeWriter(output_file, fps, size)
+
+
+class PathAnimationRenderer:
+    """
+    Brzo renderovanje animacije putanja preko statične pozadine.
+
+    Pozadina (konture, ose, colorbar) se rasterizuje samo jednom. Za putanje se
+    u svakom frejmu crta samo novi segment preko sačuvanog platna sa do tada
+    nacrtanim tragom, pa je cena frejma konstantna umesto O(i). Za paket tačaka
+    (putanja oblika (T, N, 2)) crta se samo trenutni oblak tačaka.
+
+    Args:
+        fig (Figure): Figura sa već nacrtanom pozadinom.
+        tracks (list): Lista parova (Line2D, putanja) koji se animiraju.
+        texts (list): Tekstualni elementi koji se osvežavaju u svakom frejmu,
+                      kao parovi (Text, format) gde format prima redni broj koraka.
+        steps (np.array): Redni brojevi koraka tačaka najduže istorije (npr. uz record_every > 1);
+                          None = redni broj koraka je indeks tačke.
+    """
+    def __init__(self, fig, tracks, texts=(), steps=None):
+        self.fig = fig
+        self.steps = steps
+        self.canvas = FigureCanvasAgg(fig)
+        self.tracks = tracks
+        self.texts = list(texts)
+        for artist, _ in self.tracks:
+            artist.set_animated(True)
+        for text, _ in self.texts:
+            text.set_animated(True)
+        self.n_points = max(len(path) for _, path in tracks)
+
+    def _draw_tracks(self, start, stop):
+        """Crta deo [start, stop] svake putanje (ili oblak tačaka u koraku stop)."""
+        for artist, path in self.tracks:
+            last = min(stop, len(path) - 1)
+            if path.ndim == 3:
+                artist.set_data(path[last, :, 0], path[last, :, 1])
+            else:
+                first = min(start, last)
+                artist.set_data(path[first:last + 1, 0], path[first:last + 1, 1])
+            self.fig.draw_artist(artist)
+
+    def _frame(self):
+        return np.asarray(self.canvas.buffer_rgba())
+
+    def render(self, output_file, fps=15, max_frames=None):
+        """Renderuje animaciju u fajl i vraća broj zapisanih frejmova."""
+        with get_profiler().phase('render/setup'):
+            self.canvas.draw()
+            background = self.canvas.copy_from_bbox(self.fig.bbox)
+            writer = open_frame_writer(output_file, fps, self.canvas.get_width_height())
+
+            # Frejm sa celom putanjom služi za određivanje palete GIF-a
+            self._draw_tracks(0, self.n_points - 1)
+            writer.set_palette_frame(self._frame())
+            self.canvas.restore_region(background)
+
+        is_cloud = any(path.ndim == 3 for _, path in self.tracks)
+        trail = background
+        previous = 0
+        indices = frame_indices(self.n_points, max_frames)
+        draw_time = encode_time = 0.0
+        try:
+            for index in indices:
+                t0 = clock()
+                self.canvas.restore_region(background if is_cloud else trail)
+                self._draw_tracks(0 if is_cloud else previous, index)
+                if not is_cloud:
+                    trail = self.canvas.copy_from_bbox(self.fig.bbox)
+                previous = index
+                for text, fmt in self.texts:
+                    text.set_text(fmt.format(index if self.steps is None else self.steps[index]))
+                    self.fig.draw_artist(text)
+                t1 = clock()
+                writer.write(self._frame())
+                draw_time += t1 - t0
+                encode_time += clock() - t1
+        finally:
+            t1 = clock()
+            writer.close()
+            encode_time += clock() - t1
+
+        profiler = get_profiler()
+        profiler.add('render/frames', draw_time, calls=len(indices))
+        profiler.add('render/encode', encode_time, calls=len(indices))
+        profiler.count('render', frames=len(indices))
+        return len(indices)
@@ -0,0 +1,245 @@
+# result_store.py
+import hashlib
+import json
+import os
+import time
+
+import numpy as np
+
+from optimizers import OPTIMIZER_PARAMETERS
+from surface_cache import function_fingerprint
+
+DEFAULT_STORE_DIR = os.path.join("results", "store")
+# Zajednički manifest starijih skladišta; novi zapisi idu u poseban <ključ>.json po pokretanju
+MANIFEST_NAME = "manifest.json"
+# Menja se kada se promeni način računanja putanja, pa stari rezultati više ne važe
+STORE_VERSION = 1
+ARRAY_NAMES = ('path', 'steps', 'loss', 'grad_norm')
+
+
+def run_config(optimizer_name, objective, hyperparams, initial_points, iterations, record_every=1, criteria=None,
+               schedule=None, noise=None):
+    """
+    Opis jednog pokretanja koji jednoznačno određuje njegov rezultat.
+
+    Početne tačke ulaze kao heš (paket može imati milione tačaka), a funkcija
+    cilja kao heš svoje definicije, pa izmena izraza poništava stare rezultate.
+    Ulaze samo hiperparametri koje optimizator prihvata (npr. SGD bez beta1 i
+    beta2), pa ista pokretanja dele isti ključ.
+    """
+    optimizer_name = optimizer_name.lower()
+    accepted = OPTIMIZER_PARAMETERS.get(optimizer_name)
+    points = np.ascontiguousarray(initial_points, dtype=float)
+    config = {
+        'version': STORE_VERSION,
+        'optimizer': optimizer_name,
+        'function': objective.name,
+        'function_hash': function_fingerprint(objective.expression),
+        'hyperparams': {k: float(v) for k, v in sorted(hyperparams.items()) if accepted is None or k in accepted},
+        'initial_points_shape': list(points.shape),
+        'initial_points_hash': hashlib.sha1(points.tobytes()).hexdigest()[:16],
+        'iterations': int(iterations),
+        'record_every': record_every,
+    }
+    if criteria is not None:
+        config['criteria'] = {
+            'grad_tol': criteria.grad_tol, 'step_tol': criteria.step_tol, 'f_tol': criteria.f_tol,
+            'bounds': None if criteria.bounds is None else [float(b) for b in criteria.bounds],
+            'detect_divergence': criteria.detect_divergence, 'check_every': criteria.check_every,
+        }
+    if schedule:
+        config['lr_schedule'] = schedule
+    if noise:
+        config['noise'] = noise
+    if points.ndim == 1:
+        config['initial_point'] = points.tolist()
+    return config
+
+
+def config_key(config):
+    """Heš konfiguracije koji služi kao ključ u skladištu."""
+    return hashlib.sha1(json.dumps(config, sort_keys=True).encode()).hexdigest()[:16]
+
+
+def recorded_steps(n_records, record_every, total_steps):
+    """Redni brojevi koraka zabeleženih tačaka istorije (poslednja je uvek poslednji korak)."""
+    if record_every is None:
+        steps = np.array([0, total_steps])[:n_records]
+    else:
+        steps = np.arange(n_records) * record_every
+    if n_records > 1:
+        steps[-1] = total_steps
+    return steps
+
+
+def trajectory_traces(objective, history):
+    """Vrednost funkcije i norma gradijenta u svakoj zabeleženoj tački, oblika (T,) ili (T, N)."""
+    loss, gradient = objective.value_and_grad(history)
+    return loss, np.linalg.norm(gradient, axis=-1)
+
+
+def export_trajectories(output_file, function_name, paths, steps=None):
+    """
+    Čuva putanje više optimizatora u jedan .npz fajl (bez crtanja).
+
+    Args:
+        output_file (str): Putanja izlaznog .npz fajla.
+        function_name (str): Ime funkcije cilja.
+        paths (dict): Ime optimizatora -> istorija oblika (T, 2) ili (T, N, 2).
+        steps (dict): Ime optimizatora -> redni brojevi zabeleženih koraka (opciono).
+    """
+    arrays = {'optimizer_names': np.array(list(paths)), 'function_name': np.array(function_name)}
+    for name, path in paths.items():
+        arrays[f'path_{name}'] = np.asarray(path)
+        if steps and name in steps:
+            arrays[f'steps_{name}'] = np.asarray(steps[name])
+    np.savez_compressed(output_file, **arrays)
+
+
+class StoredRun:
+    """
+    Jedno sačuvano pokretanje. Nizovi se učitavaju tek pri prvom pristupu,
+    kao memorijski mapirani fajlovi (mmap), pa se ne čitaju celi u memoriju.
+    """
+    def __init__(self, store, key, entry):
+        self.store = store
+        self.key = key
+        self.entry = entry
+        self._arrays = {}
+
+    def _array(self, name):
+        if name not in self._arrays:
+            self._arrays[name] = np.load(self.store._array_path(self.key, name), mmap_mode='r')
+        return self._arrays[name]
+
+    @property
+    def path(self):
+        return self._array('path')
+
+    @property
+    def steps(self):
+        return self._array('steps')
+
+    @property
+    def loss(self):
+        return self._array('loss')
+
+    @property
+    def grad_norm(self):
+        return self._array('grad_norm')
+
+    @property
+    def optimizer(self):
+        return self.entry['config']['optimizer']
+
+    @property
+    def function(self):
+        return self.entry['config']['function']
+
+    def describe(self):
+        config = self.entry['config']
+        params = ', '.join(f"{k}={v:g}" for k, v in config['hyperparams'].items())
+        if 'lr_schedule' in config:
+            params += f", raspored={config['lr_schedule']}"
+        if 'noise' in config:
+            params += f", šum={config['noise']['kind']}({config['noise']['scale']:g})"
+        start = config.get('initial_point', f"{config['initial_points_shape'][0]} tačaka")
+        return (f"{self.key}  {self.optimizer:<8} {self.function:<16} {params}  start={start}  "
+                f"iteracije={config['iterations']}  ({self.entry['summary']})")
+
+
+class ResultStore:
+    """
+    Skladište rezultata pokretanja: po jedan .npy fajl za svaki niz
+    (putanja, koraci, vrednost funkcije, norma gradijenta) i po jedan JSON
+    fajl sa konfiguracijom svakog pokretanja. Ključ je heš konfiguracije, pa
+    ponovljena konfiguracija ne zahteva ponovnu optimizaciju.
+
+    Svaki fajl se upisuje u privremeni fajl i atomski zamenjuje (os.replace),
+    a JSON pokretanja tek posle nizova, pa više procesa može istovremeno da
+    upisuje u isto skladište bez gubljenja tuđih zapisa.
+    """
+    def __init__(self, root=DEFAULT_STORE_DIR):
+        self.root = root
+        self._legacy_manifest = None
+
+    @property
+    def legacy_manifest(self):
+        """Zapisi iz zajedničkog manifest.json starijih skladišta (samo za čitanje)."""
+        if self._legacy_manifest is None:
+            path = os.path.join(self.root, MANIFEST_NAME)
+            if os.path.exists(path):
+                with open(path, encoding='utf-8') as f:
+                    self._legacy_manifest = json.load(f)
+            else:
+                self._legacy_manifest = {}
+        return self._legacy_manifest
+
+    def _array_path(self, key, name):
+        return os.path.join(self.root, f"{key}_{name}.npy")
+
+    def _entry_path(self, key):
+        return os.path.join(self.root, f"{key}.json")
+
+    @staticmethod
+    def _replace(path, write, mode):
+        """Upisuje fajl preko privremenog fajla (jedinstvenog za proces) i atomski ga zamenjuje."""
+        temporary = f"{path}.{os.getpid()}.tmp"
+        with open(temporary, mode, **({} if 'b' in mode else {'encoding': 'utf-8'})) as f:
+            write(f)
+        os.replace(temporary, path)
+
+    def _read_entry(self, key):
+        try:
+            with open(self._entry_path(key), encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return self.legacy_manifest.get(key)
+
+    def keys(self):
+        """Ključevi svih zapisanih pokretanja (čita direktorijum pri svakom pozivu)."""
+        if not os.path.isdir(self.root):
+            return []
+        keys = set(self.legacy_manifest)
+        for filename in os.listdir(self.root):
+            stem, extension = os.path.splitext(filename)
+            if extension == '.json' and filename != MANIFEST_NAME:
+                keys.add(stem)
+        return sorted(keys)
+
+    def get(self, key):
+        """Vraća sačuvano pokretanje ili None ako ga nema (ili su mu fajlovi obrisani)."""
+        entry = self._read_entry(key)
+        if entry is None:
+            return None
+        if not all(os.path.exists(self._array_path(key, name)) for name in ARRAY_NAMES):
+            return None
+        return StoredRun(self, key, entry)
+
+    def put(self, key, config, arrays, summary=''):
+        """Čuva nizove pokretanja (rečnik sa ključevima iz ARRAY_NAMES), a zatim i njegov JSON zapis."""
+        os.makedirs(self.root, exist_ok=True)
+        for name in ARRAY_NAMES:
+            array = np.ascontiguousarray(arrays[name])
+            self._replace(self._array_path(key, name), lambda f: np.save(f, array), 'wb')
+        entry = {'config': config, 'summary': summary, 'created': time.time()}
+        self._replace(self._entry_path(key), lambda f: json.dump(entry, f, indent=1), 'w')
+        return StoredRun(self, key, entry)
+
+    def runs(self, function=None, optimizers=None):
+        """Sačuvana pokretanja (najnovija prva), opciono filtrirana po funkciji i optimizatorima."""
+        if optimizers is not None:
+            optimizers = {name.lower() for name in optimizers}
+        selected = []
+        for key in self.keys():
+            run = self.get(key)
+            if run is None:
+                continue
+            config = run.entry['config']
+            if function is not None and config['function'] != function:
+                continue
+            if optimizers is not None and config['optimizer'] not in optimizers:
+                continue
+            selected.append(run)
+        selected.sort(key=lambda run: -run.entry['created'])
+        return selected
@@ -0,0 +1,337 @@
+# runner.py
+import math
+
+import numpy as np
+
+from functions import evaluate_gradient
+from profiling import get_profiler, clock
+
+
+def make_initial_grid(bounds, nx, ny):
+    """
+    Pravi ravnomernu mrežu početnih tačaka unutar zadatog opsega.
+
+    Args:
+        bounds (list): Opseg [xmin, xmax, ymin, ymax].
+        nx (int): Broj tačaka po x osi.
+        ny (int): Broj tačaka po y osi.
+
+    Returns:
+        np.array: Niz oblika (nx * ny, 2) sa početnim tačkama.
+    """
+    xmin, xmax, ymin, ymax = bounds
+    X, Y = np.meshgrid(np.linspace(xmin, xmax, nx), np.linspace(ymin, ymax, ny))
+    return np.column_stack([X.ravel(), Y.ravel()])
+
+
+def load_initial_points(path):
+    """Učitava početne tačke iz .npy ili tekstualnog fajla (dve kolone: x y)."""
+    if path.lower().endswith('.npy'):
+        points = np.load(path)
+    else:
+        points = np.loadtxt(path, delimiter=',' if path.lower().endswith('.csv') else None)
+    points = np.atleast_2d(np.asarray(points, dtype=float))
+    if points.ndim != 2 or points.shape[1] != 2:
+        raise ValueError(f"Fajl '{path}' mora sadržati niz oblika (N, 2), dobijeno {points.shape}.")
+    return points
+
+
+# Razlozi zaustavljanja; kod 0 znači da je iskorišćen ceo broj iteracija
+STOP_REASONS = ('max_iter', 'grad_tol', 'step_tol', 'f_tol', 'non_finite', 'out_of_bounds')
+MAX_ITER, GRAD_TOL, STEP_TOL, F_TOL, NON_FINITE, OUT_OF_BOUNDS = range(len(STOP_REASONS))
+
+
+class StoppingCriteria:
+    """
+    Kriterijumi za rano zaustavljanje optimizacije.
+
+    Args:
+        grad_tol (float): Zaustavlja tačku kada je norma gradijenta manja od praga.
+        step_tol (float): Zaustavlja tačku kada je dužina koraka manja od praga.
+        f_tol (float): Zaustavlja tačku kada je f(x) - f_min manje od praga.
+        f_min (float): Poznata najmanja vrednost funkcije (potrebna za f_tol).
+        bounds (list): Ako je zadat, tačka koja napusti [xmin, xmax, ymin, ymax] se smatra divergentnom.
+        detect_divergence (bool): Zaustavlja tačke sa NaN/inf vrednostima parametara ili gradijenta.
+        check_every (int): Kriterijumi se proveravaju svakih k iteracija.
+    """
+    def __init__(self, grad_tol=None, step_tol=None, f_tol=None, f_min=None, bounds=None,
+                 detect_divergence=True, check_every=1):
+        if f_tol is not None and f_min is None:
+            raise ValueError("Za f_tol kriterijum mora biti poznata najmanja vrednost funkcije (f_min).")
+        self.grad_tol = grad_tol
+        self.step_tol = step_tol
+        self.f_tol = f_tol
+        self.f_min = f_min
+        self.bounds = bounds
+        self.detect_divergence = detect_divergence
+        self.check_every = max(1, check_every)
+
+    @property
+    def active(self):
+        """Da li je zadat ijedan kriterijum (inače provera nema smisla)."""
+        return (self.detect_divergence or self.bounds is not None
+                or any(tol is not None for tol in (self.grad_tol, self.step_tol, self.f_tol)))
+
+    def check(self, params, gradient, func=None):
+        """
+        Proverava kriterijume pre koraka za tačku oblika (2,) ili tačke oblika (n, 2) i vraća kod
+        razloga po tački (0 = nastavi), ili None kada se nijedna tačka ne zaustavlja.
+        """
+        if self.bounds is None and self.grad_tol is None and self.f_tol is None:
+            # Samo provera divergencije: konačan zbir kvadrata znači da su sve vrednosti konačne, pa se
+            # kodovi po tački računaju tek kada nije (NaN/inf ili prekoračenje). vdot ne izdaje upozorenja.
+            if not self.detect_divergence or math.isfinite(np.vdot(params, params) + np.vdot(gradient, gradient)):
+                return None
+        params, gradient = params.reshape(-1, 2), gradient.reshape(-1, 2)
+        codes = np.zeros(len(params), dtype=np.int8)
+        # Operacije po kolonama: redukcije duž ose dužine 2 su u NumPy-ju višestruko sporije
+        x, y = params[:, 0], params[:, 1]
+        gx, gy = gradient[:, 0], gradient[:, 1]
+        with np.errstate(all='ignore'):
+            if self.detect_divergence:
+                finite = np.isfinite(x) & np.isfinite(y) & np.isfinite(gx) & np.isfinite(gy)
+                codes[~finite] = NON_FINITE
+            if self.bounds is not None:
+                xmin, xmax, ymin, ymax = self.bounds
+                outside = (x < xmin) | (x > xmax) | (y < ymin) | (y > ymax)
+                codes[outside & (codes == 0)] = OUT_OF_BOUNDS
+            if self.grad_tol is not None:
+                small = np.sqrt(gx * gx + gy * gy) < self.grad_tol
+                codes[small & (codes == 0)] = GRAD_TOL
+            if self.f_tol is not None and func is not None:
+                close = func(x, y) - self.f_min <= self.f_tol
+                codes[close & (codes == 0)] = F_TOL
+        return codes if codes.any() else None
+
+    def check_step(self, previous, params):
+        """Proverava dužinu upravo izvršenog koraka; vraća kod razloga po tački."""
+        codes = np.zeros(len(params), dtype=np.int8)
+        if self.step_tol is not None:
+            with np.errstate(all='ignore'):
+                dx, dy = params[:, 0] - previous[:, 0], params[:, 1] - previous[:, 1]
+                codes[np.sqrt(dx * dx + dy * dy) < self.step_tol] = STEP_TOL
+        return codes
+
+
+class OptimizationResult:
+    """Istorija jednog pokretanja i razlog zaustavljanja za svaku početnu tačku."""
+    def __init__(self, history, stop_codes, iterations, is_batch):
+        self.history = history
+        self.stop_codes = stop_codes   # (N,) kodovi iz STOP_REASONS
+        self.iterations = iterations   # (N,) broj izvršenih iteracija po tački
+        self.is_batch = is_batch
+
+    @property
+    def stop_reason(self):
+        """Razlog zaustavljanja (string za jednu tačku, lista stringova za paket)."""
+        reasons = [STOP_REASONS[code] for code in self.stop_codes]
+        return reasons if self.is_batch else reasons[0]
+
+    def reason_counts(self):
+        """Rečnik razlog -> broj tačaka koje su se zaustavile iz tog razloga."""
+        counts = np.bincount(self.stop_codes, minlength=len(STOP_REASONS))
+        return {reason: int(count) for reason, count in zip(STOP_REASONS, counts) if count}
+
+    def summary(self):
+        """Kratak opis zaustavljanja za ispis."""
+        if not self.is_batch:
+            return f"zaustavljen posle {int(self.iterations[0])} iteracija ({self.stop_reason})"
+        counts = ', '.join(f"{reason}: {count}" for reason, count in self.reason_counts().items())
+        return f"prosečno {self.iterations.mean():.1f} iteracija po tački ({counts})"
+
+
+def _check_before_step(criteria, optimizer, gradient, func, active, stop_codes, stop_iterations, t):
+    """
+    Kriterijumi pre koraka t: upisuje razloge zaustavljanja i isključuje zaustavljene tačke.
+
+    Returns:
+        tuple ili None: (aktivni indeksi, gradijent aktivnih tačaka), None kada su se sve tačke zaustavile.
+    """
+    codes = criteria.check(optimizer.params, gradient, func)
+    if codes is None:
+        return active, gradient
+    finished = codes != 0
+    stop_codes[active[finished]] = codes[finished]
+    stop_iterations[active[finished]] = t
+    if finished.all():
+        return None
+    optimizer.deactivate(finished)
+    return active[~finished], np.take(gradient, np.flatnonzero(~finished), axis=0)
+
+
+def _check_after_step(criteria, optimizer, previous, active, stop_codes, stop_iterations, t):
+    """Kriterijum dužine koraka t; vraća preostale aktivne indekse (None kada su se sve tačke zaustavile)."""
+    codes = criteria.check_step(previous.reshape(-1, 2), optimizer.params.reshape(-1, 2))
+    finished = codes != 0
+    if not finished.any():
+        return active
+    stop_codes[active[finished]] = codes[finished]
+    stop_iterations[active[finished]] = t + 1
+    if finished.all():
+        return None
+    optimizer.deactivate(finished)
+    return active[~finished]
+
+
+def iterate_steps(optimizer, grad, iterations, stop_codes, stop_iterations, criteria=None, func=None, noise=None):
+    """
+    Generator koji izvršava iteracije nad već registrovanim parametrima
+    optimizatora i posle svakog koraka vraća njegov redni broj (od 1).
+
+    Za paket tačaka, tačke koje ispune neki od kriterijuma se isključuju iz
+    optimizatora (`BaseOptimizer.deactivate`), pa dalje ne troše računanje
+    gradijenta ni koraka; generator se završava kada se sve tačke zaustave.
+    Razlozi i iteracije zaustavljanja upisuju se u `stop_codes` i
+    `stop_iterations` (nizovi dužine broja tačaka).
+
+    Ako je zadat `noise` (model iz modula `noise`), šum se dodaje gradijentu
+    posle provere kriterijuma, a pre koraka; kriterijumi vide tačan gradijent.
+
+    Vreme faza se meri samo kada je profajler uključen (posebna petlja), pa
+    isključen profajler ne košta ništa po iteraciji.
+    """
+    if noise is not None:
+        noise.reset(len(stop_codes))
+    if get_profiler().enabled:
+        yield from _timed_steps(optimizer, grad, iterations, stop_codes, stop_iterations, criteria, func, noise)
+        return
+
+    active = np.arange(len(stop_codes))
+    gradient_buffer = np.empty_like(optimizer.params)
+    for t in range(iterations):
+        if gradient_buffer.shape != optimizer.params.shape:
+            gradient_buffer = np.empty_like(optimizer.params)
+        gradient = evaluate_gradient(grad, optimizer.params, out=gradient_buffer)
+        checking = criteria is not None and t % criteria.check_every == 0
+        if checking:
+            state = _check_before_step(criteria, optimizer, gradient, func, active, stop_codes, stop_iterations, t)
+            if state is None:
+                return
+            active, gradient = state
+            if criteria.step_tol is not None:
+                previous = optimizer.params.copy()
+        if noise is not None:
+            noise.perturb(gradient, optimizer.params, active)
+
+        optimizer.step(gradient)
+
+        if checking and criteria.step_tol is not None:
+            active = _check_after_step(criteria, optimizer, previous, active, stop_codes, stop_iterations, t)
+            if active is None:
+                yield t + 1
+                return
+        yield t + 1
+
+
+def _timed_steps(optimizer, grad, iterations, stop_codes, stop_iterations, criteria, func, noise):
+    """Isto kao petlja u `iterate_steps`, uz merenje vremena faza za uključen profajler."""
+    profiler = get_profiler()
+    active = np.arange(len(stop_codes))
+    gradient_buffer = np.empty_like(optimizer.params)
+
+    # Vremena faza se sabiraju lokalno i predaju profajleru jednom, na kraju
+    gradient_time = step_time = record_time = 0.0
+    gradient_calls = gradient_points = steps = 0
+    sample_every = profiler.sample_every
+    sample_times, sample_durations = [], []
+    loop_start = clock()
+
+    try:
+        for t in range(iterations):
+            if gradient_buffer.shape != optimizer.params.shape:
+                gradient_buffer = np.empty_like(optimizer.params)
+            t0 = clock()
+            gradient = evaluate_gradient(grad, optimizer.params, out=gradient_buffer)
+            gradient_time += clock() - t0
+            gradient_calls += 1
+            gradient_points += len(active)
+            checking = criteria is not None and t % criteria.check_every == 0
+            if checking:
+                state = _check_before_step(criteria, optimizer, gradient, func, active, stop_codes, stop_iterations, t)
+                if state is None:
+                    return
+                active, gradient = state
+                if criteria.step_tol is not None:
+                    previous = optimizer.params.copy()
+            if noise is not None:
+                t0 = clock()
+                noise.perturb(gradient, optimizer.params, active)
+                gradient_time += clock() - t0
+
+            t0 = clock()
+            optimizer.update(gradient)
+            t1 = clock()
+            optimizer.record()
+            record_time += clock() - t1
+            step_time += t1 - t0
+            steps += 1
+            if sample_every and t % sample_every == 0:
+                sample_times.append(t0)
+                sample_durations.append(t1 - t0)
+
+            if checking and criteria.step_tol is not None:
+                active = _check_after_step(criteria, optimizer, previous, active, stop_codes, stop_iterations, t)
+                if active is None:
+                    yield t + 1
+                    return
+            yield t + 1
+    finally:
+        scope = type(optimizer).__name__.lower()
+        # Faze bez ijednog poziva (npr. tačka zaustavljena pre prvog koraka) se ne beleže
+        if gradient_calls:
+            profiler.add(f"{scope}/gradient", gradient_time, calls=gradient_calls)
+        if steps:
+            profiler.add(f"{scope}/step", step_time, calls=steps)
+            profiler.add(f"{scope}/history", record_time, calls=steps)
+        # Ostatak petlje: kriterijumi zaustavljanja, isključivanje tačaka i sama petlja
+        profiler.add(f"{scope}/stopping", clock() - loop_start - gradient_time - step_time - record_time,
+                     calls=max(steps, 1))
+        profiler.count(scope, steps=steps, gradient_calls=gradient_calls, gradient_points=gradient_points,
+                       history_bytes=optimizer.history.nbytes)
+        profiler.samples(f"{scope} step", sample_times, sample_durations)
+
+
+def optimize(optimizer, grad, initial_points, iterations, record_every=1, criteria=None, func=None, noise=None):
+    """
+    Pokreće optimizator iz jedne ili više početnih tačaka uz opciono rano zaustavljanje.
+
+    Args:
+        optimizer (BaseOptimizer): Instanca optimizatora.
+        grad (callable): Gradijent funkcije cilja, prihvata x i y.
+        initial_points (array-like): Jedna tačka oblika (2,) ili paket tačaka oblika (N, 2).
+        iterations (int): Najveći broj iteracija.
+        record_every (int ili None): Beleži se svaki k-ti korak; None = samo početna i krajnja tačka.
+        criteria (StoppingCriteria): Kriterijumi zaustavljanja (None = uvek sve iteracije).
+        func (callable): Funkcija cilja, potrebna samo za f_tol kriterijum.
+        noise (GradientNoise): Šum koji se dodaje gradijentu (None = tačan gradijent).
+
+    Returns:
+        OptimizationResult: Istorija, razlozi zaustavljanja i broj iteracija po tački.
+    """
+    optimizer.register_parameters(initial_points, iterations=iterations, record_every=record_every)
+    is_batch = optimizer.params.ndim == 2
+    n_points = len(optimizer.params) if is_batch else 1
+    stop_codes = np.zeros(n_points, dtype=np.int8)
+    stop_iterations = np.full(n_points, iterations)
+
+    for _ in iterate_steps(optimizer, grad, iterations, stop_codes, stop_iterations, criteria, func, noise):
+        pass
+
+    return OptimizationResult(optimizer.get_history(), stop_codes, stop_iterations, is_batch)
+
+
+def run_optimizer(optimizer, grad, initial_points, iterations, record_every=1):
+    """
+    Pokreće optimizator iz jedne ili više početnih tačaka istovremeno.
+
+    Args:
+        optimizer (BaseOptimizer): Instanca optimizatora.
+        grad (callable): Gradijent funkcije cilja, prihvata x i y.
+        initial_points (array-like): Jedna tačka oblika (2,) ili paket tačaka oblika (N, 2).
+        iterations (int): Broj iteracija.
+        record_every (int ili None): Beleži se svaki k-ti korak; None = samo početna i krajnja tačka.
+
+    Returns:
+        np.array: Istorija parametara oblika (T, 2) ili (T, N, 2).
+    """
+    return optimize(optimizer, grad, initial_points, iterations, record_every=record_every).history
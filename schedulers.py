@@ -0,0 +1,82 @@
+# schedulers.py
+"""
+Rasporedi stope učenja (learning rate schedules).
+
+Svaki raspored je funkcija koja za zadati broj iteracija unapred vraća niz
+množilaca stope učenja (po jedan za svaki korak). Optimizator u koraku t
+koristi `base_lr * množioci[t]` (`BaseOptimizer.set_schedule`), pa se tokom
+optimizacije ne poziva nikakva Python funkcija rasporeda.
+"""
+import numpy as np
+
+
+def constant(iterations):
+    return np.ones(iterations)
+
+
+def step_decay(iterations, step_size=100, gamma=0.5):
+    """Množilac se smanjuje `gamma` puta posle svakih `step_size` koraka."""
+    return gamma ** (np.arange(iterations) // int(step_size))
+
+
+def exponential(iterations, gamma=0.99):
+    """Množilac gamma^t."""
+    return gamma ** np.arange(iterations, dtype=float)
+
+
+def cosine(iterations, min_factor=0.0):
+    """Kosinusno opadanje od 1 do `min_factor` tokom celog pokretanja."""
+    progress = np.arange(iterations) / max(iterations - 1, 1)
+    return min_factor + (1 - min_factor) * 0.5 * (1 + np.cos(np.pi * progress))
+
+
+def warmup(iterations, warmup_steps=100):
+    """Linearno zagrevanje od 1/warmup_steps do 1 tokom prvih `warmup_steps` koraka, zatim 1."""
+    warmup_steps = int(warmup_steps)
+    return np.minimum(1.0, (np.arange(iterations) + 1) / max(warmup_steps, 1))
+
+
+def one_cycle(iterations, pct_start=0.3, div_factor=25.0, final_div_factor=1e4):
+    """
+    One-cycle raspored: kosinusni rast od 1/div_factor do 1 tokom prvih `pct_start`
+    koraka, zatim kosinusni pad do 1/(div_factor * final_div_factor).
+    """
+    rise = max(int(round(pct_start * iterations)), 1)
+    start, end = 1 / div_factor, 1 / (div_factor * final_div_factor)
+    t = np.arange(iterations, dtype=float)
+    up = start + (1 - start) * 0.5 * (1 - np.cos(np.pi * np.minimum(t / rise, 1)))
+    down_progress = np.clip((t - rise) / max(iterations - rise - 1, 1), 0, 1)
+    down = end + (1 - end) * 0.5 * (1 + np.cos(np.pi * down_progress))
+    return np.where(t < rise, up, down)
+
+
+# Ime rasporeda -> (funkcija, imena pozicionih parametara u specifikaciji)
+SCHEDULERS = {
+    'constant': (constant, ()),
+    'step': (step_decay, ('step_size', 'gamma')),
+    'exp': (exponential, ('gamma',)),
+    'cosine': (cosine, ('min_factor',)),
+    'warmup': (warmup, ('warmup_steps',)),
+    'onecycle': (one_cycle, ('pct_start', 'div_factor', 'final_div_factor')),
+}
+
+
+def make_schedule(spec, iterations):
+    """
+    Pravi niz množilaca dužine `iterations` iz tekstualne specifikacije.
+
+    Specifikacija je 'ime[:parametar[:parametar...]]', a više rasporeda spojenih
+    znakom '+' se množi, npr. 'step:200:0.5', 'exp:0.995', 'warmup:50+cosine',
+    'onecycle:0.25'.
+    """
+    factors = np.ones(iterations)
+    for part in spec.split('+'):
+        name, *values = part.strip().split(':')
+        if name not in SCHEDULERS:
+            raise ValueError(f"Nepoznat raspored '{name}' (podržano: {', '.join(SCHEDULERS)}).")
+        function, parameter_names = SCHEDULERS[name]
+        if len(values) > len(parameter_names):
+            raise ValueError(f"Raspored '{name}' prima najviše {len(parameter_names)} parametara "
+                             f"({', '.join(parameter_names) or 'nijedan'}).")
+        factors = factors * function(iterations, **{k: float(v) for k, v in zip(parameter_names, values)})
+    return factors
@@ -0,0 +1,262 @@
+# streaming.py
+"""
+Postepena (streaming) optimizacija: putanja se ne čuva cela u memoriji, već se
+predaje potrošaču u delovima (chunk) fiksne veličine. Potrošač može da osvežava
+grafik uživo, dopisuje delove u fajl na disku i računa tekuće metrike, pa je
+memorija ograničena veličinom dela, a ne brojem iteracija.
+"""
+import struct
+
+import numpy as np
+
+from runner import iterate_steps, OptimizationResult
+from surface_cache import get_surface
+
+# Fiksna veličina zaglavlja .npy fajla, da bi se moglo prepisati kada se niz produži
+NPY_HEADER_SIZE = 128
+
+
+class TrajectoryChunk:
+    """
+    Deo putanje jednog pokretanja.
+
+    Nizovi `steps` i `points` su pogledi na bafer koji se ponovo koristi za
+    sledeći deo; potrošač koji želi da ih zadrži mora da napravi kopiju.
+
+    Attributes:
+        steps (np.array): Redni brojevi koraka, oblika (k,).
+        points (np.array): Tačke posle tih koraka, oblika (k, 2) ili (k, N, 2).
+        done (bool): Da li je ovo poslednji deo.
+        result (OptimizationResult): Razlozi zaustavljanja (samo u poslednjem delu, bez istorije).
+    """
+    def __init__(self, steps, points, done, result=None):
+        self.steps = steps
+        self.points = points
+        self.done = done
+        self.result = result
+
+    def __len__(self):
+        return len(self.steps)
+
+
+def stream(optimizer, grad, initial_points, iterations, chunk_size=1000, record_every=1, criteria=None, func=None,
+           noise=None):
+    """
+    Generator koji izvršava optimizaciju i vraća putanju u delovima od najviše `chunk_size` tačaka.
+
+    Prvi deo počinje početnom tačkom, a poslednji (sa `done=True`) se završava
+    poslednjom tačkom, čak i kada njen korak ne pada na `record_every`.
+    Optimizator sam čuva samo početnu i poslednju tačku.
+
+    Args:
+        optimizer (BaseOptimizer): Instanca optimizatora.
+        grad (callable): Gradijent funkcije cilja.
+        initial_points (array-like): Jedna tačka oblika (2,) ili paket tačaka oblika (N, 2).
+        iterations (int): Najveći broj iteracija.
+        chunk_size (int): Najveći broj tačaka u jednom delu.
+        record_every (int): Predaje se svaki k-ti korak.
+        criteria (StoppingCriteria): Kriterijumi zaustavljanja (None = uvek sve iteracije).
+        func (callable): Funkcija cilja, potrebna samo za f_tol kriterijum.
+        noise (GradientNoise): Šum koji se dodaje gradijentu (None = tačan gradijent).
+
+    Yields:
+        TrajectoryChunk: Sledeći deo putanje.
+    """
+    if chunk_size < 1:
+        raise ValueError(f"Veličina dela mora biti pozitivna (chunk_size={chunk_size}).")
+    optimizer.register_parameters(initial_points, iterations=iterations, record_every=None)
+    is_batch = optimizer.params.ndim == 2
+    n_points = len(optimizer.params) if is_batch else 1
+    stop_codes = np.zeros(n_points, dtype=np.int8)
+    stop_iterations = np.full(n_points, iterations)
+
+    steps = np.empty(chunk_size, dtype=np.int64)
+    points = np.empty((chunk_size,) + optimizer.params.shape)
+    steps[0], points[0] = 0, optimizer.history.latest()
+    size = 1
+    last_step = recorded_step = 0
+
+    for last_step in iterate_steps(optimizer, grad, iterations, stop_codes, stop_iterations, criteria, func, noise):
+        if last_step % record_every:
+            continue
+        if size == chunk_size:
+            yield TrajectoryChunk(steps, points, done=False)
+            size = 0
+        steps[size], points[size] = last_step, optimizer.history.latest()
+        recorded_step = last_step
+        size += 1
+
+    if last_step != recorded_step:
+        if size == chunk_size:
+            yield TrajectoryChunk(steps, points, done=False)
+            size = 0
+        steps[size], points[size] = last_step, optimizer.history.latest()
+        size += 1
+    result = OptimizationResult(None, stop_codes, stop_iterations, is_batch)
+    yield TrajectoryChunk(steps[:size], points[:size], done=True, result=result)
+
+
+def _npy_header(shape, dtype):
+    """Zaglavlje .npy fajla (verzija 1.0) dopunjeno razmacima do NPY_HEADER_SIZE bajtova."""
+    header = repr({'descr': np.lib.format.dtype_to_descr(np.dtype(dtype)), 'fortran_order': False,
+                   'shape': tuple(shape)})
+    prefix = np.lib.format.magic(1, 0)
+    padding = NPY_HEADER_SIZE - len(prefix) - 2 - len(header) - 1
+    if padding < 0:
+        raise ValueError(f"Oblik {shape} ne staje u zaglavlje od {NPY_HEADER_SIZE} bajtova.")
+    return prefix + struct.pack('<H', NPY_HEADER_SIZE - len(prefix) - 2) + header.encode('latin1') + b' ' * padding + b'\n'
+
+
+class ChunkWriter:
+    """
+    Dopisuje delove putanje u .npy fajl.
+
+    Posle svakog upisa zaglavlje se prepisuje novom dužinom niza, pa je fajl
+    u svakom trenutku ispravan i može se čitati (npr. `np.load(..., mmap_mode='r')`)
+    i dok optimizacija još traje.
+    """
+    def __init__(self, path, dtype=float):
+        self.path = path
+        self.dtype = np.dtype(dtype)
+        self.length = 0
+        self.point_shape = None
+        self._file = None
+
+    def write(self, points):
+        points = np.ascontiguousarray(points, dtype=self.dtype)
+        if self._file is None:
+            self.point_shape = points.shape[1:]
+            self._file = open(self.path, 'wb')
+            self._file.write(_npy_header((0,) + self.point_shape, self.dtype))
+        elif points.shape[1:] != self.point_shape:
+            raise ValueError(f"Oblik tačaka {points.shape[1:]} se razlikuje od prethodnog {self.point_shape}.")
+        self._file.write(points.tobytes())
+        self.length += len(points)
+        self._file.seek(0)
+        self._file.write(_npy_header((self.length,) + self.point_shape, self.dtype))
+        self._file.seek(0, 2)
+        self._file.flush()
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class RunningMetrics:
+    """
+    Tekuće metrike jednog pokretanja, računate deo po deo (bez čuvanja putanje).
+
+    Za paket tačaka vrednost funkcije je srednja vrednost po konačnim vrednostima.
+    """
+    def __init__(self, objective):
+        self.objective = objective
+        self.step = 0
+        self.value = np.nan
+        self.best = np.inf
+        self.path_length = 0.0
+        self._last_point = None
+
+    def update(self, chunk):
+        if len(chunk) == 0:
+            return
+        values = self.objective.value(chunk.points)
+        if values.ndim == 2:
+            finite = np.isfinite(values)
+            counts = finite.sum(axis=1)
+            values = np.where(finite, values, 0.0).sum(axis=1) / np.maximum(counts, 1)
+            values[counts == 0] = np.nan
+        self.step = int(chunk.steps[-1])
+        self.value = float(values[-1])
+        if np.isfinite(values).any():
+            self.best = min(self.best, float(np.nanmin(values)))
+        points = chunk.points if self._last_point is None else np.concatenate([self._last_point[None], chunk.points])
+        segments = np.linalg.norm(np.diff(points, axis=0), axis=-1)
+        if segments.ndim == 2:
+            segments = np.where(np.isfinite(segments), segments, 0.0).mean(axis=-1)
+        self.path_length += float(np.nansum(segments))
+        self._last_point = chunk.points[-1].copy()
+
+    def describe(self):
+        return f"korak {self.step}, f={self.value:.4g}, najbolje={self.best:.4g}, dužina puta={self.path_length:.3g}"
+
+
+class LivePlot:
+    """
+    Grafik koji se osvežava tokom optimizacije: u prozoru (interaktivni backend)
+    ili prepisivanjem PNG fajla.
+
+    Za svaku putanju čuva se najviše `max_points` tačaka: kada se granica
+    pređe, zadržava se svaka druga tačka, a nove tačke se dalje uzimaju sa
+    dvostruko većim korakom.
+    """
+    def __init__(self, objective, names, title, output_file=None, max_points=2000):
+        # matplotlib je potreban samo za prikaz, ne i za samu streaming optimizaciju
+        import matplotlib.pyplot as plt
+        from matplotlib.colors import LogNorm, BoundaryNorm
+        self.plt = plt
+        self.output_file = output_file
+        self.max_points = max_points
+        self.title = title
+
+        if output_file is None:
+            plt.ion()
+        X, Y, Z = get_surface(objective.func, objective.bounds, 400)
+        self.fig, self.ax = plt.subplots(figsize=(10, 8))
+        norm = LogNorm() if objective.log_scale else BoundaryNorm(objective.levels, 256)
+        contour = self.ax.contourf(X, Y, Z, levels=objective.levels, cmap='viridis', norm=norm)
+        self.fig.colorbar(contour, label='Vrednost funkcije cilja')
+        for point in objective.minima:
+            self.ax.plot(point[0], point[1], '*', color='white', markeredgecolor='black', markersize=12)
+        self.ax.set_xlim(objective.bounds[0], objective.bounds[1])
+        self.ax.set_ylim(objective.bounds[2], objective.bounds[3])
+        self.ax.set_xlabel('Parametar 1 (x)')
+        self.ax.set_ylabel('Parametar 2 (y)')
+
+        self.lines = {}
+        self.tracks = {}
+        for name in names:
+            self.lines[name], = self.ax.plot([], [], 'o-', label=name, markersize=2, linewidth=1.5)
+            self.tracks[name] = (np.empty((0, 2)), 1, 0)  # (tačke, korak proređivanja, pomeraj)
+        self.ax.legend(loc='lower right')
+
+    def update(self, name, chunk):
+        if len(chunk) == 0:
+            return
+        line = self.lines[name]
+        if chunk.points.ndim == 3:
+            # Paket tačaka: prikazuje se samo trenutni oblak
+            line.set_linestyle('none')
+            line.set_data(chunk.points[-1, :, 0], chunk.points[-1, :, 1])
+            return
+        kept, stride, offset = self.tracks[name]
+        new = chunk.points[offset::stride]
+        offset = (offset - len(chunk.points)) % stride
+        kept = np.concatenate([kept, new])
+        while len(kept) > self.max_points:
+            kept = kept[::2]
+            stride *= 2
+            offset = 0
+        self.tracks[name] = (kept, stride, offset)
+        # Poslednja tačka se uvek prikazuje, čak i kada je preskočena proređivanjem
+        shown = np.concatenate([kept, chunk.points[-1:]])
+        line.set_data(shown[:, 0], shown[:, 1])
+
+    def refresh(self, status=''):
+        self.ax.set_title(f"{self.title}\n{status}" if status else self.title)
+        if self.output_file is None:
+            self.fig.canvas.draw_idle()
+            self.plt.pause(0.001)
+        else:
+            self.fig.savefig(self.output_file, dpi=100)
+
+    def close(self):
+        if self.output_file is None:
+            self.plt.ioff()
+        self.plt.close(self.fig)
@@ -0,0 +1,153 @@
+# surface_cache.py
+import hashlib
+import os
+from collections import OrderedDict
+
+import numpy as np
+
+from profiling import get_profiler
+
+DEFAULT_DISK_DIR = os.path.join("results", ".cache")
+
+
+def function_fingerprint(func):
+    """Heš definicije funkcije (bajtkod, konstante i imena), stabilan između pokretanja."""
+    digest = hashlib.sha1()
+
+    def feed(code):
+        digest.update(code.co_code)
+        digest.update(repr(code.co_names).encode())
+        for const in code.co_consts:
+            if hasattr(const, 'co_code'):
+                feed(const)
+            else:
+                digest.update(repr(const).encode())
+
+    code = getattr(func, '__code__', None)
+    if code is None:
+        digest.update(repr(func).encode())
+    else:
+        feed(code)
+    return digest.hexdigest()[:16]
+
+
+class SurfaceCache:
+    """
+    Keš vrednosti funkcije cilja na mreži tačaka koja se koristi za konturne grafike.
+
+    Ključ je (ime funkcije, opseg, rezolucija, heš definicije funkcije). U memoriji
+    se čuva najviše `max_entries` površina ukupne veličine do `max_bytes`, uz
+    izbacivanje najdavnije korišćenih (LRU). Ako je zadat `disk_dir`, površine
+    se čuvaju i kao .npy fajlovi, pa ih koriste i naredna pokretanja.
+    """
+    def __init__(self, max_entries=16, max_bytes=256 * 2**20, disk_dir=None, max_disk_bytes=1 * 2**30):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.disk_dir = disk_dir
+        self.max_disk_bytes = max_disk_bytes
+        self._entries = OrderedDict()
+        self._nbytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def _key(self, func, bounds, resolution, name):
+        name = name or getattr(func, '__qualname__', 'func')
+        bounds = tuple(float(b) for b in bounds)
+        return (name, bounds, int(resolution), function_fingerprint(func))
+
+    def _disk_path(self, key):
+        key_hash = hashlib.sha1(repr(key).encode()).hexdigest()[:20]
+        return os.path.join(self.disk_dir, f"surface_{key_hash}.npy")
+
+    def get(self, func, bounds, resolution=400, name=None):
+        """
+        Vraća (X, Y, Z) za dati opseg i rezoluciju, računajući Z samo ako nije u kešu.
+
+        Vraćeni nizovi su samo za čitanje, jer ih dele svi korisnici keša.
+        """
+        key = self._key(func, bounds, resolution, name)
+        profiler = get_profiler()
+        surface = self._entries.get(key)
+        if surface is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            profiler.count('surface_cache', hits=1)
+            return surface
+
+        with profiler.phase('surface', resolution=key[2]):
+            xmin, xmax, ymin, ymax = key[1]
+            X, Y = np.meshgrid(np.linspace(xmin, xmax, key[2]), np.linspace(ymin, ymax, key[2]))
+            Z = self._load_from_disk(key)
+            if Z is None:
+                self.misses += 1
+                profiler.count('surface_cache', misses=1)
+                Z = np.asarray(func(X, Y), dtype=float)
+                self._save_to_disk(key, Z)
+            else:
+                self.hits += 1
+                profiler.count('surface_cache', disk_hits=1)
+
+        surface = (X, Y, Z)
+        for array in surface:
+            array.setflags(write=False)
+        self._insert(key, surface)
+        return surface
+
+    def _insert(self, key, surface):
+        self._entries[key] = surface
+        self._nbytes += sum(array.nbytes for array in surface)
+        while self._entries and (len(self._entries) > self.max_entries or self._nbytes > self.max_bytes):
+            _, evicted = self._entries.popitem(last=False)
+            self._nbytes -= sum(array.nbytes for array in evicted)
+
+    def _load_from_disk(self, key):
+        if not self.disk_dir:
+            return None
+        path = self._disk_path(key)
+        if not os.path.exists(path):
+            return None
+        try:
+            Z = np.load(path)
+        except (OSError, ValueError):
+            return None
+        os.utime(path)  # Osvežava vreme korišćenja za LRU na disku
+        return Z
+
+    def _save_to_disk(self, key, Z):
+        if not self.disk_dir:
+            return
+        os.makedirs(self.disk_dir, exist_ok=True)
+        np.save(self._disk_path(key), Z)
+        self._evict_disk()
+
+    def _evict_disk(self):
+        files = [os.path.join(self.disk_dir, f) for f in os.listdir(self.disk_dir)
+                 if f.startswith('surface_') and f.endswith('.npy')]
+        files.sort(key=os.path.getmtime)
+        total = sum(os.path.getsize(f) for f in files)
+        while files and total > self.max_disk_bytes:
+            oldest = files.pop(0)
+            total -= os.path.getsize(oldest)
+            os.remove(oldest)
+
+    def clear(self):
+        """Prazni keš u memoriji (fajlovi na disku ostaju)."""
+        self._entries.clear()
+        self._nbytes = 0
+
+
+_default_cache = SurfaceCache()
+
+
+def configure_surface_cache(**options):
+    """Menja podešavanja podrazumevanog keša (max_entries, max_bytes, disk_dir, max_disk_bytes)."""
+    for option, value in options.items():
+        if not hasattr(_default_cache, option):
+            raise ValueError(f"Nepoznato podešavanje keša '{option}'.")
+        setattr(_default_cache, option, value)
+    return _default_cache
+
+
+def get_surface(func, bounds, resolution=400, name=None):
+    """Vraća (X, Y, Z) iz podrazumevanog keša površina."""
+    return _default_cache.get(func, bounds, resolution, name)
@@ -0,0 +1,213 @@
+# sweep.py
+import itertools
+import os
+
+import numpy as np
+
+from functions import get_function_by_name
+from optimizers import OPTIMIZER_PARAMETERS, get_optimizer_by_name
+from runner import run_optimizer
+
+# Skraćena imena hiperparametara koja se mogu koristiti u --sweep specifikaciji
+PARAMETER_ALIASES = {'lr': 'learning_rate'}
+# Svi hiperparametri koje prima bar jedan optimizator
+KNOWN_PARAMETERS = frozenset().union(*OPTIMIZER_PARAMETERS.values())
+
+
+def _parse_values(text):
+    """Pretvara 'start:stop:log:n', 'start:stop:n' ili 'v1,v2,...' u listu vrednosti."""
+    if ':' in text:
+        parts = text.split(':')
+        if len(parts) == 3:
+            start, stop, num = parts
+            scale = 'lin'
+        elif len(parts) == 4:
+            start, stop, scale, num = parts
+        else:
+            raise ValueError(f"Neispravan opseg '{text}' (očekivano start:stop[:lin|log]:n).")
+        start, stop, num = float(start), float(stop), int(num)
+        if scale == 'log':
+            values = np.geomspace(start, stop, num)
+        elif scale == 'lin':
+            values = np.linspace(start, stop, num)
+        else:
+            raise ValueError(f"Nepoznata skala '{scale}' (podržano: lin, log).")
+        return [float(v) for v in values]
+    return [float(v) for v in text.split(',')]
+
+
+def parse_sweep_spec(specs):
+    """
+    Parsira listu specifikacija oblika 'ime=vrednosti' u rečnik mreže hiperparametara.
+
+    Primer: ['lr=1e-4:1e-1:log:20', 'beta1=0.8,0.9,0.99']
+    """
+    grid = {}
+    for spec in specs:
+        if '=' not in spec:
+            raise ValueError(f"Neispravna specifikacija '{spec}' (očekivano ime=vrednosti).")
+        key, values = spec.split('=', 1)
+        key = PARAMETER_ALIASES.get(key.strip(), key.strip())
+        if key not in KNOWN_PARAMETERS:
+            raise ValueError(f"Nepoznat hiperparametar '{key}' (podržano: "
+                             f"{', '.join(sorted(KNOWN_PARAMETERS | set(PARAMETER_ALIASES)))}).")
+        grid[key] = _parse_values(values.strip())
+    return grid
+
+
+def optimizer_grid(grid, optimizer_name):
+    """Deo mreže sa hiperparametrima koje optimizator prima (ostali ne bi menjali njegov rezultat)."""
+    parameters = OPTIMIZER_PARAMETERS.get(optimizer_name.lower())
+    if parameters is None:
+        raise ValueError(f"Optimizator '{optimizer_name}' nije definisan.")
+    return {key: values for key, values in grid.items() if key in parameters}
+
+
+def check_grid(grid, optimizer_names):
+    """Proverava da svaki hiperparametar iz mreže prima bar jedan od optimizatora."""
+    used = set()
+    for name in optimizer_names:
+        used.update(optimizer_grid(grid, name))
+    unused = [key for key in grid if key not in used]
+    if unused:
+        raise ValueError(f"Hiperparametre {', '.join(unused)} ne prima nijedan od optimizatora "
+                         f"({', '.join(optimizer_names)}).")
+
+
+def expand_grid(grid):
+    """Vraća listu rečnika sa svim kombinacijama vrednosti iz mreže (redosled je deterministički)."""
+    keys = list(grid)
+    return [dict(zip(keys, values)) for values in itertools.product(*(grid[k] for k in keys))]
+
+
+def _run_job(job):
+    """Izvršava jedan posao (optimizator, hiperparametri, početne tačke) u radnom procesu."""
+    optimizer_name, function_name, hyperparams, initial_points, iterations, record_every = job
+    _, grad, _ = get_function_by_name(function_name)
+    hyperparams = dict(hyperparams)
+    learning_rate = hyperparams.pop('learning_rate')
+    optimizer = get_optimizer_by_name(optimizer_name, learning_rate, **hyperparams)
+    history = run_optimizer(optimizer, grad, initial_points, iterations, record_every=record_every)
+    # Kopija da bi se preneo samo zabeleženi deo bafera, a ne ceo bafer
+    return np.ascontiguousarray(history)
+
+
+def run_jobs(jobs, workers=None, chunksize=1):
+    """
+    Izvršava poslove u procesima i vraća rezultate u redosledu poslova.
+
+    Sa `workers=1` poslovi se izvršavaju u tekućem procesu. Rezultati ne zavise
+    od broja procesa, jer je svaki posao deterministički i nezavisan od ostalih.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1 or len(jobs) <= 1:
+        return [_run_job(job) for job in jobs]
+    # Uvozi se tek kada su procesi zaista potrebni (skraćuje pokretanje programa)
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as executor:
+        return list(executor.map(_run_job, jobs, chunksize=chunksize))
+
+
+class SweepResult:
+    """
+    Rezultati pretrage hiperparametara smešteni u kompaktne nizove, posebno za svaki optimizator
+    (optimizator ima samo kombinacije hiperparametara koje prima).
+    """
+    def __init__(self, optimizer_names, function_name, cells, histories, final_values):
+        self.optimizer_names = list(optimizer_names)
+        self.function_name = function_name
+        self.cells = cells                  # Ime -> lista rečnika hiperparametara iz mreže
+        self.histories = histories          # Ime -> (n_cells, T, [N,] 2)
+        self.final_values = final_values    # Ime -> (n_cells[, N])
+
+    @property
+    def n_cells(self):
+        """Ukupan broj izvršenih kombinacija (optimizator, hiperparametri)."""
+        return sum(len(cells) for cells in self.cells.values())
+
+    def parameter_names(self, optimizer_name):
+        cells = self.cells[optimizer_name]
+        return list(cells[0]) if cells else []
+
+    def parameter_table(self, optimizer_name):
+        """Vrednosti hiperparametara optimizatora kao niz oblika (n_cells, n_params)."""
+        cells, names = self.cells[optimizer_name], self.parameter_names(optimizer_name)
+        return np.array([[cell[k] for k in names] for cell in cells], dtype=float).reshape(len(cells), len(names))
+
+    def best_cell(self, optimizer_name):
+        """Indeks kombinacije sa najmanjom prosečnom konačnom vrednošću funkcije (NaN/inf se preskaču)."""
+        values = self.final_values[optimizer_name]
+        values = values.reshape(len(self.cells[optimizer_name]), -1)
+        scores = np.where(np.isfinite(values), values, np.inf).mean(axis=1)
+        return int(np.argmin(scores))
+
+    def save(self, path):
+        """Čuva rezultate u .npz fajl (nizovi optimizatora imaju prefiks '<ime>_')."""
+        arrays = {'optimizer_names': np.array(self.optimizer_names), 'function_name': np.array(self.function_name)}
+        for name in self.optimizer_names:
+            arrays[f'{name}_parameter_names'] = np.array(self.parameter_names(name), dtype=str)
+            arrays[f'{name}_parameter_values'] = self.parameter_table(name)
+            arrays[f'{name}_histories'] = self.histories[name]
+            arrays[f'{name}_final_values'] = self.final_values[name]
+        np.savez_compressed(path, **arrays)
+
+
+def _split_points(initial_points, points_per_job):
+    if initial_points.ndim == 1 or not points_per_job or points_per_job >= len(initial_points):
+        return [initial_points]
+    return [initial_points[i:i + points_per_job] for i in range(0, len(initial_points), points_per_job)]
+
+
+def run_sweep(optimizer_names, function_name, initial_points, iterations, grid,
+              base_params=None, workers=None, chunksize=1, points_per_job=None, record_every=1):
+    """
+    Pokreće sve kombinacije (optimizator, hiperparametri, početne tačke) paralelno.
+
+    Args:
+        optimizer_names (list): Imena optimizatora.
+        function_name (str): Ime funkcije cilja.
+        initial_points (array-like): Jedna tačka (2,) ili paket tačaka (N, 2).
+        iterations (int): Broj iteracija.
+        grid (dict): Mreža hiperparametara (npr. iz `parse_sweep_spec`); svaki optimizator prolazi
+                     samo kroz hiperparametre koje prima.
+        base_params (dict): Podrazumevani hiperparametri koje mreža prepisuje.
+        workers (int): Broj procesa (None = broj jezgara).
+        chunksize (int): Broj poslova koji se odjednom šalju jednom procesu.
+        points_per_job (int): Najveći broj početnih tačaka po poslu (None = sve u jednom poslu).
+        record_every (int ili None): Proređivanje istorije, kao u `run_optimizer`.
+
+    Returns:
+        SweepResult: Istorije i konačne vrednosti funkcije za svaku kombinaciju.
+    """
+    check_grid(grid, optimizer_names)
+    initial_points = np.asarray(initial_points, dtype=float)
+    cells = {name: expand_grid(optimizer_grid(grid, name)) for name in optimizer_names}
+    point_chunks = _split_points(initial_points, points_per_job)
+
+    jobs = [(name, function_name, {**(base_params or {}), **cell}, points, iterations, record_every)
+            for name in optimizer_names for cell in cells[name] for points in point_chunks]
+    results = run_jobs(jobs, workers=workers, chunksize=chunksize)
+
+    # Spajamo delove paketa početnih tačaka po osi N i slažemo u jedan niz po optimizatoru
+    n_chunks = len(point_chunks)
+    histories = [results[i] if n_chunks == 1 else np.concatenate(results[i:i + n_chunks], axis=1)
+                 for i in range(0, len(results), n_chunks)]
+    func, _, _ = get_function_by_name(function_name)
+    by_optimizer, final_values, start = {}, {}, 0
+    for name in optimizer_names:
+        stacked = np.stack(histories[start:start + len(cells[name])])
+        start += len(cells[name])
+        by_optimizer[name] = stacked
+        with np.errstate(all='ignore'):
+            final_values[name] = func(stacked[:, -1, ..., 0], stacked[:, -1, ..., 1])
+    return SweepResult(optimizer_names, function_name, cells, by_optimizer, final_values)
+
+
+def run_parallel_paths(optimizer_names, function_name, initial_points, iterations,
+                       learning_rate, workers=None, record_every=1, **optimizer_kwargs):
+    """Pokreće više optimizatora sa istim hiperparametrima paralelno i vraća rečnik putanja."""
+    cell = {'learning_rate': learning_rate, **optimizer_kwargs}
+    jobs = [(name, function_name, cell, np.asarray(initial_points, dtype=float), iterations, record_every)
+            for name in optimizer_names]
+    return dict(zip(optimizer_names, run_jobs(jobs, workers=workers)))
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Moduli projekta su skripte u korenu repozitorijuma
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
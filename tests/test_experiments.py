@@ -0,0 +1,67 @@
+import os
+
+import pytest
+
+from experiments import Experiment, ExperimentRunner
+
+SETTINGS = {'optimizers': ['sgd', 'adam'], 'function': 'quadratic', 'initial_point': [1.0, 1.0],
+            'iterations': 20, 'output_file': 'izlaz.png'}
+
+
+def make_experiment(tmp_path, **changes):
+    return Experiment({**SETTINGS, **changes}, output_dir=str(tmp_path))
+
+
+def mark_written(runner, experiment):
+    """Pravi izlazni fajl i beleži ga kao napravljen (bez crtanja)."""
+    with open(experiment.output_path, 'wb') as f:
+        f.write(b'png')
+    runner._mark_done([experiment])
+
+
+def test_missing_output_is_not_up_to_date(tmp_path):
+    assert not ExperimentRunner().is_up_to_date(make_experiment(tmp_path))
+
+
+def test_unchanged_output_is_up_to_date(tmp_path):
+    runner = ExperimentRunner()
+    experiment = make_experiment(tmp_path)
+    mark_written(runner, experiment)
+
+    assert runner.is_up_to_date(experiment)
+    assert ExperimentRunner().is_up_to_date(make_experiment(tmp_path))
+    assert not ExperimentRunner(force=True).is_up_to_date(experiment)
+
+
+@pytest.mark.parametrize('changes', [{'learning_rate': 0.02}, {'optimizers': ['sgd']}, {'fps': 30},
+                                     {'grad_tol': 1e-3}])
+def test_changed_fingerprint_reruns(tmp_path, changes):
+    runner = ExperimentRunner()
+    mark_written(runner, make_experiment(tmp_path))
+
+    assert not runner.is_up_to_date(make_experiment(tmp_path, **changes))
+
+
+def test_modified_output_reruns(tmp_path):
+    runner = ExperimentRunner()
+    experiment = make_experiment(tmp_path)
+    mark_written(runner, experiment)
+    mtime = os.path.getmtime(experiment.output_path)
+    os.utime(experiment.output_path, (mtime + 10, mtime + 10))
+
+    assert not runner.is_up_to_date(experiment)
+
+
+def test_run_skips_up_to_date_outputs(tmp_path):
+    pytest.importorskip('matplotlib')
+    experiment = make_experiment(tmp_path)
+
+    done, skipped, failed = ExperimentRunner().run([experiment])
+    assert (len(done), len(skipped), len(failed)) == (1, 0, 0)
+    assert os.path.exists(experiment.output_path)
+
+    done, skipped, failed = ExperimentRunner().run([make_experiment(tmp_path)])
+    assert (len(done), len(skipped), len(failed)) == (0, 1, 0)
+
+    done, skipped, failed = ExperimentRunner().run([make_experiment(tmp_path, learning_rate=0.05)])
+    assert (len(done), len(skipped), len(failed)) == (1, 0, 0)
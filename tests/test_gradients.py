@@ -0,0 +1,86 @@
+import numpy as np
+import pytest
+
+from functions import OBJECTIVES, evaluate_gradient
+
+NAMES = sorted(OBJECTIVES)
+
+
+def sample_points(objective, n=16):
+    """Slučajne tačke unutar opsega funkcije, oblika (n, 2)."""
+    xmin, xmax, ymin, ymax = objective.bounds
+    rng = np.random.default_rng(0)
+    return np.column_stack([rng.uniform(xmin, xmax, n), rng.uniform(ymin, ymax, n)])
+
+
+def numeric_gradient(func, points):
+    """Centralne razlike, oblika (n, 2)."""
+    x, y = points[:, 0], points[:, 1]
+    hx, hy = 1e-6 * np.maximum(1.0, np.abs(x)), 1e-6 * np.maximum(1.0, np.abs(y))
+    return np.column_stack([(func(x + hx, y) - func(x - hx, y)) / (2 * hx),
+                            (func(x, y + hy) - func(x, y - hy)) / (2 * hy)])
+
+
+def assert_gradient_close(objective, points, gradient):
+    expected = numeric_gradient(objective.func, points)
+    # Greška zaokruživanja centralnih razlika raste sa veličinom vrednosti funkcije
+    scale = np.maximum(1.0, np.abs(objective.func(points[:, 0], points[:, 1])))[:, None]
+    assert np.all(np.abs(gradient - expected) <= 1e-5 * np.abs(expected) + 1e-7 * scale)
+
+
+@pytest.mark.parametrize('name', NAMES)
+def test_grad_matches_finite_differences(name):
+    objective = OBJECTIVES[name]
+    points = sample_points(objective)
+
+    gradient = objective.grad(points[:, 0], points[:, 1])
+
+    assert gradient.shape == (2, len(points))
+    assert_gradient_close(objective, points, gradient.T)
+
+
+@pytest.mark.parametrize('name', NAMES)
+def test_value_and_grad(name):
+    objective = OBJECTIVES[name]
+    points = sample_points(objective)
+
+    value, gradient = objective.value_and_grad(points)
+    out = np.empty_like(points)
+    value_out, gradient_out = objective.value_and_grad(points, out=out)
+
+    np.testing.assert_array_equal(value, objective.func(points[:, 0], points[:, 1]))
+    assert_gradient_close(objective, points, gradient)
+    assert gradient_out is out
+    np.testing.assert_array_equal(value_out, value)
+    np.testing.assert_array_equal(gradient_out, gradient)
+
+
+@pytest.mark.parametrize('name', NAMES)
+def test_evaluate_gradient_single_point(name):
+    objective = OBJECTIVES[name]
+    points = sample_points(objective, n=4)
+    batch = evaluate_gradient(objective.grad, points)
+
+    for point, expected in zip(points, batch):
+        gradient = evaluate_gradient(objective.grad, point)
+        out = np.empty(2)
+        assert gradient.shape == (2,)
+        np.testing.assert_array_equal(gradient, expected)
+        assert evaluate_gradient(objective.grad, point, out=out) is out
+        np.testing.assert_array_equal(out, expected)
+
+
+@pytest.mark.parametrize('name', NAMES)
+def test_evaluate_gradient_out_aliases_params(name):
+    # Izlaz se upisuje tek kada su svi međurezultati izračunati, pa out sme biti i sam niz tačaka
+    objective = OBJECTIVES[name]
+    points = sample_points(objective)
+    expected = evaluate_gradient(objective.grad, points)
+
+    batch = points.copy()
+    assert evaluate_gradient(objective.grad, batch, out=batch) is batch
+    np.testing.assert_array_equal(batch, expected)
+
+    point = points[0].copy()
+    assert evaluate_gradient(objective.grad, point, out=point) is point
+    np.testing.assert_array_equal(point, expected[0])
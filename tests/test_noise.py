@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+
+from functions import get_objective
+from noise import make_noise, replicate
+from optimizers import get_optimizer_by_name
+from runner import optimize
+
+KINDS = ['gaussian', 'student_t', 'minibatch']
+
+
+def run_replicas(kind, replicas, seed=3, iterations=300, block_steps=None):
+    objective = get_objective('rosenbrock')
+    noise = make_noise(kind, 0.5, seed=seed, objective=objective)
+    if block_steps is not None:
+        noise.block_steps = block_steps
+    optimizer = get_optimizer_by_name('adam', 0.01)
+    return optimize(optimizer, objective.grad, replicate([-1.5, 2.0], replicas), iterations,
+                    func=objective.func, noise=noise).history
+
+
+@pytest.mark.parametrize('kind', KINDS)
+def test_replicas_do_not_depend_on_replica_count(kind):
+    few = run_replicas(kind, 3)
+    many = run_replicas(kind, 40)
+
+    np.testing.assert_array_equal(few, many[:, :3])
+
+
+@pytest.mark.parametrize('kind', KINDS)
+def test_replicas_do_not_depend_on_block_size(kind):
+    np.testing.assert_array_equal(run_replicas(kind, 4, block_steps=7), run_replicas(kind, 4))
+
+
+def test_replicas_are_independent():
+    history = run_replicas('gaussian', 5)
+
+    assert len({tuple(point) for point in history[-1]}) == 5
+
+
+def test_seed_changes_noise():
+    assert not np.array_equal(run_replicas('gaussian', 2, seed=3), run_replicas('gaussian', 2, seed=4))
+    np.testing.assert_array_equal(run_replicas('gaussian', 2, seed=3), run_replicas('gaussian', 2, seed=3))
@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from functions import get_objective
+from optimizers import get_optimizer_by_name
+from profiling import enable_profiling, disable_profiling
+from runner import optimize, StoppingCriteria
+
+
+@pytest.fixture
+def profiler():
+    profiler = enable_profiling()
+    yield profiler
+    disable_profiling()
+
+
+def test_immediate_stop_is_profiled(profiler):
+    # Tačka je već u minimumu, pa se zaustavlja pre prvog koraka
+    objective = get_objective('quadratic')
+    optimizer = get_optimizer_by_name('adam', 0.01)
+    result = optimize(optimizer, objective.grad, np.array([0.0, 0.0]), 100,
+                      criteria=StoppingCriteria(grad_tol=1e-3), func=objective.func)
+
+    assert result.iterations[0] == 0
+    assert 'adam/step' not in profiler.phases
+    assert profiler.phases['adam/gradient'][0] == 1
+    assert 'adam/gradient' in profiler.summary()
+
+
+def test_zero_iterations_are_profiled(profiler):
+    objective = get_objective('quadratic')
+    optimizer = get_optimizer_by_name('sgd', 0.01)
+    optimize(optimizer, objective.grad, np.array([1.0, 1.0]), 0)
+
+    assert 'sgd/gradient' not in profiler.phases
+    assert 'sgd/step' not in profiler.phases
+    profiler.summary()
+
+
+def test_summary_with_zero_calls(profiler):
+    profiler.add('prazna', 0.0, calls=0)
+    line = next(line for line in profiler.summary().splitlines() if line.startswith('prazna '))
+    assert line.split()[3] == '-'
+
+
+def test_history_is_a_separate_phase(profiler):
+    objective = get_objective('quadratic')
+    optimizer = get_optimizer_by_name('adam', 0.01)
+    optimize(optimizer, objective.grad, np.array([[1.0, 1.0], [2.0, -1.0]]), 10)
+
+    assert profiler.phases['adam/step'][0] == 10
+    assert profiler.phases['adam/history'][0] == 10
+    assert len(optimizer.get_history()) == 11
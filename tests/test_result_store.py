@@ -0,0 +1,83 @@
+import numpy as np
+
+from functions import get_objective
+from result_store import ResultStore, run_config, config_key
+
+OBJECTIVE = get_objective('quadratic')
+
+
+def make_config(name='adam', **hyperparams):
+    return run_config(name, OBJECTIVE, {'learning_rate': 0.1, 'beta1': 0.9, 'beta2': 0.999, **hyperparams},
+                      [1.0, 1.0], 20)
+
+
+def make_arrays(n=21):
+    return {'path': np.linspace(0, 1, 2 * n).reshape(n, 2), 'steps': np.arange(n),
+            'loss': np.linspace(1, 0, n), 'grad_norm': np.linspace(2, 0, n)}
+
+
+def put(store, config, arrays=None):
+    return store.put(config_key(config), config, arrays or make_arrays())
+
+
+def test_put_get_round_trip(tmp_path):
+    store = ResultStore(str(tmp_path))
+    config = make_config()
+    arrays = make_arrays()
+    put(store, config, arrays)
+
+    run = ResultStore(str(tmp_path)).get(config_key(config))
+    assert run.entry['config'] == config
+    assert (run.optimizer, run.function) == ('adam', 'quadratic')
+    for name, array in arrays.items():
+        np.testing.assert_array_equal(getattr(run, name), array)
+    # Nizovi se čitaju kao memorijski mapirani fajlovi
+    assert isinstance(run.path, np.memmap)
+    assert store.get('0' * 16) is None
+
+
+def test_config_key_is_stable():
+    assert config_key(make_config()) == config_key(make_config())
+    assert config_key(make_config('ADAM')) == config_key(make_config('adam'))
+    assert config_key(make_config(learning_rate=0.2)) != config_key(make_config())
+    assert config_key(make_config(beta1=0.8)) != config_key(make_config())
+
+
+def test_sgd_key_ignores_adam_parameters():
+    assert config_key(make_config('sgd', beta1=0.8)) == config_key(make_config('sgd'))
+    assert make_config('sgd')['hyperparams'] == {'learning_rate': 0.1}
+
+
+def test_runs_filter_is_case_insensitive(tmp_path):
+    store = ResultStore(str(tmp_path))
+    put(store, make_config('Adam'))
+    put(store, make_config('sgd'))
+
+    assert [run.optimizer for run in store.runs('quadratic', ['ADAM'])] == ['adam']
+    assert len(store.runs('quadratic', ['Adam', 'SGD'])) == 2
+    assert store.runs('rosenbrock') == []
+
+
+def test_concurrent_stores_keep_each_others_runs(tmp_path):
+    # Dve instance nad istim direktorijumom (kao dva procesa) ne brišu tuđe zapise
+    first, second = ResultStore(str(tmp_path)), ResultStore(str(tmp_path))
+    first.runs()
+    second.runs()
+    put(first, make_config('adam'))
+    put(second, make_config('sgd'))
+    put(first, make_config('nadam'))
+
+    expected = {'adam', 'sgd', 'nadam'}
+    assert {run.optimizer for run in first.runs()} == expected
+    assert {run.optimizer for run in second.runs()} == expected
+    assert not [name for name in tmp_path.iterdir() if name.suffix == '.tmp']
+
+
+def test_missing_arrays_hide_run(tmp_path):
+    store = ResultStore(str(tmp_path))
+    config = make_config()
+    put(store, config)
+    (tmp_path / f"{config_key(config)}_loss.npy").unlink()
+
+    assert store.get(config_key(config)) is None
+    assert store.runs() == []
@@ -0,0 +1,61 @@
+import numpy as np
+
+from functions import get_objective
+from optimizers import get_optimizer_by_name
+from runner import optimize, StoppingCriteria, MAX_ITER, GRAD_TOL, STEP_TOL, NON_FINITE, OUT_OF_BOUNDS
+
+POINTS = np.array([[0.001, 0.0], [1.0, 1.0], [-3.0, 2.0], [0.1, -0.1], [2.0, -2.5]])
+
+
+def run(points, criteria, name='adam', learning_rate=0.1, iterations=300, function='quadratic'):
+    objective = get_objective(function)
+    optimizer = get_optimizer_by_name(name, learning_rate)
+    return optimize(optimizer, objective.grad, points, iterations, criteria=criteria, func=objective.func)
+
+
+def test_batch_matches_points_run_alone():
+    criteria = StoppingCriteria(grad_tol=1e-2)
+    batch = run(POINTS, criteria)
+
+    for i, point in enumerate(POINTS):
+        alone = run(point[None], criteria)
+        assert batch.stop_codes[i] == alone.stop_codes[0]
+        assert batch.iterations[i] == alone.iterations[0]
+        # Posle zaustavljanja tačka ostaje zamrznuta u istoriji
+        np.testing.assert_array_equal(batch.history[-1, i], alone.history[-1, 0])
+
+    assert len(set(batch.iterations)) > 1
+    assert batch.stop_codes[0] == GRAD_TOL and batch.iterations[0] == 0
+    assert len(batch.history) == batch.iterations.max() + 1
+
+
+def test_frozen_points_keep_last_value():
+    batch = run(POINTS, StoppingCriteria(grad_tol=1e-2))
+
+    for i, stopped_at in enumerate(batch.iterations):
+        assert np.all(batch.history[stopped_at:, i] == batch.history[stopped_at, i])
+
+
+def test_mixed_stop_reasons():
+    points = np.array([[np.inf, 0.0], [1.0, 1.0], [4.5, 0.0], [0.5, 0.5]])
+    criteria = StoppingCriteria(step_tol=1e-4, bounds=[-5, 5, -5, 5])
+    # SGD sa lr=0.6 na x^2 + y^2 množi tačku sa -0.2 (konvergira), lr=1.2 sa -1.4 (divergira)
+    result = run(points, criteria, name='sgd', learning_rate=1.2, iterations=50)
+
+    assert result.stop_codes[0] == NON_FINITE and result.iterations[0] == 0
+    assert list(result.stop_codes[1:]) == [OUT_OF_BOUNDS] * 3
+    # |x| raste 1.4 puta po koraku: 1 -> 5 posle 5 koraka, 4.5 posle 1, 0.5 posle 7
+    assert list(result.iterations[1:]) == [5, 1, 7]
+
+    converging = run(points[1:], criteria, name='sgd', learning_rate=0.6, iterations=50)
+    assert list(converging.stop_codes) == [STEP_TOL] * 3
+
+
+def test_divergence_only_criteria():
+    points = np.array([[1.0, 1.0], [np.nan, 1.0], [0.5, 0.5]])
+    result = run(points, StoppingCriteria(), iterations=20)
+
+    assert list(result.stop_codes) == [MAX_ITER, NON_FINITE, MAX_ITER]
+    assert list(result.iterations) == [20, 0, 20]
+    assert StoppingCriteria().check(np.ones((3, 2)), np.ones((3, 2))) is None
+    assert not StoppingCriteria(detect_divergence=False).active
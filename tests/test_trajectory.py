@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+
+from trajectory import TrajectoryBuffer
+
+
+def fill(buffer, steps, shape=(2,)):
+    """Upisuje početnu tačku 0 i korake 1..steps (tačka koraka k ima sve koordinate jednake k)."""
+    buffer.reset(np.zeros(shape))
+    for k in range(1, steps + 1):
+        buffer.append(np.full(shape, float(k)))
+    return buffer.view()[(slice(None),) + (0,) * len(shape)]
+
+
+def test_grows_without_known_iterations():
+    buffer = TrajectoryBuffer()
+    recorded = fill(buffer, 200)
+
+    np.testing.assert_array_equal(recorded, np.arange(201))
+    assert len(buffer) == 201
+    assert buffer.nbytes >= 201 * 2 * 8
+
+
+def test_preallocated_buffer_does_not_grow():
+    buffer = TrajectoryBuffer(iterations=50)
+    buffer.reset(np.zeros((3, 2)))
+    capacity = buffer.nbytes
+    for k in range(1, 51):
+        buffer.append(np.full((3, 2), float(k)))
+
+    assert buffer.nbytes == capacity
+    assert buffer.view().shape == (51, 3, 2)
+
+
+@pytest.mark.parametrize('iterations', [None, 10])
+def test_record_every_keeps_last_point(iterations):
+    buffer = TrajectoryBuffer(iterations=iterations, record_every=3)
+
+    np.testing.assert_array_equal(fill(buffer, 10), [0, 3, 6, 9, 10])
+    np.testing.assert_array_equal(buffer.latest(), [10, 10])
+
+
+def test_record_every_on_recorded_step():
+    buffer = TrajectoryBuffer(iterations=9, record_every=3)
+
+    np.testing.assert_array_equal(fill(buffer, 9), [0, 3, 6, 9])
+
+
+def test_record_only_first_and_last():
+    buffer = TrajectoryBuffer(iterations=1000, record_every=None)
+
+    np.testing.assert_array_equal(fill(buffer, 1000), [0, 1000])
+    assert buffer.steps == 1000
+
+
+def test_appended_point_is_copied():
+    buffer = TrajectoryBuffer(iterations=2)
+    point = np.zeros(2)
+    buffer.reset(point)
+    point += 1.0
+    buffer.append(point)
+    point += 1.0
+
+    np.testing.assert_array_equal(buffer.view(), [[0, 0], [1, 1]])
+
+
+def test_invalid_record_every():
+    with pytest.raises(ValueError):
+        TrajectoryBuffer(record_every=0)
@@ -0,0 +1,73 @@
+# trajectory.py
+import numpy as np
+
+
+class TrajectoryBuffer:
+    """
+    Istorija parametara smeštena u jedan kontinualni float64 niz oblika (T, ...).
+
+    Kapacitet se zadaje unapred (na osnovu broja iteracija), a ako nije poznat,
+    niz se geometrijski proširuje. Podržava proređivanje istorije: beleži se
+    svaki `record_every`-ti korak, a za `record_every=None` samo početna i
+    poslednja tačka. Poslednja tačka je uvek dostupna, čak i kada njen korak
+    ne pada na korak beleženja.
+    """
+    def __init__(self, iterations=None, record_every=1):
+        if record_every is not None and record_every < 1:
+            raise ValueError("record_every mora biti pozitivan ceo broj ili None.")
+        self.iterations = iterations
+        self.record_every = record_every
+        self._buffer = None
+        self._size = 0         # Broj trajno zabeleženih tačaka
+        self._pending = False  # Da li slot posle njih drži poslednju (nezabeleženu) tačku
+        self.steps = 0
+
+    def _initial_capacity(self):
+        if self.record_every is None:
+            return 2
+        if self.iterations is None:
+            return 64
+        # Početna tačka + zabeleženi koraci + slot za poslednju tačku
+        return 2 + self.iterations // self.record_every
+
+    def reset(self, point):
+        """Alocira bafer i upisuje početnu tačku."""
+        point = np.asarray(point, dtype=float)
+        self._buffer = np.empty((self._initial_capacity(),) + point.shape, dtype=float)
+        self._buffer[0] = point
+        self._size = 1
+        self._pending = False
+        self.steps = 0
+
+    def _grow(self):
+        new_buffer = np.empty((2 * len(self._buffer),) + self._buffer.shape[1:], dtype=float)
+        new_buffer[:self._size] = self._buffer[:self._size]
+        self._buffer = new_buffer
+
+    def append(self, point):
+        """Upisuje tačku posle jednog koraka optimizacije (bez pravljenja kopija)."""
+        self.steps += 1
+        if self._size == len(self._buffer):
+            self._grow()
+        self._buffer[self._size] = point
+        if self.record_every is not None and self.steps % self.record_every == 0:
+            self._size += 1
+            self._pending = False
+        else:
+            self._pending = True
+
+    def view(self):
+        """Vraća pogled (bez kopiranja) na zabeleženu istoriju."""
+        return self._buffer[:self._size + self._pending]
+
+    def latest(self):
+        """Poslednja upisana tačka (pogled, važi do sledećeg upisa)."""
+        return self._buffer[self._size + self._pending - 1]
+
+    def __len__(self):
+        return self._size + self._pending
+
+    @property
+    def nbytes(self):
+        """Broj alociranih bajtova za istoriju."""
+        return 0 if self._buffer is None else self._buffer.nbytes
@@ -1,34 +1,60 @@
 # visualization.py
 import numpy as np
 import matplotlib.pyplot as plt
-from matplotlib.animation import FuncAnimation
-from matplotlib.colors import LogNorm
+from matplotlib.colors import LogNorm, BoundaryNorm, ListedColormap
 
-def plot_optimization_path(func, paths, bounds, title, output_file):
+from renderer import PathAnimationRenderer
+from surface_cache import get_surface
+from functions import DEFAULT_LEVELS
+from profiling import get_profiler
+from basins import OTHER, DIVERGED
+
+
+def _mark_minima(ax, minima):
+    """Označava poznate globalne minimume funkcije belom zvezdicom."""
+    for point in minima:
+        ax.plot(point[0], point[1], '*', color='white', markeredgecolor='black', markersize=12)
+
+def plot_optimization_path(func, paths, bounds, title, output_file, levels=None, log_scale=True, minima=()):
     """
     Crta konturni grafik funkcije i putanje jednog ili više optimizatora.
 
     Args:
         func (callable): Funkcija cilja koja prihvata x i y.
         paths (dict): Rečnik gde je ključ ime optimizatora, a vrednost je niz 
-                      koordinata (istorija parametara).
+                      koordinata (istorija parametara). Za paketnu optimizaciju
+                      niz je oblika (T, N, 2) i crtaju se početne i krajnje tačke.
         bounds (list): Opseg za crtanje [xmin, xmax, ymin, ymax].
         title (str): Naslov grafika.
         output_file (str): Putanja za čuvanje slike (npr. 'output.png').
+        levels (np.array): Nivoi kontura (podrazumevano logspace(0, 5, 35)).
+        log_scale (bool): Log skala boja; za funkcije sa negativnim vrednostima
+                          boje se dodeljuju po zonama između nivoa.
+        minima (list): Poznati globalni minimumi koji se označavaju na grafiku.
     """
-    xmin, xmax, ymin, ymax = bounds
-    x = np.linspace(xmin, xmax, 400)
-    y = np.linspace(ymin, ymax, 400)
-    X, Y = np.meshgrid(x, y)
-    Z = func(X, Y)
+    profiler = get_profiler()
+    X, Y, Z = get_surface(func, bounds, 400)
 
     fig, ax = plt.subplots(figsize=(10, 8))
     
-    # Korišćenje LogNorm skale može pomoći da se konture bolje vide ako su vrednosti jako zbijene
-    contour = ax.contourf(X, Y, Z, levels=np.logspace(0, 5, 35), cmap='viridis', norm=LogNorm())
-    fig.colorbar(contour, label='Vrednost funkcije cilja (log skala)')
+    if levels is None:
+        levels = DEFAULT_LEVELS
+    with profiler.phase('render/contour'):
+        if log_scale:
+            # Korišćenje LogNorm skale može pomoći da se konture bolje vide ako su vrednosti jako zbijene
+            contour = ax.contourf(X, Y, Z, levels=levels, cmap='viridis', norm=LogNorm())
+            fig.colorbar(contour, label='Vrednost funkcije cilja (log skala)')
+        else:
+            contour = ax.contourf(X, Y, Z, levels=levels, cmap='viridis', norm=BoundaryNorm(levels, 256))
+            fig.colorbar(contour, label='Vrednost funkcije cilja')
+    _mark_minima(ax, minima)
 
     for name, path in paths.items():
+        if path.ndim == 3:
+            # Paket početnih tačaka: crtamo gde su tačke krenule i gde su završile
+            ax.scatter(path[0, :, 0], path[0, :, 1], s=2, color='lightgray', alpha=0.5, label=f'_start {name}')
+            ax.scatter(path[-1, :, 0], path[-1, :, 1], s=4, label=name)
+            continue
         # Crtamo putanju optimizatora
         ax.plot(path[:, 0], path[:, 1], 'o-', label=name, markersize=3, linewidth=1.5)
         # Označavamo početnu tačku
@@ -40,63 +66,363 @@ def plot_optimization_path(func, paths, bounds, title, output_file):
     ax.legend()
     ax.grid(True)
     
-    plt.savefig(output_file, dpi=150)
+    with profiler.phase('render/save', output_file=output_file):
+        plt.savefig(output_file, dpi=150)
     print(f"Slika sačuvana u '{output_file}'")
     plt.close()
 
 
-def create_animation(func, path, bounds, title, output_file):
+def plot_traces(traces, title, output_file, f_min=None):
+    """
+    Crta vrednost funkcije cilja i normu gradijenta po iteracijama (log skala).
+
+    Args:
+        traces (dict): Rečnik ime -> (koraci, vrednosti funkcije, norme gradijenta), nizovi
+                       oblika (T,) ili (T, N); za paket tačaka crta se medijana po tačkama.
+        title (str): Naslov grafika.
+        output_file (str): Putanja za čuvanje slike.
+        f_min (float): Poznati minimum funkcije; ako je zadat, crta se f(x) - f_min.
+    """
+    fig, (loss_ax, grad_ax) = plt.subplots(1, 2, figsize=(12, 5), layout='constrained')
+    for name, (steps, loss, grad_norm) in traces.items():
+        loss, grad_norm = np.asarray(loss), np.asarray(grad_norm)
+        if loss.ndim == 2:
+            loss, grad_norm = np.nanmedian(loss, axis=1), np.nanmedian(grad_norm, axis=1)
+        if f_min is not None:
+            loss = loss - f_min
+        loss_ax.plot(steps, loss, label=name)
+        grad_ax.plot(steps, grad_norm, label=name)
+
+    if f_min is not None:
+        loss_ax.set_yscale('log')
+        loss_ax.set_ylabel('f(x) - f_min')
+    else:
+        # Funkcija bez poznatog minimuma može biti i negativna
+        loss_ax.set_yscale('symlog', linthresh=1e-3)
+        loss_ax.set_ylabel('Vrednost funkcije cilja')
+    grad_ax.set_yscale('log')
+    grad_ax.set_ylabel('Norma gradijenta')
+    for ax in (loss_ax, grad_ax):
+        ax.set_xlabel('Iteracija')
+        ax.grid(True)
+    loss_ax.legend()
+    fig.suptitle(title)
+
+    plt.savefig(output_file, dpi=150)
+    print(f"Slika sačuvana u '{output_file}'")
+    plt.close(fig)
+
+
+def plot_bands(bands, title, output_file, f_min=None):
+    """
+    Crta raspon vrednosti funkcije po replikama stohastičke optimizacije:
+    medijanu, srednju vrednost (isprekidano) i pojaseve između simetričnih percentila.
+
+    Args:
+        bands (dict): Rečnik ime -> (koraci, pojasevi iz `noise.trajectory_bands`).
+        title (str): Naslov grafika.
+        output_file (str): Putanja za čuvanje slike.
+        f_min (float): Poznati minimum funkcije; ako je zadat, crta se f(x) - f_min.
+    """
+    fig, ax = plt.subplots(figsize=(10, 6), layout='constrained')
+    shift = f_min if f_min is not None else 0.0
+    for name, (steps, band) in bands.items():
+        percentiles = sorted(p for p in band if p != 'mean')
+        color = ax.plot(steps, band['mean'] - shift, '--', linewidth=1)[0].get_color()
+        # Pojasevi od spoljašnjeg ka unutrašnjem, sve tamniji
+        pairs = list(zip(percentiles, reversed(percentiles)))[:len(percentiles) // 2]
+        for i, (low, high) in enumerate(pairs):
+            ax.fill_between(steps, band[low] - shift, band[high] - shift, color=color, alpha=0.12 + 0.15 * i,
+                            linewidth=0, label=f'{name} ({low}-{high}. percentil)' if i == 0 else None)
+        if 50 in band:
+            ax.plot(steps, band[50] - shift, color=color, linewidth=1.8, label=f'{name} (medijana)')
+
+    if f_min is not None:
+        ax.set_yscale('log')
+        ax.set_ylabel('f(x) - f_min')
+    else:
+        ax.set_yscale('symlog', linthresh=1e-3)
+        ax.set_ylabel('Vrednost funkcije cilja')
+    ax.set_xlabel('Iteracija')
+    ax.grid(True)
+    ax.legend()
+    ax.set_title(title)
+
+    plt.savefig(output_file, dpi=150)
+    print(f"Slika sačuvana u '{output_file}'")
+    plt.close(fig)
+
+
+def plot_lr_range(result, title, output_file, f_min=None):
+    """
+    Crta rezultate testa opsega stope učenja: broj iteracija do konvergencije i
+    konačnu vrednost funkcije u zavisnosti od stope učenja (log skala).
+
+    Args:
+        result (LRRangeResult): Rezultati iz lr_range.run_lr_range.
+        title (str): Naslov grafika.
+        output_file (str): Putanja za čuvanje slike.
+        f_min (float): Poznati minimum funkcije; ako je zadat, crta se f(x) - f_min.
+    """
+    fig, (iter_ax, loss_ax) = plt.subplots(1, 2, figsize=(12, 5), layout='constrained')
+    lrs = result.learning_rates
+    loss = result.final_loss - f_min if f_min is not None else result.final_loss
+
+    iter_ax.plot(lrs[result.converged], result.iterations[result.converged], 'o', color='tab:green', label='konvergiralo')
+    stalled = ~result.converged & ~result.diverged
+    iter_ax.plot(lrs[stalled], result.iterations[stalled], 'o', color='tab:orange', label='nije konvergiralo')
+    iter_ax.plot(lrs[result.diverged], np.full(result.diverged.sum(), result.max_iterations), 'x', color='tab:red',
+                 label='divergiralo')
+    iter_ax.set_ylabel('Broj iteracija')
+
+    loss_ax.plot(lrs, loss, 'o-', markersize=3)
+    if f_min is not None:
+        loss_ax.set_yscale('log')
+        loss_ax.set_ylabel('Konačno f(x) - f_min')
+    else:
+        loss_ax.set_yscale('symlog', linthresh=1e-3)
+        loss_ax.set_ylabel('Konačna vrednost funkcije cilja')
+
+    for ax in (iter_ax, loss_ax):
+        ax.set_xscale('log')
+        ax.set_xlabel('Stopa učenja')
+        ax.grid(True)
+        if result.best is not None:
+            ax.axvline(result.best_learning_rate, color='black', linestyle='--', linewidth=1)
+    iter_ax.legend()
+    fig.suptitle(title)
+
+    plt.savefig(output_file, dpi=150)
+    print(f"Slika sačuvana u '{output_file}'")
+    plt.close(fig)
+
+
+def plot_projection(paths, losses, title, output_file, surface=None, axis_labels=('', ''), f_min=None):
+    """
+    Crta putanje optimizacije u više dimenzija projektovane u 2D i vrednost
+    funkcije po iteracijama.
+
+    Args:
+        paths (dict): Rečnik ime -> koordinate projektovane putanje oblika (T, 2).
+        losses (dict): Rečnik ime -> vrednosti funkcije po iteracijama.
+        title (str): Naslov grafika.
+        output_file (str): Putanja za čuvanje slike.
+        surface (tuple): (A, B, Z) presek funkcije u ravni projekcije (None = bez kontura).
+        axis_labels (tuple): Nazivi osa projekcije.
+        f_min (float): Poznati minimum funkcije; ako je zadat, crta se f(x) - f_min.
+    """
+    fig, (path_ax, loss_ax) = plt.subplots(1, 2, figsize=(14, 6), layout='constrained')
+    if surface is not None:
+        A, B, Z = surface
+        finite = Z[np.isfinite(Z)]
+        if finite.size and finite.min() > 0:
+            levels = np.geomspace(finite.min(), finite.max(), 35)
+            contour = path_ax.contourf(A, B, Z, levels=levels, cmap='viridis', norm=LogNorm())
+        else:
+            contour = path_ax.contourf(A, B, Z, levels=35, cmap='viridis')
+        fig.colorbar(contour, ax=path_ax, label='Vrednost funkcije cilja (presek)')
+        path_ax.plot(0, 0, '*', color='white', markeredgecolor='black', markersize=12)
+
+    for name, path in paths.items():
+        path_ax.plot(path[:, 0], path[:, 1], 'o-', label=name, markersize=2, linewidth=1.2)
+        path_ax.plot(path[0, 0], path[0, 1], 'x', color='red', markersize=10)
+        loss = np.asarray(losses[name])
+        loss_ax.plot(np.arange(len(loss)), loss - f_min if f_min is not None else loss, label=name)
+
+    path_ax.set_xlabel(axis_labels[0])
+    path_ax.set_ylabel(axis_labels[1])
+    path_ax.legend()
+    path_ax.grid(True)
+    if f_min is not None:
+        loss_ax.set_yscale('log')
+        loss_ax.set_ylabel('f(x) - f_min')
+    else:
+        loss_ax.set_yscale('symlog', linthresh=1e-3)
+        loss_ax.set_ylabel('Vrednost funkcije cilja')
+    loss_ax.set_xlabel('Iteracija')
+    loss_ax.grid(True)
+    fig.suptitle(title)
+
+    plt.savefig(output_file, dpi=150)
+    print(f"Slika sačuvana u '{output_file}'")
+    plt.close(fig)
+
+
+def plot_basins(func, result, title, output_file, levels=None, minima=()):
+    """
+    Crta mapu oblasti privlačenja, broj iteracija do konvergencije i konačnu
+    vrednost funkcije, svaku preko kontura funkcije cilja.
+
+    Args:
+        func (callable): Funkcija cilja.
+        result (BasinResult): Rezultati iz `basins.run_basins`.
+        title (str): Naslov grafika.
+        output_file (str): Putanja za čuvanje slike.
+        levels (np.array): Nivoi kontura.
+        minima (list): Poznati globalni minimumi (redosled odgovara indeksima u `result.basin`).
+    """
+    if levels is None:
+        levels = DEFAULT_LEVELS
+    X, Y, Z = get_surface(func, result.bounds, 400)
+    extent = result.bounds
+
+    fig, axes = plt.subplots(1, 3, figsize=(19, 5.8), layout='constrained')
+    basin_ax, iterations_ax, loss_ax = axes
+
+    # Oblasti privlačenja: boja po minimumu, svetlosiva za ostalo, crna za divergentne
+    colors = [plt.get_cmap('tab10')(i % 10) for i in range(len(minima))]
+    cmap = ListedColormap(['black', 'lightgray'] + colors)
+    basin_image = basin_ax.imshow(result.basin - DIVERGED, extent=extent, origin='lower', aspect='auto',
+                                  cmap=cmap, vmin=-0.5, vmax=len(minima) + 1.5, interpolation='nearest', alpha=0.85)
+    ticks = [DIVERGED, OTHER] + list(range(len(minima)))
+    colorbar = fig.colorbar(basin_image, ax=basin_ax, ticks=[t - DIVERGED for t in ticks])
+    colorbar.ax.set_yticklabels(['divergira', 'ostalo'] + [f"({p[0]:.3g}, {p[1]:.3g})" for p in minima])
+    basin_ax.set_title('Oblasti privlačenja')
+
+    iterations = np.where(result.converged, result.iterations, np.nan).astype(float)
+    image = iterations_ax.imshow(iterations, extent=extent, origin='lower', aspect='auto', cmap='magma',
+                                 norm=LogNorm(vmin=1, vmax=max(result.max_iterations, 2)), interpolation='nearest')
+    fig.colorbar(image, ax=iterations_ax, label='Iteracija do konvergencije')
+    iterations_ax.set_title('Brzina konvergencije (belo = nije konvergirala)')
+
+    loss = result.final_loss
+    finite = loss[np.isfinite(loss)]
+    if finite.size and finite.min() > 0:
+        norm = LogNorm(vmin=max(finite.min(), finite.max() * 1e-12), vmax=finite.max())
+    else:
+        norm = None
+    image = loss_ax.imshow(loss, extent=extent, origin='lower', aspect='auto', cmap='viridis', norm=norm,
+                           interpolation='nearest')
+    fig.colorbar(image, ax=loss_ax, label='Konačna vrednost funkcije')
+    loss_ax.set_title('Konačna vrednost funkcije (belo = divergira)')
+
+    for ax in axes:
+        ax.contour(X, Y, Z, levels=levels, colors='white', linewidths=0.4, alpha=0.6)
+        _mark_minima(ax, minima)
+        ax.set_xlabel('Parametar 1 (x)')
+        ax.set_ylabel('Parametar 2 (y)')
+    fig.suptitle(title)
+
+    plt.savefig(output_file, dpi=150)
+    print(f"Slika sačuvana u '{output_file}'")
+    plt.close(fig)
+
+
+def render_surface_image(func, bounds, resolution=400, levels=None, log_scale=True):
+    """
+    Rasterizuje konturnu pozadinu u RGBA sliku koju mogu da dele svi paneli.
+
+    Boje odgovaraju onima koje daje `contourf` sa istim nivoima: svaka zona
+    između dva nivoa dobija boju sredine zone, a vrednosti van nivoa su providne.
+
+    Returns:
+        tuple: (RGBA slika oblika (rezolucija, rezolucija, 4), ScalarMappable za colorbar)
+    """
+    if levels is None:
+        levels = DEFAULT_LEVELS
+    _, _, Z = get_surface(func, bounds, resolution)
+
+    layers = 0.5 * (levels[:-1] + levels[1:])
+    cmap = plt.get_cmap('viridis')
+    if log_scale:
+        norm = LogNorm(vmin=layers[0], vmax=layers[-1])
+    else:
+        norm = BoundaryNorm(levels, cmap.N)
+
+    band = np.digitize(Z, levels) - 1
+    inside = (band >= 0) & (band < len(layers))
+    image = cmap(norm(layers[np.clip(band, 0, len(layers) - 1)]))
+    image[~inside] = 0.0
+
+    mappable = plt.cm.ScalarMappable(norm=norm, cmap=cmap)
+    return image, mappable
+
+
+def create_animation(func, paths, bounds, title, output_file, layout='grid', max_frames=None, fps=15,
+                     resolution=400, levels=None, log_scale=True, minima=(), steps=None):
     """
-    Kreira animaciju putanje jednog optimizatora.
+    Kreira animaciju putanja jednog ili više optimizatora.
+
+    Konturna pozadina se rasterizuje samo jednom i deli između svih panela, a u
+    svakom frejmu se svi paneli ažuriraju jednim crtanjem novih segmenata, pa
+    poređenje 10 optimizatora košta približno kao animacija jednog.
 
     Args:
         func (callable): Funkcija cilja.
-        path (np.array): Niz koordinata (istorija parametara) za jedan optimizator.
+        paths (dict): Rečnik ime optimizatora -> istorija parametara. Za paket tačaka
+                      oblika (T, N, 2) animira se oblak tačaka.
         bounds (list): Opseg za crtanje [xmin, xmax, ymin, ymax].
         title (str): Naslov grafika.
         output_file (str): Putanja za čuvanje animacije (npr. 'anim.gif' ili 'anim.mp4').
+        layout (str): 'grid' (svaki optimizator u svom panelu) ili 'overlay' (svi na istom grafiku).
+        max_frames (int): Najveći broj frejmova; istorija se ravnomerno proređuje (None = svi koraci).
+        fps (int): Broj frejmova u sekundi.
+        resolution (int): Rezolucija konturne pozadine.
+        levels, log_scale, minima: Nivoi kontura, skala boja i minimumi, kao u `plot_optimization_path`.
+        steps (dict): Ime optimizatora -> redni brojevi koraka zabeleženih tačaka (za oznaku iteracije
+                      kada je istorija proređena); None = oznaka je indeks tačke istorije.
     """
-    xmin, xmax, ymin, ymax = bounds
-    x = np.linspace(xmin, xmax, 400)
-    y = np.linspace(ymin, ymax, 400)
-    X, Y = np.meshgrid(x, y)
-    Z = func(X, Y)
+    if layout not in ('grid', 'overlay'):
+        raise ValueError(f"Nepoznat raspored '{layout}' (podržano: grid, overlay).")
 
-    fig, ax = plt.subplots(figsize=(10, 8))
-    contour = ax.contourf(X, Y, Z, levels=np.logspace(0, 5, 35), cmap='viridis', norm=LogNorm())
-    fig.colorbar(contour)
+    with get_profiler().phase('render/background', resolution=resolution):
+        image, mappable = render_surface_image(func, bounds, resolution, levels, log_scale)
+    names = list(paths)
+    if len(names) == 1:
+        colors = ['red']
+    else:
+        colors = [f'C{i % 10}' for i in range(len(names))]
+
+    if layout == 'overlay' or len(names) == 1:
+        fig, ax = plt.subplots(figsize=(10, 8))
+        axes = [ax] * len(names)
+        panels = [ax]
+        ax.set_title(title)
+    else:
+        ncols = int(np.ceil(np.sqrt(len(names))))
+        nrows = int(np.ceil(len(names) / ncols))
+        fig, grid = plt.subplots(nrows, ncols, figsize=(5 * ncols + 1, 4.5 * nrows + 0.8),
+                                 squeeze=False, layout='constrained')
+        panels = list(grid.ravel()[:len(names)])
+        for unused_ax in grid.ravel()[len(names):]:
+            unused_ax.set_visible(False)
+        axes = panels
+        for ax, name in zip(panels, names):
+            ax.set_title(name.upper())
+        fig.suptitle(title)
+
+    for ax in panels:
+        # Ista rasterizovana pozadina za sve panele umesto contourf poziva po panelu
+        ax.imshow(image, extent=bounds, origin='lower', aspect='auto', interpolation='nearest')
+        ax.set_xlabel('Parametar 1 (x)')
+        ax.set_ylabel('Parametar 2 (y)')
+        _mark_minima(ax, minima)
+    fig.colorbar(mappable, ax=panels)
 
-    ax.set_title(title)
-    ax.set_xlabel('Parametar 1 (x)')
-    ax.set_ylabel('Parametar 2 (y)')
-    
     # Elementi koji će se animirati
-    line, = ax.plot([], [], 'o-', color='red', markersize=4, linewidth=2)
-    iteration_text = ax.text(0.02, 0.95, '', transform=ax.transAxes, color='white')
-
-    def init():
-        """Inicijalizacija animacije."""
-        line.set_data([], [])
-        iteration_text.set_text('')
-        return line, iteration_text
-
-    def animate(i):
-        """Funkcija koja se poziva za svaki frejm."""
-        # Prikazuje putanju od početka do trenutne iteracije i
-        line.set_data(path[:i+1, 0], path[:i+1, 1])
-        iteration_text.set_text(f'Iteracija: {i}')
-        return line, iteration_text
-
-    # Kreiranje animacije
-    anim = FuncAnimation(fig, animate, init_func=init,
-                           frames=len(path), interval=50, blit=True)
+    tracks = []
+    for ax, name, color in zip(axes, names, colors):
+        path = paths[name]
+        is_batch = path.ndim == 3
+        if not is_batch:
+            ax.plot(path[0, 0], path[0, 1], 'x', color='red', markersize=10) # Početna tačka
+        line, = ax.plot([], [], 'o' if is_batch else 'o-', color=color, markersize=2 if is_batch else 4,
+                        linewidth=2, label=name)
+        tracks.append((line, path))
+    if layout == 'overlay' and len(names) > 1:
+        panels[0].legend(handles=[line for line, _ in tracks], loc='lower right')
+    iteration_text = panels[0].text(0.02, 0.95, '', transform=panels[0].transAxes, color='white')
 
+    # Oznaka iteracije prati najdužu istoriju, jer su po njoj određeni frejmovi
+    longest = max(names, key=lambda name: len(paths[name]))
+    frame_steps = np.asarray(steps[longest]) if steps and longest in steps else None
+    renderer = PathAnimationRenderer(fig, tracks, texts=[(iteration_text, 'Iteracija: {}')], steps=frame_steps)
     try:
         # Čuvanje animacije
-        anim.save(output_file, writer='imagemagick', fps=15)
-        print(f"Animacija sačuvana u '{output_file}'")
+        n_frames = renderer.render(output_file, fps=fps, max_frames=max_frames)
+        print(f"Animacija sačuvana u '{output_file}' ({n_frames} frejmova)")
     except Exception as e:
         print(f"Greška pri čuvanju animacije: {e}")
-        print("Da li je 'imagemagick' (za GIF) ili 'ffmpeg' (za MP4) instaliran i dostupan u PATH-u?")
+        print("Da li je 'ffmpeg' (za MP4) instaliran i dostupan u PATH-u?")
     
-    plt.close()
\ No newline at end of file
+    plt.close(fig)